@@ -344,26 +344,34 @@ class VideoRecorder:
     _run_dir: Path
     _writers: dict[str, cv2.VideoWriter]
     _fps: int
-    _queue: queue.Queue[tuple[str, np.ndarray, float] | None]
-    _thread: threading.Thread
+    _queues: dict[str, queue.Queue[tuple[np.ndarray, float] | None]]
+    _threads: dict[str, threading.Thread]
     _start_times: dict[str, float]
     _frame_counts: dict[str, int]
 
     def __init__(self, fps: int = 10):
         self._fps = fps
         self._writers = {}
-        self._queue = queue.Queue(maxsize=120)
+        # One queue + writer thread per stream (camera x raw/annotated).
+        # cv2.VideoWriter.write releases the GIL while encoding, so separate
+        # threads let the streams encode in parallel instead of every
+        # camera's frames waiting behind each other on a single writer.
+        self._queues = {}
+        self._threads = {}
+        self._streams_lock = threading.Lock()
         self._start_times = {}
         self._frame_counts = {}
         self._last_frames: dict[str, np.ndarray] = {}
+        # Recycled frame buffers per stream. writeFrame copies every frame on
+        # the vision thread; reusing buffers the writer has finished with
+        # avoids a fresh multi-MB allocation per camera per tick.
+        self._free_buffers: dict[str, list[np.ndarray]] = {}
+        self._buffers_lock = threading.Lock()
 
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self._run_dir = BLOB_DIR / timestamp
         self._run_dir.mkdir(parents=True, exist_ok=True)
 
-        self._thread = threading.Thread(target=self._writerLoop, daemon=True)
-        self._thread.start()
-
     def _getWriter(self, key: str, frame: np.ndarray) -> cv2.VideoWriter:
         if key not in self._writers:
             h, w = frame.shape[:2]
@@ -372,12 +380,30 @@ class VideoRecorder:
             self._writers[key] = cv2.VideoWriter(str(path), fourcc, self._fps, (w, h))
         return self._writers[key]
 
-    def _writerLoop(self) -> None:
+    def _streamQueue(self, key: str) -> queue.Queue[tuple[np.ndarray, float] | None]:
+        with self._streams_lock:
+            stream_queue = self._queues.get(key)
+            if stream_queue is None:
+                stream_queue = queue.Queue(maxsize=20)
+                thread = threading.Thread(
+                    target=self._writerLoop,
+                    args=(key, stream_queue),
+                    name=f"video-writer-{key}",
+                    daemon=True,
+                )
+                self._queues[key] = stream_queue
+                self._threads[key] = thread
+                thread.start()
+            return stream_queue
+
+    def _writerLoop(
+        self, key: str, stream_queue: queue.Queue[tuple[np.ndarray, float] | None]
+    ) -> None:
         while True:
-            item = self._queue.get()
+            item = stream_queue.get()
             if item is None:
                 break
-            key, frame, ts = item
+            frame, ts = item
             writer = self._getWriter(key, frame)
 
             if key not in self._start_times:
@@ -398,26 +424,62 @@ class VideoRecorder:
 
             writer.write(frame)
             self._frame_counts[key] += 1
+            previous = self._last_frames.get(key)
             self._last_frames[key] = frame
+            if previous is not None:
+                self._releaseBuffer(key, previous)
+
+    def _copyFrame(self, key: str, frame: np.ndarray) -> np.ndarray:
+        with self._buffers_lock:
+            free = self._free_buffers.get(key)
+            buffer = free.pop() if free else None
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            return frame.copy()
+        np.copyto(buffer, frame)
+        return buffer
+
+    def _releaseBuffer(self, key: str, buffer: np.ndarray) -> None:
+        with self._buffers_lock:
+            free = self._free_buffers.setdefault(key, [])
+            if len(free) < 4:
+                free.append(buffer)
+
+    def _enqueueFrame(self, key: str, frame: np.ndarray, ts: float) -> None:
+        stream_queue = self._streamQueue(key)
+        if stream_queue.full():
+            # Dropped anyway — skip the copy.
+            return
+        copy = self._copyFrame(key, frame)
+        try:
+            stream_queue.put_nowait((copy, ts))
+        except queue.Full:
+            self._releaseBuffer(key, copy)
+
+    def acceptsAnnotated(self, camera: str) -> bool:
+        """False while this camera's annotated stream queue is full.
+
+        writeFrame would drop the frame anyway, so callers can skip rendering
+        the overlays for it.
+        """
+        stream_queue = self._queues.get(f"{camera}_annotated")
+        return stream_queue is None or not stream_queue.full()
 
     def writeFrame(
         self, camera: str, raw: Optional[np.ndarray], annotated: Optional[np.ndarray]
     ) -> None:
         ts = time.time()
         if raw is not None:
-            try:
-                self._queue.put_nowait((f"{camera}_raw", raw.copy(), ts))
-            except queue.Full:
-                pass
+            self._enqueueFrame(f"{camera}_raw", raw, ts)
         if annotated is not None:
-            try:
-                self._queue.put_nowait((f"{camera}_annotated", annotated.copy(), ts))
-            except queue.Full:
-                pass
+            self._enqueueFrame(f"{camera}_annotated", annotated, ts)
 
     def close(self) -> None:
-        self._queue.put(None)
-        self._thread.join(timeout=10.0)
+        with self._streams_lock:
+            streams = list(zip(self._queues.values(), self._threads.values()))
+        for stream_queue, _ in streams:
+            stream_queue.put(None)
+        for _, thread in streams:
+            thread.join(timeout=10.0)
         for writer in self._writers.values():
             writer.release()
         self._writers.clear()
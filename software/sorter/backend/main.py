@@ -309,6 +309,13 @@ def runBroadcaster(gc: GlobalConfig) -> None:
             gc.runtime_stats.observePerfMs("socket.batch_size", float(len(pending_commands)))
 
         for command in pending_commands:
+            # Nobody on the socket: keep every side effect (piece stats,
+            # crop persistence, replay snapshots) but skip serializing frames
+            # and the blocking cross-thread send. A client that connects
+            # later replays the snapshots and picks up the next events.
+            has_clients = bool(shared_state.active_connections)
+            if command.tag == "frame" and not has_clients:
+                continue
             payload = command.model_dump()
             if command.tag == "known_object":
                 obj_payload = command.data.model_dump()
@@ -333,6 +340,8 @@ def runBroadcaster(gc: GlobalConfig) -> None:
                     piece_image_store.enqueueKnownObjectLinkImages(obj_payload)
                 except Exception:
                     pass
+                if not has_clients:
+                    continue
                 event_data = payload.get("data")
                 if isinstance(event_data, dict):
                     payload["data"] = slimKnownObjectForSocket(event_data)
@@ -346,6 +355,9 @@ def runBroadcaster(gc: GlobalConfig) -> None:
                         "socket.known_object_send_age_ms",
                         max(0.0, (time.time() - float(updated_at)) * 1000.0),
                     )
+            elif not has_clients:
+                shared_state.recordEventSnapshot(payload)
+                continue
             if (
                 command.tag != "frame"
                 and command.tag != "heartbeat"
@@ -392,6 +404,8 @@ def runBroadcaster(gc: GlobalConfig) -> None:
                     f"status={getattr(full_payload.get('classification_status'), 'value', full_payload.get('classification_status'))}) "
                     "— no progress to distributed before timeout"
                 )
+                if not shared_state.active_connections:
+                    continue
                 future = asyncio.run_coroutine_threadsafe(
                     broadcastEvent({"tag": "known_object", "data": slim}),
                     shared_state.server_loop,
@@ -12,6 +12,7 @@ the legacy ``getBboxSections`` to confirm equivalence at the bbox level.
 
 from __future__ import annotations
 
+import math
 from typing import Iterable, Tuple
 
 import numpy as np
@@ -167,7 +168,7 @@ def bboxSections(bbox: Bbox, channel: ChannelDef) -> frozenset[int]:
     r1 = channel.radius1_angle_image
     sections: set[int] = set()
     for px, py in points:
-        angle = float(np.degrees(np.arctan2(py - cy0, px - cx0)))
+        angle = math.degrees(math.atan2(py - cy0, px - cx0))
         relative = (angle - r1) % 360.0
         sections.add(int(relative / SECTION_DEG) % SECTION_COUNT)
     return frozenset(sections)
@@ -328,7 +329,7 @@ def _leadingExitApproach(
         if not bboxInsideChannelMask(bbox, channel):
             continue
         mx, my = bboxCenter(bbox)
-        angle = float(np.degrees(np.arctan2(my - cy0, mx - cx0)))
+        angle = math.degrees(math.atan2(my - cy0, mx - cx0))
         relative = (angle - r1) % 360.0
         sec = int(relative / SECTION_DEG) % SECTION_COUNT
         # Degrees the COM sits BEHIND the entry edge along the travel direction,
@@ -523,7 +524,7 @@ def orderedPieceObservations(
         if not bboxInsideChannelMask(bbox, channel):
             continue
         mx, my = bboxCenter(bbox)
-        angle = float(np.degrees(np.arctan2(my - cy0, mx - cx0)))
+        angle = math.degrees(math.atan2(my - cy0, mx - cx0))
         relative = (angle - r1) % 360.0
         sec = int(relative / SECTION_DEG) % SECTION_COUNT
         if reverse:
@@ -20,7 +20,7 @@ from dataclasses import dataclass
 from .arcs import Bbox
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Detection:
     bbox: Bbox
     in_primary: bool
@@ -157,7 +157,8 @@ class InferenceWorker:
         # junk and report n_pieces=0. Computed once here (mask is immutable); the
         # hot path does a zero-copy slice, and the model resizes a smaller region
         # so inference preprocessing is cheaper, not more expensive.
-        self._crop_rect = self._compute_crop_rect(channel_def.mask)
+        mask_rect = self._compute_crop_rect(channel_def.mask)
+        self._crop_rect = mask_rect
         # When this channel has secondary (foreign) zones defined, infer on the
         # FULL frame instead of the primary-polygon crop, so pieces sitting in
         # those zones (outside the primary crop) are actually detected and we can
@@ -188,10 +189,12 @@ class InferenceWorker:
         # Channel mask area + bounding extent in pixels, precomputed once (mask
         # is immutable). Used by the oversize-bbox filters and the size readout.
         self._mask_area_px: float = float(int(np.count_nonzero(channel_def.mask)))
-        _ys, _xs = np.nonzero(channel_def.mask)
-        if _ys.size:
-            self._mask_w_extent: float = float(int(_xs.max() - _xs.min() + 1))
-            self._mask_h_extent: float = float(int(_ys.max() - _ys.min() + 1))
+        if mask_rect is not None:
+            # Same extents the crop rect measured off the mask (taken before
+            # secondary zones may have dropped the crop itself).
+            _x1, _y1, _x2, _y2 = mask_rect
+            self._mask_w_extent: float = float(_x2 - _x1)
+            self._mask_h_extent: float = float(_y2 - _y1)
         else:
             self._mask_w_extent = 0.0
             self._mask_h_extent = 0.0
@@ -346,10 +349,14 @@ class InferenceWorker:
         """
         if mask is None:
             return None
-        ys, xs = np.nonzero(mask)
-        if xs.size == 0 or ys.size == 0:
+        # Project the mask onto each axis instead of np.nonzero: two streamed
+        # boolean reductions rather than materializing an int64 index pair
+        # for every on-channel pixel of a full-frame mask.
+        rows = np.flatnonzero(np.any(mask, axis=1))
+        if rows.size == 0:
             return None
-        return (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+        cols = np.flatnonzero(np.any(mask, axis=0))
+        return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
 
     def _check_source_id(self, frame: PerceptionFrame) -> bool:
         if (
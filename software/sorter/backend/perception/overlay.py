@@ -9,6 +9,7 @@ no last-detection-on-latest-frame drift.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import cv2
@@ -45,6 +46,22 @@ _ZONE_OVERLAY_CACHE: dict[tuple, tuple[np.ndarray, np.ndarray, np.ndarray, np.nd
 # size once is far cheaper than compositing the overlay on a 4K frame per frame.
 _SCALED_ZONE_CACHE: dict[tuple, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
 _SCALED_MASK_CACHE: dict[tuple, np.ndarray] = {}
+# Composite template per (zone key, target size): the bounding rect of the
+# painted zone pixels plus the overlay colours and a uint8 "painted" mask
+# cropped to it — or None when the channel has no drop/exit/precise section at
+# all, so drawChannelZones skips the blend outright.
+_ZONE_TEMPLATE_CACHE: dict[
+    tuple, tuple[tuple[int, int, int, int], np.ndarray, np.ndarray] | None
+] = {}
+# External contours per (mask key, target size), stored with the mask they
+# were traced from. The outline masks are static per channel config, so the
+# per-frame findContours is a lookup; a hit requires the very same mask object.
+_MASK_CONTOURS_CACHE: dict[tuple, tuple[np.ndarray, tuple]] = {}
+# Masks at least this wide (the full-res debug render) are traced at half
+# resolution and the points doubled. The outlines are display-only, so being
+# off by at most one source pixel is invisible, and the one-off trace after a
+# zone reload walks a quarter of the mask.
+CONTOUR_HALF_RES_MIN_WIDTH = 1600
 
 
 def _zoneKey(channel: Any) -> tuple:
@@ -92,6 +109,72 @@ def _scaledMask(mask: np.ndarray, target_h: int, target_w: int, cache_key: tuple
     return res
 
 
+def _maskContours(mask: np.ndarray, cache_key: tuple) -> tuple:
+    key = (cache_key, mask.shape[0], mask.shape[1])
+    cached = _MASK_CONTOURS_CACHE.get(key)
+    if cached is not None and cached[0] is mask:
+        return cached[1]
+    if mask.shape[1] >= CONTOUR_HALF_RES_MIN_WIDTH:
+        # INTER_NEAREST at 0.5 keeps every other source pixel, so small-mask
+        # pixel (x, y) is source pixel (2x, 2y) and doubling maps it back.
+        small = cv2.resize(mask, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_NEAREST)
+        contours, _ = cv2.findContours(small, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        contours = tuple(c * 2 for c in contours)
+    else:
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        contours = tuple(contours)
+    _MASK_CONTOURS_CACHE[key] = (mask, contours)
+    return contours
+
+
+@lru_cache(maxsize=256)
+def _labelSprite(label: str, color: tuple[int, int, int], text_thick: int) -> np.ndarray:
+    """Pre-rendered dark pad + label text for the track-id tags.
+
+    Matches the old per-frame ``rectangle`` + ``putText`` pair pixel for
+    pixel: the glyphs never reach past the pad, so the pad rectangle is the
+    whole footprint and blitting it replaces two rasterizations. Keyed on the
+    label, so a recurring track id is rendered once.
+    """
+    (tw, th), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.4, text_thick)
+    sprite = np.zeros((th + 5, tw + 3, 3), dtype=np.uint8)
+    cv2.putText(
+        sprite, label, (1, th + 2), cv2.FONT_HERSHEY_SIMPLEX, 0.4,
+        color, text_thick, cv2.LINE_AA,
+    )
+    sprite.setflags(write=False)
+    return sprite
+
+
+def _blitLabel(img: np.ndarray, sprite: np.ndarray, x1: int, top: int) -> None:
+    sh, sw = sprite.shape[:2]
+    h, w = img.shape[:2]
+    dx1, dy1 = max(0, x1), max(0, top)
+    dx2, dy2 = min(w, x1 + sw), min(h, top + sh)
+    if dx2 <= dx1 or dy2 <= dy1:
+        return
+    img[dy1:dy2, dx1:dx2] = sprite[dy1 - top:dy2 - top, dx1 - x1:dx2 - x1]
+
+
+def _zoneTemplate(
+    overlay_img: np.ndarray, target_h: int, target_w: int, cache_key: tuple
+) -> tuple[tuple[int, int, int, int], np.ndarray, np.ndarray] | None:
+    key = (cache_key, target_h, target_w)
+    if key in _ZONE_TEMPLATE_CACHE:
+        return _ZONE_TEMPLATE_CACHE[key]
+    zone_pixels = np.any(overlay_img != 0, axis=2).view(np.uint8)
+    x, y, w, h = cv2.boundingRect(zone_pixels)
+    res = None
+    if w > 0:
+        res = (
+            (x, y, w, h),
+            np.ascontiguousarray(overlay_img[y : y + h, x : x + w]),
+            np.ascontiguousarray(zone_pixels[y : y + h, x : x + w]),
+        )
+    _ZONE_TEMPLATE_CACHE[key] = res
+    return res
+
+
 def _scaleBbox(b: Any, scale: float) -> tuple[float, float, float, float]:
     if scale == 1.0:
         return b
@@ -166,18 +249,21 @@ def drawChannelZones(img: np.ndarray, channel: Any, thick: int) -> None:
     zone_overlay = _scaledZoneArrays(channel, th, tw)
     if zone_overlay is not None:
         # Zones are shown as a low-opacity colour fill only — no outlines.
-        overlay_img = zone_overlay[0]
-        zone_pixels = np.any(overlay_img != 0, axis=2)
-        if zone_pixels.any():
-            blended = img.copy()
-            blended[zone_pixels] = overlay_img[zone_pixels]
-            img[:] = cv2.addWeighted(blended, 0.15, img, 0.85, 0)
+        template = _zoneTemplate(zone_overlay[0], th, tw, _zoneKey(channel))
+        if template is not None:
+            # Off-zone pixels blend with themselves and come out unchanged, so
+            # only the zones' bounding rect is blended against the cached
+            # colour template and copied back through the painted mask —
+            # no full-frame copy, boolean gather/scatter or full-frame blend.
+            (x, y, w, h), zone_colors, zone_mask = template
+            roi = img[y : y + h, x : x + w]
+            blended = cv2.addWeighted(zone_colors, 0.15, roi, 0.85, 0)
+            cv2.copyTo(blended, zone_mask, roi)
     if channel is not None:
         # Thin outermost channel outline.
-        outline = _scaledMask(channel.mask, th, tw, (_zoneKey(channel), "outline"))
-        contours, _ = cv2.findContours(
-            outline, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
+        outline_key = (_zoneKey(channel), "outline")
+        outline = _scaledMask(channel.mask, th, tw, outline_key)
+        contours = _maskContours(outline, outline_key)
         cv2.drawContours(img, contours, -1, CHANNEL_OUTLINE_COLOR, thick, cv2.LINE_AA)
 
 
@@ -198,8 +284,6 @@ def drawTrackIds(
     boxes. A dark pad behind the text keeps it legible over any background."""
     if not detections:
         return
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 0.4
     text_thick = max(1, thick)
     for d in detections:
         tid = getattr(d, "sv_bt_track_id", None)
@@ -207,14 +291,10 @@ def drawTrackIds(
             continue
         b = _scaleBbox(d.bbox, scale)
         x1, y1 = int(b[0]), int(b[1])
-        label = f"#{int(tid)}"
-        (tw, th), _ = cv2.getTextSize(label, font, font_scale, text_thick)
+        sprite = _labelSprite(f"#{int(tid)}", ON_CHANNEL_COLOR, text_thick)
+        th = sprite.shape[0] - 5
         ty = max(th + 2, y1 - 2)
-        cv2.rectangle(img, (x1, ty - th - 2), (x1 + tw + 2, ty + 2), (0, 0, 0), -1)
-        cv2.putText(
-            img, label, (x1 + 1, ty), font, font_scale,
-            ON_CHANNEL_COLOR, text_thick, cv2.LINE_AA,
-        )
+        _blitLabel(img, sprite, x1, ty - th - 2)
 
 
 def drawMergedBoxes(
@@ -225,8 +305,6 @@ def drawMergedBoxes(
     box (the green per-detection id sits above). Shows model-output vs. acted-on."""
     if not bboxes:
         return
-    font = cv2.FONT_HERSHEY_SIMPLEX
-    font_scale = 0.4
     text_thick = max(1, thick)
     line_thick = max(2, thick + 1)
     ids = track_ids or []
@@ -236,12 +314,10 @@ def drawMergedBoxes(
         cv2.rectangle(img, (x1, y1), (x2, y2), MERGED_COLOR, line_thick, cv2.LINE_AA)
         tid = ids[i] if i < len(ids) else None
         label = f"merged #{int(tid)}" if tid is not None else "merged"
-        (tw, th), _ = cv2.getTextSize(label, font, font_scale, text_thick)
+        sprite = _labelSprite(label, MERGED_COLOR, text_thick)
+        th = sprite.shape[0] - 5
         ty = min(img.shape[0] - 2, y2 + th + 3)
-        cv2.rectangle(img, (x1, ty - th - 2), (x1 + tw + 2, ty + 2), (0, 0, 0), -1)
-        cv2.putText(
-            img, label, (x1 + 1, ty), font, font_scale, MERGED_COLOR, text_thick, cv2.LINE_AA
-        )
+        _blitLabel(img, sprite, x1, ty - th - 2)
 
 
 def drawSecondaryZones(img: np.ndarray, channel: Any, thick: int) -> None:
@@ -258,10 +334,9 @@ def drawSecondaryZones(img: np.ndarray, channel: Any, thick: int) -> None:
         mask = np.asarray(zone.mask)
         if mask.ndim != 2 or mask.size == 0:
             continue
-        mask = _scaledMask(mask, th, tw, (int(channel.channel_id), "secondary", str(zone.id)))
-        contours, _ = cv2.findContours(
-            mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
+        zone_key = (int(channel.channel_id), "secondary", str(zone.id))
+        mask = _scaledMask(mask, th, tw, zone_key)
+        contours = _maskContours(mask, zone_key)
         if not contours:
             continue
         # Outline only on the video stream — no text label (the zone identity is
@@ -38,6 +38,8 @@ class IntervalStat:
 
 
 class _TimerContext:
+    __slots__ = ("profiler", "name", "start")
+
     def __init__(self, profiler: "Profiler", name: str):
         self.profiler = profiler
         self.name = name
@@ -54,6 +56,26 @@ class _TimerContext:
         self.profiler.observeDuration(self.name, elapsed_ms)
 
 
+class _NullTimer:
+    """Shared no-op ``timer()`` context for a disabled profiler.
+
+    ``prof.timer(...)`` wraps the per-frame vision getters and runs many times
+    per tick; with profiling off it skips the context allocation and both
+    ``perf_counter`` reads instead of timing work that gets thrown away.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
 class Profiler:
     def __init__(
         self,
@@ -75,7 +97,9 @@ class Profiler:
         self._state_name: dict[str, str] = {}
         self._active_timers: dict[tuple[str, str], float] = {}
 
-    def timer(self, name: str) -> _TimerContext:
+    def timer(self, name: str) -> "_TimerContext | _NullTimer":
+        if not self.enabled:
+            return _NULL_TIMER
         return _TimerContext(self, name)
 
     def startTimer(self, name: str, key: str = "") -> None:
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from itertools import product
 from typing import Any
@@ -31,6 +34,23 @@ for cols, rows in [
     _PATTERN_CANDIDATES.append((rows, cols))
 
 
+# Worker pool for the per-frame detection strategies. Calibration analyses a
+# frame at a time in a loop, so the pool is created on first use and kept
+# rather than spinning four threads up and down for every frame.
+_STRATEGY_POOL: ThreadPoolExecutor | None = None
+_STRATEGY_POOL_LOCK = threading.Lock()
+
+
+def _strategy_pool() -> ThreadPoolExecutor:
+    global _STRATEGY_POOL
+    with _STRATEGY_POOL_LOCK:
+        if _STRATEGY_POOL is None:
+            _STRATEGY_POOL = ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="plate-calibration"
+            )
+        return _STRATEGY_POOL
+
+
 @dataclass(frozen=True)
 class CellSample:
     mean_bgr: tuple[float, float, float]
@@ -352,8 +372,6 @@ def analyze_color_plate_target(frame: np.ndarray) -> CalibrationAnalysis | None:
     if frame is None or frame.size == 0:
         return None
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     def _strategy_hsv() -> CalibrationAnalysis | None:
         return _analyze_fixed_color_target(frame)
 
@@ -372,15 +390,15 @@ def analyze_color_plate_target(frame: np.ndarray) -> CalibrationAnalysis | None:
     strategies = [_strategy_hsv, _strategy_adaptive, _strategy_clahe, _strategy_gamma, _strategy_denoised]
     candidates: list[CalibrationAnalysis] = []
 
-    with ThreadPoolExecutor(max_workers=min(len(strategies), 4)) as pool:
-        futures = [pool.submit(fn) for fn in strategies]
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result is not None:
-                    candidates.append(result)
-            except Exception:
-                pass
+    pool = _strategy_pool()
+    futures = [pool.submit(fn) for fn in strategies]
+    for future in as_completed(futures):
+        try:
+            result = future.result()
+            if result is not None:
+                candidates.append(result)
+        except Exception:
+            pass
 
     if not candidates:
         return None
@@ -520,8 +538,12 @@ def _try_adaptive_grid(
     # Use DBSCAN-style clustering: find rows of aligned centers.
     best_result: CalibrationAnalysis | None = None
 
-    # Sort centers and try to build grid from each potential top-left
-    for anchor_idx in range(min(len(centers), 30)):
+    # Sort centers and try to build grid from each potential top-left.
+    # _match_grid walks right/down from the anchor, so only top-left-ish
+    # centers can anchor a full grid; order candidates by x + y so the
+    # 30-anchor budget is spent on those instead of on contour order.
+    anchor_order = np.argsort(centers[:, 0] + centers[:, 1], kind="stable")[:30]
+    for anchor_idx in anchor_order:
         anchor = centers[anchor_idx]
         # Find centers that form a grid relative to this anchor
         relative = centers - anchor
@@ -562,12 +584,15 @@ def _match_grid(
     Returns a (rows, cols, 2) array of matched centers, or None.
     """
     tolerance = tile_pitch * 0.45
+    # Every distance test below only compares against a threshold or picks
+    # the nearest point, so work on squared distances and skip the sqrt.
+    tolerance_sq = tolerance * tolerance
 
     # Build expected positions relative to (0,0) top-left
     # The grid vectors may be rotated, so we estimate them from neighbors
     # Find the two dominant direction vectors from the relative positions
-    distances = np.linalg.norm(relative, axis=1)
-    near_mask = (distances > tile_pitch * 0.4) & (distances < tile_pitch * 1.6)
+    distances_sq = np.einsum("ij,ij->i", relative, relative)
+    near_mask = (distances_sq > (tile_pitch * 0.4) ** 2) & (distances_sq < (tile_pitch * 1.6) ** 2)
     if np.count_nonzero(near_mask) < 2:
         return None
     neighbors = relative[near_mask]
@@ -575,9 +600,12 @@ def _match_grid(
     # Cluster neighbor directions to find the two grid axes
     angles = np.arctan2(neighbors[:, 1], neighbors[:, 0])
     # Quantize angles to find dominant directions
+    # ~30-degree bins. Quantize the whole array in one pass (float64, with
+    # rint's round-half-even matching the builtin round) so the grouping loop
+    # below only touches plain ints instead of boxing numpy scalars per angle.
+    bin_keys = np.rint(angles.astype(np.float64) * 6 / np.pi).astype(np.int64).tolist()
     angle_bins: dict[int, list[int]] = {}
-    for i, angle in enumerate(angles):
-        key = int(round(float(angle) * 6 / np.pi))  # ~30-degree bins
+    for i, key in enumerate(bin_keys):
         angle_bins.setdefault(key, []).append(i)
 
     # Find two largest bins that are roughly perpendicular
@@ -593,7 +621,11 @@ def _match_grid(
         candidate = np.mean(neighbors[indices], axis=0)
         # Check roughly perpendicular (dot product near 0)
         dot = abs(float(np.dot(vec1, candidate))) / (
-            max(1e-6, float(np.linalg.norm(vec1)) * float(np.linalg.norm(candidate)))
+            max(
+                1e-6,
+                math.hypot(float(vec1[0]), float(vec1[1]))
+                * math.hypot(float(candidate[0]), float(candidate[1])),
+            )
         )
         if dot < 0.55:
             vec2 = candidate
@@ -614,30 +646,28 @@ def _match_grid(
     # Recover the actual reference point used to compute `relative`.
     # One entry should be ~[0, 0] for the chosen anchor; using centers[0]
     # here breaks matching whenever the loop is evaluating any other anchor.
-    anchor_idx = int(np.argmin(np.linalg.norm(relative, axis=1)))
+    anchor_idx = int(np.argmin(distances_sq))
     anchor = centers[anchor_idx]
-    grid = np.full((rows, cols, 2), np.nan, dtype=np.float32)
-    matched = 0
-    for r in range(rows):
-        for c in range(cols):
-            expected = anchor + vec1 * c + vec2 * r
-            dists = np.linalg.norm(centers - expected, axis=1)
-            best_idx = int(np.argmin(dists))
-            if float(dists[best_idx]) < tolerance:
-                grid[r, c] = centers[best_idx]
-                matched += 1
+    # Expected position of every cell at once: (rows, cols, 2). Each cell is
+    # matched to its nearest center independently, so the whole grid is one
+    # (cells x centers) squared-distance table instead of a per-cell loop.
+    row_idx, col_idx = np.mgrid[0:rows, 0:cols].astype(vec1.dtype)
+    expected = anchor + col_idx[..., None] * vec1 + row_idx[..., None] * vec2
+    offsets = centers[None, None, :, :] - expected[:, :, None, :]
+    dists_sq = np.einsum("rcnk,rcnk->rcn", offsets, offsets)
+    best_idx = np.argmin(dists_sq, axis=2)
+    best_dist_sq = np.take_along_axis(dists_sq, best_idx[..., None], axis=2)[..., 0]
+    hit = best_dist_sq < tolerance_sq
+    matched = int(np.count_nonzero(hit))
 
     # Require at least 60% of grid cells matched
     required = max(12, int(rows * cols * 0.6))
     if matched < required:
         return None
 
-    # Fill missing cells by interpolation
-    for r in range(rows):
-        for c in range(cols):
-            if np.isnan(grid[r, c, 0]):
-                grid[r, c] = anchor + vec1 * c + vec2 * r
-
+    # Missing cells keep their expected (interpolated) position
+    grid = expected.astype(np.float32)
+    grid[hit] = centers[best_idx[hit]]
     return grid
 
 
@@ -902,8 +932,8 @@ def _analyze_fixed_color_candidate(
 ) -> CalibrationAnalysis | None:
     board_width, board_height = _target_board_dimensions(rotation)
     origin = _apply_affine(affine, np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]], dtype=np.float32))
-    x_scale = float(np.linalg.norm(origin[1] - origin[0]))
-    y_scale = float(np.linalg.norm(origin[2] - origin[0]))
+    x_scale = math.hypot(float(origin[1][0] - origin[0][0]), float(origin[1][1] - origin[0][1]))
+    y_scale = math.hypot(float(origin[2][0] - origin[0][0]), float(origin[2][1] - origin[0][1]))
     max_scale = max(260.0, max(frame.shape[1], frame.shape[0]) * 0.4)
     if x_scale < 7.0 or y_scale < 7.0 or x_scale > max_scale or y_scale > max_scale:
         return None
@@ -1177,6 +1207,8 @@ def _detect_plate_quad(frame: np.ndarray) -> np.ndarray | None:
 
     contours, _ = cv2.findContours(bright_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     frame_area = float(frame.shape[0] * frame.shape[1])
+    # Candidate-independent: threshold the whole frame once, not per contour.
+    color_mask = cv2.inRange(hsv, np.array([15, 55, 20]), np.array([170, 255, 255]))
     best_quad: np.ndarray | None = None
     best_score = -1.0
 
@@ -1193,20 +1225,43 @@ def _detect_plate_quad(frame: np.ndarray) -> np.ndarray | None:
         if aspect < 1.1 or aspect > 2.3:
             continue
 
-        quad = cv2.boxPoints(rect).astype(np.float32)
-        quad_area = float(cv2.contourArea(quad))
+        # The min-area rectangle's polygon area is exactly width * height —
+        # no need to walk its corners through another shoelace pass — so the
+        # fill and score rejections all run off the rect's size, and the
+        # corner array is only built for candidates that survive them.
+        quad_area = float(width * height)
         if quad_area <= 1:
             continue
         fill_ratio = area / quad_area
         if fill_ratio < 0.62:
             continue
 
-        mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-        cv2.fillConvexPoly(mask, np.round(_shrink_quad(quad, factor=0.92)).astype(np.int32), 255)
-        bright_mean = float(cv2.mean(value, mask=mask)[0])
-        color_mask = cv2.inRange(hsv, np.array([15, 55, 20]), np.array([170, 255, 255]))
-        color_ratio = float(np.mean(color_mask[mask == 255] > 0)) if np.any(mask == 255) else 0.0
-        score = quad_area * (0.6 + fill_ratio) + bright_mean * 200.0 + color_ratio * 100000.0
+        # Brightness and color terms are capped (mean <= 255, ratio <= 1), so
+        # a candidate whose geometric term can't beat the best score even at
+        # those caps is rejected before any per-pixel work.
+        geometric_score = quad_area * (0.6 + fill_ratio)
+        if geometric_score + 255.0 * 200.0 + 100000.0 <= best_score:
+            continue
+
+        quad = cv2.boxPoints(rect).astype(np.float32)
+
+        # Rasterize the shrunk quad into its own bounding box rather than a
+        # full-frame mask; the covered pixels (and so both means) are the same.
+        shrunk = np.round(_shrink_quad(quad, factor=0.92)).astype(np.int32)
+        bx, by, bw, bh = cv2.boundingRect(shrunk)
+        x0, y0 = max(0, bx), max(0, by)
+        x1 = min(frame.shape[1], bx + bw)
+        y1 = min(frame.shape[0], by + bh)
+        bright_mean = 0.0
+        color_ratio = 0.0
+        if x1 > x0 and y1 > y0:
+            mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+            cv2.fillConvexPoly(mask, shrunk - np.array([x0, y0], dtype=np.int32), 255)
+            bright_mean = float(cv2.mean(value[y0:y1, x0:x1], mask=mask)[0])
+            inside = mask == 255
+            if inside.any():
+                color_ratio = float(np.mean(color_mask[y0:y1, x0:x1][inside] > 0))
+        score = geometric_score + bright_mean * 200.0 + color_ratio * 100000.0
         if score > best_score:
             best_score = score
             best_quad = quad
@@ -1304,23 +1359,20 @@ def _sample_cells(
     pattern_size: tuple[int, int],
 ) -> list[CellSample]:
     cols, rows = pattern_size
-    grid = corners.reshape(rows, cols, 2)
+    grid = corners.reshape(rows, cols, 2).astype(np.float32, copy=False)
     samples: list[CellSample] = []
 
-    for row in range(rows - 1):
-        for col in range(cols - 1):
-            quad = np.array(
-                [
-                    grid[row, col],
-                    grid[row, col + 1],
-                    grid[row + 1, col + 1],
-                    grid[row + 1, col],
-                ],
-                dtype=np.float32,
-            )
-            sample = _sample_quad(frame, _shrink_quad(quad, factor=0.58))
-            if sample is not None:
-                samples.append(sample)
+    # Every cell quad (TL, TR, BR, BL) and its shrunk copy in one batch,
+    # instead of an np.array build plus a _shrink_quad round-trip per cell.
+    quads = np.stack(
+        (grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]), axis=2
+    )
+    centers = np.mean(quads, axis=2, keepdims=True)
+    shrunk_quads = centers + (quads - centers) * 0.58
+    for quad in shrunk_quads.reshape(-1, 4, 2):
+        sample = _sample_quad(frame, quad)
+        if sample is not None:
+            samples.append(sample)
 
     return samples
 
@@ -1331,10 +1383,13 @@ def _shrink_quad(quad: np.ndarray, *, factor: float) -> np.ndarray:
 
 
 def _sample_quad(frame: np.ndarray, quad: np.ndarray) -> CellSample | None:
-    x0 = max(0, int(np.floor(np.min(quad[:, 0]))))
-    y0 = max(0, int(np.floor(np.min(quad[:, 1]))))
-    x1 = min(frame.shape[1], int(np.ceil(np.max(quad[:, 0]))))
-    y1 = min(frame.shape[0], int(np.ceil(np.max(quad[:, 1]))))
+    # Both axes per reduction: two dispatches instead of eight scalar ones.
+    lo_x, lo_y = np.floor(quad.min(axis=0)).tolist()
+    hi_x, hi_y = np.ceil(quad.max(axis=0)).tolist()
+    x0 = max(0, int(lo_x))
+    y0 = max(0, int(lo_y))
+    x1 = min(frame.shape[1], int(hi_x))
+    y1 = min(frame.shape[0], int(hi_y))
     if x1 - x0 < 3 or y1 - y0 < 3:
         return None
 
@@ -1425,13 +1480,20 @@ def _color_separation(cells: list[CellSample]) -> float:
         return 0.0
     top_cells = sorted(cells, key=lambda cell: cell.saturation, reverse=True)[:6]
     labs = np.array([cell.mean_lab for cell in top_cells], dtype=np.float32)
-    distances: list[float] = []
-    for i in range(len(labs)):
-        for j in range(i + 1, len(labs)):
-            distances.append(float(np.linalg.norm(labs[i] - labs[j])))
-    if not distances:
+    return _mean_pairwise_distance(labs)
+
+
+def _mean_pairwise_distance(points: np.ndarray) -> float:
+    """Mean Euclidean distance over all unordered pairs of rows in ``points``.
+
+    One broadcast difference over the upper-triangle pair indices instead of
+    a nested Python loop with one ``np.linalg.norm`` call per pair.
+    """
+    if len(points) < 2:
         return 0.0
-    return float(np.mean(distances))
+    first, second = np.triu_indices(len(points), k=1)
+    diffs = points[first] - points[second]
+    return float(np.mean(np.sqrt(np.einsum("ij,ij->i", diffs, diffs)), dtype=np.float64))
 
 
 def _order_quad(quad: np.ndarray | None) -> np.ndarray | None:
@@ -1511,11 +1573,7 @@ def _analyze_plate_quad(frame: np.ndarray, quad: np.ndarray) -> CalibrationAnaly
             strong_centers = centers[counts >= max(20, len(sample) * 0.06)]
             color_count = int(len(strong_centers))
             if len(strong_centers) >= 2:
-                distances: list[float] = []
-                for i in range(len(strong_centers)):
-                    for j in range(i + 1, len(strong_centers)):
-                        distances.append(float(np.linalg.norm(strong_centers[i] - strong_centers[j])))
-                color_separation = float(np.mean(distances)) if distances else 0.0
+                color_separation = _mean_pairwise_distance(strong_centers)
 
     neutral_contrast = max(0.0, white_luma - black_luma)
     score = _score_analysis(
@@ -10,6 +10,7 @@ import base64
 import asyncio
 import json
 import logging
+import math
 import os
 import platform
 import re
@@ -82,6 +83,12 @@ _DASHBOARD_CROP_PADDING_FACTOR = 0.14
 _DASHBOARD_CROP_MIN_PADDING_PX = 48.0
 _DASHBOARD_MASK_BACKGROUND_BGR = (230, 230, 230)
 _DASHBOARD_QUAD_PADDING_FACTOR = 0.1
+# Outward (u, v) sign per ordered quad corner: TL, TR, BR, BL.
+_DASHBOARD_QUAD_EXPAND_SIGNS = np.array(
+    [[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]],
+    dtype=np.float32,
+)
+_DASHBOARD_QUAD_NEXT = np.array([1, 2, 3, 0])
 CALIBRATION_METHOD_TARGET_PLATE = "target_plate"
 CALIBRATION_METHOD_LLM_GUIDED = "llm_guided"
 CALIBRATION_METHOD_EXPOSURE_HISTOGRAM = "exposure_histogram"
@@ -3419,12 +3426,22 @@ def camera_stream(index: int):
 
     if shared_device is not None:
         def generate_shared():
+            # The 10 Hz poll regularly lands on the same frame again (slow or
+            # stalled camera); re-serve its thumbnail rather than resizing and
+            # encoding identical pixels. Keyed on the raw array's identity
+            # (held, so it can't be recycled) plus the capture timestamp.
+            last_raw: np.ndarray | None = None
+            last_ts: float | None = None
+            chunk = b""
             while True:
                 frame_obj = shared_device.latest_frame
                 if frame_obj is None or frame_obj.raw is None:
                     time.sleep(0.05)
                     continue
-                chunk = _encode_thumb(frame_obj.raw)
+                if frame_obj.raw is not last_raw or frame_obj.timestamp != last_ts:
+                    chunk = _encode_thumb(frame_obj.raw)
+                    last_raw = frame_obj.raw
+                    last_ts = frame_obj.timestamp
                 if chunk:
                     yield chunk
                 time.sleep(0.1)
@@ -3663,8 +3680,8 @@ def _dashboard_expand_quad(quad: np.ndarray) -> np.ndarray:
 
     avg_width_vec = (width_top_vec + width_bottom_vec) / 2.0
     avg_height_vec = (height_right_vec + height_left_vec) / 2.0
-    avg_width_len = float(np.linalg.norm(avg_width_vec))
-    avg_height_len = float(np.linalg.norm(avg_height_vec))
+    avg_width_len = math.hypot(float(avg_width_vec[0]), float(avg_width_vec[1]))
+    avg_height_len = math.hypot(float(avg_height_vec[0]), float(avg_height_vec[1]))
 
     if avg_width_len <= 1e-6 or avg_height_len <= 1e-6:
         return quad.astype(np.float32)
@@ -3677,34 +3694,53 @@ def _dashboard_expand_quad(quad: np.ndarray) -> np.ndarray:
     u = (avg_width_vec / avg_width_len).astype(np.float32)
     v = (avg_height_vec / avg_height_len).astype(np.float32)
 
-    # Each corner moves `padding` pixels outward along both local axes.
-    signs = np.array(
-        [
-            [-1.0, -1.0],  # top-left
-            [+1.0, -1.0],  # top-right
-            [+1.0, +1.0],  # bottom-right
-            [-1.0, +1.0],  # bottom-left
-        ],
-        dtype=np.float32,
-    )
-
-    expanded = quad.astype(np.float32).copy()
-    for index in range(4):
-        s_u, s_v = signs[index]
-        expanded[index] = expanded[index] + (s_u * padding) * u + (s_v * padding) * v
-    return expanded
+    # Each corner moves `padding` pixels outward along both local axes; the
+    # (4, 2) sign table maps onto the stacked [u, v] basis in one product.
+    offsets = (_DASHBOARD_QUAD_EXPAND_SIGNS * np.float32(padding)) @ np.stack((u, v))
+    return quad.astype(np.float32) + offsets
 
 
 def _dashboard_quad_size(quad: np.ndarray) -> tuple[int, int]:
-    width_top = float(np.linalg.norm(quad[1] - quad[0]))
-    width_bottom = float(np.linalg.norm(quad[2] - quad[3]))
-    height_right = float(np.linalg.norm(quad[2] - quad[1]))
-    height_left = float(np.linalg.norm(quad[3] - quad[0]))
+    # Edge lengths TL->TR, TR->BR, BR->BL, BL->TL in one pass via the fixed
+    # next-corner index instead of four separate subtract + norm calls.
+    edges = quad[_DASHBOARD_QUAD_NEXT] - quad
+    width_top, height_right, width_bottom, height_left = np.hypot(edges[:, 0], edges[:, 1]).tolist()
     width = max(1, int(round(max(width_top, width_bottom))))
     height = max(1, int(round(max(height_right, height_left))))
     return (width, height)
 
 
+def _dashboard_rectify_quad(quad: np.ndarray) -> tuple[np.ndarray, tuple[int, int]]:
+    """Expand, size and build the perspective matrix for a dashboard quad.
+
+    Both rectified crop kinds (carousel and classification chambers) run the
+    same expand -> size -> warp chain; keeping it in one place converts the
+    quad to float32 once and hands the already-float32 corners straight to
+    ``getPerspectiveTransform``.
+    """
+    corners = np.asarray(quad, dtype=np.float32)
+    return _dashboard_rectify_corners(tuple(corners.ravel().tolist()))
+
+
+@lru_cache(maxsize=64)
+def _dashboard_rectify_corners(
+    corners: tuple[float, ...],
+) -> tuple[np.ndarray, tuple[int, int]]:
+    # The quads come from saved calibration, so every preview stream, client
+    # reconnect and resolution change rebuilds a spec from the same corners.
+    # Keyed on the exact float32 values — a hit is bit-identical to a fresh
+    # computation. The shared matrix is made read-only.
+    expanded_quad = _dashboard_expand_quad(np.array(corners, dtype=np.float32).reshape(4, 2))
+    target_w, target_h = _dashboard_quad_size(expanded_quad)
+    destination = np.array(
+        [[0, 0], [target_w - 1, 0], [target_w - 1, target_h - 1], [0, target_h - 1]],
+        dtype=np.float32,
+    )
+    matrix = cv2.getPerspectiveTransform(expanded_quad, destination)
+    matrix.setflags(write=False)
+    return matrix, (target_w, target_h)
+
+
 def _dashboard_channel_rotation_deg(role: str, saved: Dict[str, Any] | None) -> float:
     """Rotation (degrees, CCW positive) needed so the drop-zone start of the
     given role sits at 6 o'clock in the rendered dashboard tile. Returns 0
@@ -3738,16 +3774,11 @@ def _dashboard_crop_spec(role: str, frame_w: int, frame_h: int) -> Dict[str, Any
                 if len(quad_points) == 4 else None
             )
             if scaled_quad is not None and len(scaled_quad) == 4:
-                expanded_quad = _dashboard_expand_quad(scaled_quad)
-                target_w, target_h = _dashboard_quad_size(expanded_quad)
-                destination = np.array(
-                    [[0, 0], [target_w - 1, 0], [target_w - 1, target_h - 1], [0, target_h - 1]],
-                    dtype=np.float32,
-                )
+                matrix, size = _dashboard_rectify_quad(scaled_quad)
                 return {
                     "kind": "rectified",
-                    "matrix": cv2.getPerspectiveTransform(expanded_quad.astype(np.float32), destination),
-                    "size": (target_w, target_h),
+                    "matrix": matrix,
+                    "size": size,
                     "rotation_deg": _dashboard_channel_rotation_deg(role, saved),
                 }
 
@@ -3800,16 +3831,11 @@ def _dashboard_crop_spec(role: str, frame_w: int, frame_h: int) -> Dict[str, Any
             if len(quad_points) == 4 else None
         )
         if scaled_quad is not None and len(scaled_quad) == 4:
-            expanded_quad = _dashboard_expand_quad(scaled_quad)
-            target_w, target_h = _dashboard_quad_size(expanded_quad)
-            destination = np.array(
-                [[0, 0], [target_w - 1, 0], [target_w - 1, target_h - 1], [0, target_h - 1]],
-                dtype=np.float32,
-            )
+            matrix, size = _dashboard_rectify_quad(scaled_quad)
             return {
                 "kind": "rectified",
-                "matrix": cv2.getPerspectiveTransform(expanded_quad.astype(np.float32), destination),
-                "size": (target_w, target_h),
+                "matrix": matrix,
+                "size": size,
                 "square": True,
             }
 
@@ -3881,6 +3907,31 @@ def _apply_dashboard_crop(frame: np.ndarray, spec: Dict[str, Any] | None) -> np.
     return processed
 
 
+# Last MJPEG chunk per (role, dashboard), keyed on the identity of the source
+# frame it was encoded from. Every open preview of a role polls the same
+# shared frame objects — the perception preview is rendered once per cycle,
+# the live feed caches its annotated frame per timestamp, and an overlay-less
+# (or idle) annotated read hands back the raw frame itself — so a second tab,
+# or a raw and an annotated view of an idle camera, reuses the JPEG instead
+# of resizing and encoding the same pixels again. Holding the source frame
+# also pins its id, so an identity match can't be a recycled array.
+_PREVIEW_CHUNK_CACHE: Dict[tuple[str, bool], tuple[np.ndarray, bytes]] = {}
+_PREVIEW_CHUNK_LOCK = threading.Lock()
+
+
+def _cached_preview_chunk(key: tuple[str, bool], source: np.ndarray) -> bytes | None:
+    with _PREVIEW_CHUNK_LOCK:
+        cached = _PREVIEW_CHUNK_CACHE.get(key)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+    return None
+
+
+def _store_preview_chunk(key: tuple[str, bool], source: np.ndarray, chunk: bytes) -> None:
+    with _PREVIEW_CHUNK_LOCK:
+        _PREVIEW_CHUNK_CACHE[key] = (source, chunk)
+
+
 @router.get("/api/cameras/feed/{role}")
 def camera_feed_by_role(
     role: str,
@@ -3943,6 +3994,7 @@ def camera_feed_by_role(
         raise HTTPException(404, f"Camera role '{role}' not configured")
 
     encoder = MjpegOutput()
+    chunk_key = (role, bool(dashboard))
 
     cached_dashboard_shape: tuple[int, int] | None = None
     cached_dashboard_spec: Dict[str, Any] | None = None
@@ -3990,6 +4042,7 @@ def camera_feed_by_role(
                     result = ps.preview_frame(channel_id, PREVIEW_MAX_WIDTH)
                 if result is not None:
                     frame, frame_ts = result
+                    source = frame
                 else:
                     # Annotations off, or perception not ready yet: raw pixels
                     # from the SAME shared capture thread — never a VisionManager
@@ -4009,6 +4062,7 @@ def camera_feed_by_role(
                         continue
                     frame_ts = frame_obj.timestamp
                     frame = frame_obj.raw
+                    source = frame
                     if PREVIEW_MAX_WIDTH > 0 and frame.shape[1] > PREVIEW_MAX_WIDTH:
                         scale = PREVIEW_MAX_WIDTH / float(frame.shape[1])
                         frame = cv2.resize(
@@ -4024,6 +4078,10 @@ def camera_feed_by_role(
                     f"preview.{role}.frame_age_ms",
                     max(0.0, (time.time() - float(frame_ts)) * 1000.0),
                 )
+                chunk = _cached_preview_chunk(chunk_key, source)
+                if chunk is not None:
+                    yield chunk
+                    continue
                 frame = _dashboard_frame(frame)
                 if prof is not None:
                     prof.hit(f"encode.{role}.frames")
@@ -4032,6 +4090,7 @@ def camera_feed_by_role(
                         chunk = encoder.encode_chunk(frame, quality=55)
                 else:
                     chunk = encoder.encode_chunk(frame, quality=55)
+                _store_preview_chunk(chunk_key, source, chunk)
                 yield chunk
 
         return StreamingResponse(
@@ -4075,6 +4134,11 @@ def camera_feed_by_role(
                         f"preview.{role}.frame_age_ms",
                         max(0.0, (time.time() - float(frame_obj.timestamp)) * 1000.0),
                     )
+                    source = frame
+                    chunk = _cached_preview_chunk(chunk_key, source)
+                    if chunk is not None:
+                        yield chunk
+                        continue
                     process_started = time.perf_counter()
                     # Downscale FIRST. The dashboard crop is a warpPerspective
                     # (or polygon mask) on the input frame — on a 4K camera that
@@ -4114,6 +4178,7 @@ def camera_feed_by_role(
                             f"preview.{role}.encode_ms",
                             (time.perf_counter() - encode_started) * 1000.0,
                         )
+                    _store_preview_chunk(chunk_key, source, chunk)
                     yield chunk
 
             return StreamingResponse(
@@ -566,6 +566,16 @@ def _write_classification_baseline_frames(
     baseline_max = np.max(stack, axis=0).astype(np.uint8)
     cv2.imwrite(str(baseline_dir / f"{prefix}_baseline_min.png"), baseline_min)
     cv2.imwrite(str(baseline_dir / f"{prefix}_baseline_max.png"), baseline_max)
+    # Same envelope plus the per-pixel stddev in one deflated archive (the
+    # float32 stddev alone would be 4 bytes/pixel raw); VisionManager loads
+    # this first instead of decoding every PNG above.
+    np.savez_compressed(
+        baseline_dir / f"{prefix}_baseline.npz",
+        min=baseline_min,
+        max=baseline_max,
+        stddev=np.std(stack.astype(np.float32), axis=0),
+        frame_count=np.int64(len(frames)),
+    )
 
     height, width = baseline_min.shape[:2]
     return {
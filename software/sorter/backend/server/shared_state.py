@@ -268,6 +268,20 @@ def _update_snapshot(event: dict) -> None:
             perf_history.record(payload, time.time())
 
 
+def recordEventSnapshot(event: dict) -> None:
+    """Apply ``event`` to the WS-connect replay snapshots without sending it.
+
+    For producers that skip the live fanout while no client is connected:
+    a client that attaches later still replays the latest state. Also
+    stamps the broadcast-liveness clock, as ``broadcastEvent`` does on its
+    no-clients path, so the first client doesn't trip the watchdog before
+    the next real send.
+    """
+    global last_broadcast_ok_ts
+    last_broadcast_ok_ts = time.time()
+    _update_snapshot(event)
+
+
 def broadcast_from_thread(event: dict) -> None:
     """Thread-safe broadcast helper — schedules a broadcast on the server loop.
 
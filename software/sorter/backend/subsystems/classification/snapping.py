@@ -1,6 +1,5 @@
 from typing import Optional, TYPE_CHECKING
 import time
-import base64
 import queue
 import threading
 import cv2
@@ -16,6 +15,8 @@ from defs.known_object import ClassificationStatus
 from classification import classify
 from blob_manager import BLOB_DIR
 from server.classification_training import getClassificationTrainingManager
+from vision.outputs.base64 import encode_base64
+from vision.outputs.jpeg import encode_jpeg
 from .bbox_projection import translate_bbox_to_crop, translate_bboxes_to_crop
 
 if TYPE_CHECKING:
@@ -90,10 +91,10 @@ class Snapping(BaseState):
     def _encodeImageBase64(self, image: np.ndarray | None) -> Optional[str]:
         if image is None:
             return None
-        ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        if not ok:
+        data = encode_jpeg(image, 80)
+        if data is None:
             return None
-        return base64.b64encode(buffer).decode("utf-8")
+        return encode_base64(data)
 
     def _captureAndClassify(self) -> None:
         piece = self.carousel.getPieceAtClassification()
@@ -70,11 +70,16 @@ def _twoMeansBorderColors(bgr: np.ndarray) -> Optional[np.ndarray]:
     luma = border.sum(axis=1)
     centers = np.stack([border[int(luma.argmin())], border[int(luma.argmax())]])
     for _ in range(8):
-        d = np.linalg.norm(border[:, None, :] - centers[None, :, :], axis=2)
-        assign = d.argmin(axis=1)
+        # With two centers the nearest one is a half-space test against their
+        # perpendicular bisector: |p - c1|² < |p - c0|² exactly when
+        # p·(c1 - c0) > (|c1|² - |c0|²) / 2. One dot product per pixel
+        # instead of two norms; ties still go to center 0 like argmin did.
+        nearer_second = border @ (centers[1] - centers[0]) > 0.5 * (
+            float(centers[1] @ centers[1]) - float(centers[0] @ centers[0])
+        )
         moved = 0.0
-        for k in range(2):
-            sel = border[assign == k]
+        for k, in_cluster in enumerate((~nearer_second, nearer_second)):
+            sel = border[in_cluster]
             if len(sel):
                 new_c = sel.mean(axis=0)
                 moved = max(moved, float(np.linalg.norm(new_c - centers[k])))
@@ -89,8 +94,14 @@ def pieceMask(bgr: np.ndarray) -> Optional[np.ndarray]:
     if centers is None:
         return None
     px = bgr.reshape(-1, 3).astype(np.float32)
-    d = np.linalg.norm(px[:, None, :] - centers[None, :, :], axis=2).min(axis=1)
-    mask = (d > BACKGROUND_COLOR_DIST).reshape(bgr.shape[:2]).astype(np.uint8)
+    # Piece pixels are farther than the threshold from BOTH background
+    # colors; compare squared distances so no per-pixel sqrt is needed.
+    limit_sq = BACKGROUND_COLOR_DIST * BACKGROUND_COLOR_DIST
+    far = np.ones(len(px), dtype=bool)
+    for center in centers:
+        diff = px - center
+        far &= np.einsum("ij,ij->i", diff, diff) > limit_sq
+    mask = far.reshape(bgr.shape[:2]).astype(np.uint8)
     mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8))
     mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, np.ones((5, 5), np.uint8))
     return mask
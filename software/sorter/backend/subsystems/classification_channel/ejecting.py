@@ -26,6 +26,8 @@ from subsystems.sample_collection_speed import (
 )
 from subsystems.shared_variables import SharedVariables
 from utils.event import knownObjectToEvent
+from vision.outputs.base64 import encode_base64
+from vision.outputs.jpeg import encode_jpeg
 
 PRE_EJECT_DELAY_MS = 200
 CLASSIFICATION_TIMEOUT_S = 12.0
@@ -366,10 +368,10 @@ class Ejecting(BaseState):
     def _encodeImageBase64(image: np.ndarray | None) -> Optional[str]:
         if image is None:
             return None
-        ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        if not ok:
+        data = encode_jpeg(image, 80)
+        if data is None:
             return None
-        return base64.b64encode(buffer).decode("utf-8")
+        return encode_base64(data)
 
     @staticmethod
     def _pickSharpestCrop(crops: list[np.ndarray]) -> np.ndarray | None:
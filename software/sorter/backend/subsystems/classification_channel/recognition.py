@@ -24,6 +24,8 @@ from subsystems.classification_channel.incidents import (
     publish_classification_fallback_incident,
 )
 from utils.event import knownObjectToEvent
+from vision.outputs.base64 import encode_base64
+from vision.outputs.jpeg import encode_jpeg
 
 MIN_RECOGNIZE_CROPS = 1
 CLASSIFICATION_TIMEOUT_S = 12.0
@@ -376,10 +378,10 @@ class ClassificationChannelRecognizer:
     def _encodeImageBase64(image: np.ndarray | None) -> Optional[str]:
         if image is None:
             return None
-        ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        if not ok:
+        data = encode_jpeg(image, 80)
+        if data is None:
             return None
-        return base64.b64encode(buffer).decode("utf-8")
+        return encode_base64(data)
 
     @staticmethod
     def _laplacianVariance(crop: np.ndarray) -> float:
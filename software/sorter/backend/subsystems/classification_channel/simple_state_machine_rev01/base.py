@@ -1,4 +1,3 @@
-import base64
 import json
 import threading
 import time
@@ -30,6 +29,8 @@ from subsystems.classification_channel import crop_quality
 from subsystems.classification_channel.five_sector_platter import C4FiveSectorPlatter
 from subsystems.shared_variables import SharedVariables
 from utils.event import knownObjectToEvent
+from vision.outputs.base64 import encode_base64
+from vision.outputs.jpeg import encode_jpeg
 
 from .constants import HOSTED_COLOR_JOIN_BUDGET_S, LOG_TAG
 from .context import SimpleStateMachineRev01Context
@@ -180,10 +181,10 @@ class Rev01BaseState(BaseState):
     def encodeFrame(frame: np.ndarray) -> Optional[str]:
         # Quality 90: these crops are persisted to disk (piece_image_store) and
         # eventually synced to the Hive for training, so keep them near-lossless.
-        ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-        if not ok:
+        data = encode_jpeg(frame, 90)
+        if data is None:
             return None
-        return base64.b64encode(buf).decode("utf-8")
+        return encode_base64(data)
 
     @staticmethod
     def sharpness(frame: np.ndarray) -> float:
@@ -859,8 +860,6 @@ class Rev01BaseState(BaseState):
     def _linkCropToRecognitionImage(
         self, cand: dict
     ) -> Optional[tuple[RecognitionImage, np.ndarray]]:
-        import base64
-
         import channel_crop_store
 
         path = channel_crop_store.getCropFileById(int(cand["id"]))
@@ -875,7 +874,7 @@ class Rev01BaseState(BaseState):
             return None
         ts = cand.get("ts")
         rec = RecognitionImage(
-            image=base64.b64encode(raw).decode("ascii"),
+            image=encode_base64(raw),
             source="link_match",
             # Left False here. _finalizeAttempts flips it to True for whichever
             # images ended up in the winning request, exactly as it does for the
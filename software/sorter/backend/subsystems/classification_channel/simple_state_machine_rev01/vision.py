@@ -8,6 +8,30 @@ from global_config import GlobalConfig
 from vision.types import CameraFrame
 from .constants import LOG_TAG
 
+# (polygon bytes, shape) -> (extents, convex, edge-line coefficients if convex
+# else membership map). The zone polygon is rebuilt as a fresh int32 array on every accessor
+# call but only changes when the channel is re-calibrated, so its geometry is
+# derived once and reused. Module level because channel_clear constructs a
+# throwaway ``Rev01Vision`` per poll.
+_polygon_geometry_cache: Optional[
+    tuple[
+        bytes,
+        tuple[int, ...],
+        tuple[int, int, int, int],
+        bool,
+        np.ndarray,
+    ]
+] = None
+
+# Values of the non-convex membership map built by ``_polygonGeometry``.
+_MAP_OUTSIDE = 0
+_MAP_INSIDE = 1
+_MAP_NEAR_EDGE = 2
+# Stroke width for the near-edge band. Wide enough that every pixel it leaves
+# unmarked is > 2 px from the polygon outline, so both fillPoly's value there
+# and the membership of any point within that pixel's cell are unambiguous.
+_MAP_EDGE_BAND_PX = 7
+
 
 class Rev01Vision:
     """Thin read-only view over the VisionManager for rev01.
@@ -49,10 +73,36 @@ class Rev01Vision:
         except Exception as exc:
             self.logger.warning(f"{LOG_TAG} carousel polygon fetch failed: {exc}")
             return None
+        return self._asPolygon(polygon)
+
+    @staticmethod
+    def _asPolygon(polygon) -> Optional[np.ndarray]:
         if polygon is None or len(polygon) < 3:
             return None
         return np.asarray(polygon, dtype=np.int32)
 
+    def _snapshot(
+        self, frame: Optional[CameraFrame] = None
+    ) -> tuple[
+        Optional[CameraFrame], list[tuple[int, int, int, int]], Optional[np.ndarray]
+    ] | None:
+        """Frame, candidates and polygon from the combined VisionManager read.
+
+        Returns None when the vision object has no snapshot accessor, so the
+        caller falls back to the separate candidate + polygon accessors.
+        """
+        snapshot = getattr(self._vision, "getClassificationChannelSnapshot", None)
+        if snapshot is None:
+            return None
+        try:
+            snap_frame, candidates, polygon = (
+                snapshot() if frame is None else snapshot(frame=frame)
+            )
+        except Exception as exc:
+            self.logger.warning(f"{LOG_TAG} channel snapshot fetch failed: {exc}")
+            return None, [], None
+        return snap_frame, list(candidates), self._asPolygon(polygon)
+
     @staticmethod
     def _bboxCenter(bbox: tuple[int, int, int, int]) -> tuple[float, float]:
         x1, y1, x2, y2 = bbox
@@ -60,14 +110,23 @@ class Rev01Vision:
 
     def bboxesOnChannel(self) -> list[tuple[int, int, int, int]]:
         """Raw detections whose center lies inside the carousel zone polygon."""
+        if self._vision is None:
+            return []
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            _, candidates, polygon = snapshot
+            return self._filterOnChannel(candidates, polygon)
         return self._filterOnChannel(self._rawCandidates())
 
     def _filterOnChannel(
-        self, candidates: list[tuple[int, int, int, int]]
+        self,
+        candidates: list[tuple[int, int, int, int]],
+        polygon: Optional[np.ndarray] = None,
     ) -> list[tuple[int, int, int, int]]:
         if not candidates:
             return []
-        polygon = self._carouselPolygon()
+        if polygon is None:
+            polygon = self._carouselPolygon()
         if polygon is None:
             # No polygon configured — we cannot establish membership, so treat
             # nothing as on-channel rather than acting on bounding-rect clutter.
@@ -76,12 +135,95 @@ class Rev01Vision:
                 f"{len(candidates)} raw candidate(s)"
             )
             return []
-        on_channel: list[tuple[int, int, int, int]] = []
+        # Most raw candidates (hopper clutter) sit well outside the zone, so
+        # reject on the polygon extents before the exact polygon test.
+        (px, py, max_x, max_y), convex, geometry = self._polygonGeometry(polygon)
+        in_bounds: list[tuple[tuple[int, int, int, int], tuple[float, float]]] = []
         for bbox in candidates:
             cx, cy = self._bboxCenter(bbox)
-            if cv2.pointPolygonTest(polygon, (cx, cy), False) >= 0:
-                on_channel.append(bbox)
-        return on_channel
+            if cx < px or cx > max_x or cy < py or cy > max_y:
+                continue
+            in_bounds.append((bbox, (cx, cy)))
+        if not in_bounds:
+            return []
+        centers = np.array([center for _, center in in_bounds], dtype=np.float64)
+        if convex:
+            inside = self._pointsInConvexPolygon(geometry, centers)
+            return [bbox for (bbox, _), ok in zip(in_bounds, inside) if ok]
+        cells_xy = np.floor(centers).astype(np.intp)
+        cells = geometry[cells_xy[:, 1] - py, cells_xy[:, 0] - px]
+        return [
+            bbox
+            for (bbox, center), cell in zip(in_bounds, cells.tolist())
+            if cell == _MAP_INSIDE
+            or (
+                cell == _MAP_NEAR_EDGE
+                and cv2.pointPolygonTest(polygon, center, False) >= 0
+            )
+        ]
+
+    @staticmethod
+    def _polygonGeometry(
+        polygon: np.ndarray,
+    ) -> tuple[tuple[int, int, int, int], bool, np.ndarray]:
+        """Inclusive extents, convexity, and the matching membership geometry.
+
+        The array is the edge lines when the flag is True, else the map.
+
+        Edge i (vertex i -> i+1, wrapping) becomes the line ``a*x + b*y + c``
+        with ``a = -(y2 - y1)``, ``b = x2 - x1``, ``c = (y2 - y1)*x1 - (x2 - x1)*y1``
+        — the cross product of the edge with (point - vertex i), expanded so
+        a test point costs two multiplies and two adds per edge.
+
+        Non-convex polygons (the arc-shaped classification-channel zone) get
+        a uint8 map over their extents instead, rasterized once: fillPoly
+        marks the interior, then the outline is stroked as a near-edge band.
+        A point is answered by one lookup of the pixel cell it falls in; only
+        points in the band go through ``pointPolygonTest``, so the result
+        stays exactly that of the per-edge test.
+        """
+        global _polygon_geometry_cache
+        key = polygon.tobytes()
+        cached = _polygon_geometry_cache
+        if cached is not None and cached[0] == key and cached[1] == polygon.shape:
+            return cached[2], cached[3], cached[4]
+        px, py, pw, ph = cv2.boundingRect(polygon)
+        extents = (px, py, px + pw - 1, py + ph - 1)
+        convex = bool(cv2.isContourConvex(polygon))
+        if convex:
+            vertices = polygon.reshape(-1, 2).astype(np.float64)
+            edges = np.empty_like(vertices)
+            np.subtract(vertices[1:], vertices[:-1], out=edges[:-1])
+            np.subtract(vertices[0], vertices[-1], out=edges[-1])
+            edge_lines = np.empty((len(vertices), 3), dtype=np.float64)
+            edge_lines[:, 0] = -edges[:, 1]
+            edge_lines[:, 1] = edges[:, 0]
+            edge_lines[:, 2] = edges[:, 1] * vertices[:, 0] - edges[:, 0] * vertices[:, 1]
+            geometry = edge_lines
+        else:
+            local = polygon.reshape(-1, 1, 2) - np.array([px, py], dtype=np.int32)
+            membership = np.full((ph, pw), _MAP_OUTSIDE, dtype=np.uint8)
+            cv2.fillPoly(membership, [local], _MAP_INSIDE)
+            cv2.polylines(
+                membership,
+                [local],
+                isClosed=True,
+                color=_MAP_NEAR_EDGE,
+                thickness=_MAP_EDGE_BAND_PX,
+            )
+            geometry = membership
+        _polygon_geometry_cache = (key, polygon.shape, extents, convex, geometry)
+        return extents, convex, geometry
+
+    @staticmethod
+    def _pointsInConvexPolygon(edge_lines: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Vectorized same-side-of-every-edge test for a convex polygon.
+
+        ``edge_lines`` comes from ``_polygonGeometry``. Boundary points count
+        as inside, matching ``pointPolygonTest >= 0``.
+        """
+        side = points @ edge_lines[:, :2].T + edge_lines[:, 2]
+        return np.all(side >= 0, axis=1) | np.all(side <= 0, axis=1)
 
     def bboxesAndFrameOnChannel(
         self,
@@ -99,6 +241,10 @@ class Rev01Vision:
         frame = capture.latest_frame
         if frame is None or frame.raw is None:
             return [], None
+        snapshot = self._snapshot(frame)
+        if snapshot is not None:
+            _, candidates, polygon = snapshot
+            return self._filterOnChannel(candidates, polygon), frame
         bboxes = self._filterOnChannel(self._rawCandidates(frame=frame))
         return bboxes, frame
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, List, Dict, Tuple
+import math
 import numpy as np
 
 from defs.consts import (
@@ -281,10 +282,10 @@ def _polarPoint(
     radius_scale: float,
 ) -> list[int]:
     scaled_radius = float(radius) * float(radius_scale)
-    angle_rad = np.deg2rad(normalizeAngle(angle))
+    angle_rad = math.radians(normalizeAngle(angle))
     return [
-        int(round(cx + scaled_radius * np.cos(angle_rad))),
-        int(round(cy + scaled_radius * np.sin(angle_rad))),
+        int(round(cx + scaled_radius * math.cos(angle_rad))),
+        int(round(cy + scaled_radius * math.sin(angle_rad))),
     ]
 
 
@@ -548,12 +549,15 @@ def getBboxSections(bbox: Tuple[int, int, int, int], channel: PolygonChannel) ->
         (mx, y1), (mx, y2), (x1, my), (x2, my),
         (mx, my),
     ]
+    # Fixed nine scalar samples per bbox: plain ``math`` calls avoid a NumPy
+    # ufunc dispatch (and a 0-d array result) for every point.
+    cx = float(channel.center[0])
+    cy = float(channel.center[1])
+    start = channel.radius1_angle_image
     sections: set[int] = set()
     for px, py in points:
-        dx = px - channel.center[0]
-        dy = py - channel.center[1]
-        angle = np.degrees(np.arctan2(dy, dx))
-        relative = (angle - channel.radius1_angle_image) % 360
+        angle = math.degrees(math.atan2(py - cy, px - cx))
+        relative = (angle - start) % 360
         sections.add(int(relative / CHANNEL_SECTION_DEG))
     return sections
 
@@ -561,7 +565,7 @@ def getBboxSections(bbox: Tuple[int, int, int, int], channel: PolygonChannel) ->
 def _sectionForPoint(px: float, py: float, channel: PolygonChannel) -> int:
     dx = px - channel.center[0]
     dy = py - channel.center[1]
-    angle = np.degrees(np.arctan2(dy, dx))
+    angle = math.degrees(math.atan2(dy, dx))
     relative = (angle - channel.radius1_angle_image) % 360
     return int(relative / CHANNEL_SECTION_DEG)
 
@@ -618,18 +622,28 @@ def bboxSectionOverlapRatio(
     if right <= left or bottom <= top or samples_per_axis <= 0:
         return 0.0
 
-    total = 0
-    inside_sections = 0
-    for py in np.linspace(top, bottom, samples_per_axis):
-        for px in np.linspace(left, right, samples_per_axis):
-            if not _isInChannel((px, py), channel):
-                continue
-            total += 1
-            if _sectionForPoint(float(px), float(py), channel) in sections:
-                inside_sections += 1
-
+    # Evaluate the whole sample grid at once: one boolean channel-membership
+    # mask and one section-membership mask, then count both from the same
+    # arrays instead of testing every sample point in Python.
+    px, py = np.meshgrid(
+        np.linspace(left, right, samples_per_axis),
+        np.linspace(top, bottom, samples_per_axis),
+    )
+    ix = px.astype(np.int64)
+    iy = py.astype(np.int64)
+    mask_h, mask_w = channel.mask.shape[:2]
+    in_channel = (ix >= 0) & (ix < mask_w) & (iy >= 0) & (iy < mask_h)
+    in_channel[in_channel] = channel.mask[iy[in_channel], ix[in_channel]] > 0
+    total = int(np.count_nonzero(in_channel))
     if total <= 0:
         return 0.0
+
+    angles = np.degrees(
+        np.arctan2(py[in_channel] - channel.center[1], px[in_channel] - channel.center[0])
+    )
+    relative = (angles - channel.radius1_angle_image) % 360
+    point_sections = (relative / CHANNEL_SECTION_DEG).astype(np.int64)
+    inside_sections = int(np.count_nonzero(np.isin(point_sections, list(sections))))
     return float(inside_sections) / float(total)
 
 
@@ -434,6 +434,12 @@ class Feeding(BaseState):
                 inner_r = float(np.min(dists))
             else:
                 outer_r, inner_r = 200.0, 60.0
+            # Collect every highlighted wedge first and fill them per color on
+            # a single overlay — one frame copy + blend per channel instead of
+            # one per section. Wedges only share their edge pixels, which now
+            # get tinted once instead of twice.
+            exit_polys: list[np.ndarray] = []
+            drop_polys: list[np.ndarray] = []
             for sec in range(section_count):
                 a0 = r1 + sec * CHANNEL_SECTION_DEG
                 a1 = r1 + (sec + 1) * CHANNEL_SECTION_DEG
@@ -441,7 +447,6 @@ class Feeding(BaseState):
                 in_drop = sec in drop_secs
                 if not in_exit and not in_drop:
                     continue
-                color = (0, 0, 255) if in_exit else (255, 100, 0)  # exit=red, drop=blue-orange
                 pts = []
                 steps = 6
                 for i in range(steps + 1):
@@ -453,8 +458,14 @@ class Feeding(BaseState):
                     rad = np.deg2rad(ang)
                     pts.append([int(cx + inner_r * np.cos(rad)), int(cy + inner_r * np.sin(rad))])
                 pts_np = np.array(pts, dtype=np.int32).reshape(-1, 1, 2)
+                (exit_polys if in_exit else drop_polys).append(pts_np)
+            if exit_polys or drop_polys:
                 overlay = canvas.copy()
-                cv2.fillPoly(overlay, [pts_np], color)
+                # exit=red, drop=blue-orange
+                if drop_polys:
+                    cv2.fillPoly(overlay, drop_polys, (255, 100, 0))
+                if exit_polys:
+                    cv2.fillPoly(overlay, exit_polys, (0, 0, 255))
                 cv2.addWeighted(overlay, 0.35, canvas, 0.65, 0, canvas)
             if det is not None:
                 x1, y1, x2, y2 = [int(v) for v in det.bbox]
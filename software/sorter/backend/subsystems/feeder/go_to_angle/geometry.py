@@ -1,7 +1,6 @@
+import math
 from typing import Tuple
 
-import numpy as np
-
 from defs.channel import PolygonChannel
 from defs.consts import CHANNEL_SECTION_DEG
 from subsystems.feeder.analysis import _orderedCircularSections, normalizeAngle
@@ -17,7 +16,11 @@ def pieceRelativeAngle(bbox: Tuple[int, int, int, int], channel: PolygonChannel)
     cx, cy = (x1 + x2) / 2.0, (y1 + y2) / 2.0
     dx = cx - channel.center[0]
     dy = cy - channel.center[1]
-    image_angle = float(np.degrees(np.arctan2(dy, dx)))
+    # One scalar per detection, every feeder tick: plain ``math`` skips two
+    # NumPy ufunc dispatches and the 0-d array round-trip, and it is the same
+    # libm atan2 ``getBboxSections`` bins with, so the relative angle and the
+    # bbox sections agree to the last bit.
+    image_angle = math.degrees(math.atan2(dy, dx))
     return normalizeAngle(image_angle - channel.radius1_angle_image)
 
 
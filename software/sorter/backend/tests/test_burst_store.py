@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import sys
 import time
 import types
@@ -92,6 +93,7 @@ class VisionManagerBurstCaptureTests(unittest.TestCase):
         fake._burst_store = BurstFrameStore(max_pieces=10)
         fake._burst_timers = {}
         fake._burst_lock = __import__("threading").Lock()
+        fake._burst_encode_pool = None
         fake._BURST_MAX_EDGE_PX = VisionManager._BURST_MAX_EDGE_PX
         fake._BURST_JPEG_QUALITY = VisionManager._BURST_JPEG_QUALITY
         fake.gc = SimpleNamespace(logger=SimpleNamespace(
@@ -99,6 +101,7 @@ class VisionManagerBurstCaptureTests(unittest.TestCase):
         ))
         # Bind instance methods
         fake._encodeBurstFrame = VisionManager._encodeBurstFrame.__get__(fake)
+        fake._burstEncodePool = VisionManager._burstEncodePool.__get__(fake)
         fake._burstCaptureThreadsByRole = VisionManager._burstCaptureThreadsByRole.__get__(fake)
         fake._drainBurstFrames = VisionManager._drainBurstFrames.__get__(fake)
         fake.captureBurst = VisionManager.captureBurst.__get__(fake)
@@ -135,6 +138,21 @@ class VisionManagerBurstCaptureTests(unittest.TestCase):
         c3.drain_ring_buffer.assert_called_once_with(5)
         carousel.drain_ring_buffer.assert_called_once_with(5)
 
+    def test_burst_frames_are_stored_as_jpeg_and_encoded_on_read(self) -> None:
+        fake = self._build_fake_manager()
+        c3 = MagicMock()
+        c3.drain_ring_buffer.return_value = [_synthetic_frame(1)]
+        fake._c_channel_3_capture = c3
+        fake._carousel_capture = None
+
+        fake.captureBurst(55, pre_count=1, post_count=0, post_window_s=0.0)
+
+        stored = fake._burst_store.get(55)
+        self.assertIsInstance(stored[0]["jpeg"], bytes)
+        self.assertTrue(stored[0]["jpeg"].startswith(b"\xff\xd8"))
+        served = fake.getBurstFrames(55)
+        self.assertEqual(stored[0]["jpeg"], base64.b64decode(served[0]["jpeg_b64"]))
+
     def test_capture_burst_tolerates_missing_capture_threads(self) -> None:
         fake = self._build_fake_manager()
         fake._c_channel_3_capture = None
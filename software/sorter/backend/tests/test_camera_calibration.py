@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pytest
+
+from server.camera_calibration import _match_grid
+
+PITCH = 40.0
+
+
+def _synthetic_grid(cols: int, rows: int, angle_deg: float = 0.0) -> np.ndarray:
+    """(rows, cols, 2) tile centers, row-major like a contour scan."""
+    theta = math.radians(angle_deg)
+    vec1 = PITCH * np.array([math.cos(theta), math.sin(theta)], dtype=np.float32)
+    vec2 = PITCH * np.array([-math.sin(theta), math.cos(theta)], dtype=np.float32)
+    origin = np.array([120.0, 90.0], dtype=np.float32)
+    grid = np.empty((rows, cols, 2), dtype=np.float32)
+    for r in range(rows):
+        for c in range(cols):
+            grid[r, c] = origin + vec1 * c + vec2 * r
+    return grid
+
+
+@pytest.mark.parametrize(
+    "cols,rows,angle_deg",
+    [(4, 6, 0.0), (6, 4, 0.0), (4, 6, 12.0)],
+)
+def test_match_grid_returns_the_synthetic_grid(cols, rows, angle_deg) -> None:
+    expected = _synthetic_grid(cols, rows, angle_deg)
+    centers = expected.reshape(-1, 2)
+    relative = centers - centers[0]
+
+    grid = _match_grid(relative, centers, PITCH, cols, rows)
+
+    assert grid is not None
+    assert grid.shape == (rows, cols, 2)
+    assert grid.dtype == np.float32
+    np.testing.assert_array_equal(grid, expected)
+
+
+def test_match_grid_fills_a_missing_cell_with_its_expected_position() -> None:
+    expected = _synthetic_grid(4, 6)
+    centers = np.delete(expected.reshape(-1, 2), 4 * 3 + 2, axis=0)
+    relative = centers - centers[0]
+
+    grid = _match_grid(relative, centers, PITCH, 4, 6)
+
+    assert grid is not None
+    np.testing.assert_allclose(grid, expected, atol=1e-3)
@@ -1,5 +1,6 @@
 """Tests for CaptureThread's 90-frame ring buffer used by drop-zone burst."""
 
+import threading
 import time
 import unittest
 
@@ -86,5 +87,28 @@ class CameraRingBufferTests(unittest.TestCase):
         self.assertIsNone(capture.frame_at_or_before(time.time()))
 
 
+    def test_wait_for_frame_after_wakes_on_published_frame(self) -> None:
+        capture = CaptureThread("test_cam", mkCameraConfig(device_index=-1))
+        start = time.time()
+        fresh = _make_frame(5)
+
+        def _publish() -> None:
+            time.sleep(0.02)
+            capture.latest_frame = fresh
+            with capture._new_frame:
+                capture._new_frame.notify_all()
+
+        publisher = threading.Thread(target=_publish)
+        publisher.start()
+        result = capture.wait_for_frame_after(start, timeout_s=2.0)
+        publisher.join()
+        self.assertIs(result, fresh)
+
+    def test_wait_for_frame_after_times_out_on_stale_frame(self) -> None:
+        capture = CaptureThread("test_cam", mkCameraConfig(device_index=-1))
+        capture.latest_frame = _make_frame(0)
+        self.assertIsNone(capture.wait_for_frame_after(time.time() + 10.0, timeout_s=0.01))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -19,7 +19,10 @@ import numpy as np
 
 from defs.channel import ChannelDetection, PolygonChannel
 from subsystems.feeder.analysis import (
+    _isInChannel,
+    _sectionForPoint,
     analyzeFeederChannels,
+    bboxSectionOverlapRatio,
     getBboxSections,
 )
 from subsystems.feeder.go_to_angle.geometry import (
@@ -279,3 +282,67 @@ def test_empty_zone_sets_never_attribute_anything() -> None:
     assert analysis.ch3_dropzone_occupied is False
     rel = pieceRelativeAngle(det.bbox, det.channel)
     assert sectionForRelativeAngle(rel) not in bare.exit_sections
+
+
+# --- bboxSectionOverlapRatio must keep the per-point loop's semantics ---
+
+
+def _looped_overlap_ratio(
+    bbox: tuple[int, int, int, int],
+    channel: PolygonChannel,
+    sections: set[int],
+    samples_per_axis: int = 5,
+) -> float:
+    """The original point-by-point sampler the vectorised version replaced."""
+    if not sections:
+        return 0.0
+    x1, y1, x2, y2 = bbox
+    left, right = sorted((float(x1), float(x2)))
+    top, bottom = sorted((float(y1), float(y2)))
+    if right <= left or bottom <= top or samples_per_axis <= 0:
+        return 0.0
+    total = 0
+    inside = 0
+    for py in np.linspace(top, bottom, samples_per_axis):
+        for px in np.linspace(left, right, samples_per_axis):
+            if not _isInChannel((px, py), channel):
+                continue
+            total += 1
+            if _sectionForPoint(float(px), float(py), channel) in sections:
+                inside += 1
+    if total <= 0:
+        return 0.0
+    return float(inside) / float(total)
+
+
+def test_bbox_section_overlap_ratio_matches_point_loop() -> None:
+    ch = _make_channel(
+        3, drop_range=(75, 105), exit_range=(350, 20), radius1_angle_image=33.0
+    )
+    rng = np.random.default_rng(11)
+    boxes = [
+        # Straddling the annulus edge and the image border (negative coords
+        # and past IMAGE_W/IMAGE_H), so some samples fall outside the mask.
+        (-25, 180, 45, 230),
+        (370, 150, 430, 260),
+        (185, -30, 215, 70),
+        (150, 150, 250, 250),  # inside the hole: no sample in the channel
+        (330, 190, 300, 230),  # reversed corners
+        _bbox_at_angle(90.0),
+        _bbox_at_angle(5.0, radius=RADIUS + 25),
+    ]
+    for _ in range(200):
+        x1, y1 = rng.integers(-60, IMAGE_W + 20, size=2)
+        w, h = rng.integers(1, 120, size=2)
+        boxes.append((int(x1), int(y1), int(x1 + w), int(y1 + h)))
+
+    for sections in (ch.dropzone_sections, ch.exit_sections, set()):
+        for bbox in boxes:
+            for samples in (3, 5):
+                expected = _looped_overlap_ratio(bbox, ch, sections, samples)
+                actual = bboxSectionOverlapRatio(
+                    bbox, ch, sections, samples_per_axis=samples
+                )
+                assert actual == expected, (bbox, samples, sorted(sections)[:3])
+
+    assert bboxSectionOverlapRatio(_bbox_at_angle(90.0), ch, set()) == 0.0
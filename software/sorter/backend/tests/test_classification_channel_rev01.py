@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 
+import cv2
 import numpy as np
 
 from defs.known_object import KnownObject
@@ -28,6 +29,57 @@ def test_rev01_crop_bbox_uses_exact_bounds() -> None:
     assert np.array_equal(crop, frame[1:5, 2:6])
 
 
+def test_rev01_filter_on_channel_matches_point_polygon_test() -> None:
+    quad = np.array([[10, 10], [90, 20], [80, 90], [5, 70]], dtype=np.int32)
+    notch = np.array(
+        [[0, 0], [100, 0], [100, 100], [60, 100], [50, 40], [40, 100], [0, 100]],
+        dtype=np.int32,
+    )
+    candidates = [
+        (x, y, x + 4, y + 4)
+        for y in range(-10, 110, 7)
+        for x in range(-10, 110, 7)
+    ]
+
+    for polygon in (quad, notch):
+        view = Rev01Vision.__new__(Rev01Vision)
+        view._carouselPolygon = lambda polygon=polygon: polygon
+        expected = [
+            bbox
+            for bbox in candidates
+            if cv2.pointPolygonTest(polygon, Rev01Vision._bboxCenter(bbox), False) >= 0
+        ]
+
+        assert view._filterOnChannel(candidates) == expected
+
+
+def test_rev01_bboxes_and_frame_use_single_snapshot() -> None:
+    frame = SimpleNamespace(raw=np.zeros((100, 100, 3), dtype=np.uint8), timestamp=1.0)
+    calls: list[object] = []
+
+    class _SnapshotVision:
+        _carousel_capture = SimpleNamespace(latest_frame=frame)
+
+        def getClassificationChannelSnapshot(self, *, frame=None):
+            calls.append(frame)
+            return (
+                frame,
+                [(10, 10, 20, 20), (80, 80, 90, 90)],
+                [[0, 0], [50, 0], [50, 50], [0, 50]],
+            )
+
+        def getCarouselPolygon(self):
+            raise AssertionError("polygon must come from the snapshot")
+
+    view = Rev01Vision(_SnapshotVision(), SimpleNamespace(logger=None))
+
+    bboxes, bbox_frame = view.bboxesAndFrameOnChannel()
+
+    assert bboxes == [(10, 10, 20, 20)]
+    assert bbox_frame is frame
+    assert calls == [frame]
+
+
 def test_rev01_select_recognition_crops_keeps_even_spread() -> None:
     crops = [np.full((2, 2, 3), idx, dtype=np.uint8) for idx in range(12)]
 
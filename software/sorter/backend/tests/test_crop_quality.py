@@ -56,6 +56,34 @@ def test_score_crop_is_deterministic() -> None:
     assert a == b
 
 
+def test_two_means_ties_go_to_the_dark_center() -> None:
+    # 1x3 crop: the border is [0, 50, 100] twice plus both ends once more.
+    # 50 is equidistant from the initial centers 0 and 100 and must join the
+    # dark cluster, so the centers settle at 20 and 100.
+    img = np.array([[[0, 0, 0], [50, 50, 50], [100, 100, 100]]], dtype=np.uint8)
+    centers = crop_quality._twoMeansBorderColors(img)
+    np.testing.assert_array_equal(
+        centers, np.array([[20, 20, 20], [100, 100, 100]], dtype=np.float32)
+    )
+
+
+def test_piece_mask_on_fixed_two_tone_crop() -> None:
+    img = np.zeros((20, 20, 3), dtype=np.uint8)
+    img[:, :10] = 30
+    img[:, 10:] = 200
+    img[4:10, 3:9] = (40, 120, 220)  # piece: far from both backgrounds
+    img[12:18, 2:8] = (70, 30, 30)  # exactly BACKGROUND_COLOR_DIST from the dark bg
+    img[15, 15] = (0, 0, 255)  # lone speck, removed by the opening
+
+    centers = crop_quality._twoMeansBorderColors(img)
+    np.testing.assert_array_equal(
+        centers, np.array([[30, 30, 30], [200, 200, 200]], dtype=np.float32)
+    )
+    expected = np.zeros((20, 20), dtype=np.uint8)
+    expected[4:10, 3:9] = 1
+    np.testing.assert_array_equal(crop_quality.pieceMask(img), expected)
+
+
 def test_starred_frame_beats_blurred_frame_of_same_burst() -> None:
     star = crop_quality.scoreCrop(_load("star_e683f68f_seq3.jpg"))
     blur = crop_quality.scoreCrop(_load("blur_e683f68f_seq0.jpg"))
@@ -1,4 +1,7 @@
+import tempfile
 import unittest
+import zipfile
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -282,6 +285,35 @@ class DetectionRouteTests(unittest.TestCase):
         self.assertEqual(0, payload["frame_luma"]["max"])
         self.assertEqual([], payload["sectors"])
 
+    def test_classification_baseline_archive_matches_png_baseline(self) -> None:
+        from vision.diff_configs import ClassificationDiffConfig
+        from vision.vision_manager import VisionManager
+
+        rng = np.random.default_rng(5)
+        base = rng.integers(40, 200, size=(24, 32), dtype=np.uint8)
+        frames = [
+            np.clip(base.astype(np.int16) + rng.integers(-6, 7, size=base.shape), 0, 255).astype(np.uint8)
+            for _ in range(4)
+        ]
+        logger = SimpleNamespace(info=lambda *_: None, warning=lambda *_: None, warn=lambda *_: None)
+        vm = VisionManager.__new__(VisionManager)
+        vm.gc = SimpleNamespace(logger=logger)
+        vm._diff_config = ClassificationDiffConfig()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline_dir = Path(tmp)
+            detection._write_classification_baseline_frames(baseline_dir, "classification_channel", frames)
+
+            with zipfile.ZipFile(baseline_dir / "classification_channel_baseline.npz") as archive:
+                self.assertTrue(all(info.compress_type == zipfile.ZIP_DEFLATED for info in archive.infolist()))
+            from_npz = vm._loadNpzBaseline(baseline_dir, "classification_channel", "gray")
+            from_png = vm._loadPngBaseline(baseline_dir, "classification_channel", "gray")
+
+        self.assertIsNotNone(from_npz)
+        self.assertIsNotNone(from_png)
+        np.testing.assert_array_equal(from_npz[0], from_png[0])
+        np.testing.assert_array_equal(from_npz[1], from_png[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -140,6 +140,24 @@ def test_force_kill_track_returns_false_for_unknown_global_id():
     assert tracker.force_kill_track(global_id=999999) is False
 
 
+def test_update_with_frame_captures_sector_and_piece_crops():
+    tracker, _ = _make_single_tracker()
+    tracker.set_channel_geometry((320.0, 240.0), 100.0, 200.0)
+    frame = np.full((480, 640, 3), 80, dtype=np.uint8)
+
+    tracks = tracker.update([(460, 230, 490, 260)], [0.9], 1.0, frame_bgr=frame)
+
+    assert len(tracks) == 1
+    live = next(iter(tracker._tracks.values()))
+    assert len(live.sector_snapshots) == 1
+    snapshot = live.sector_snapshots[0]
+    assert snapshot.jpeg_b64
+    # Tight piece crop: the bbox plus the 8 px margin on every side.
+    assert snapshot.piece_jpeg_b64
+    assert (snapshot.piece_bbox_x, snapshot.piece_bbox_y) == (452, 222)
+    assert (snapshot.piece_width, snapshot.piece_height) == (46, 46)
+
+
 # ---------------------------------------------------------------------------
 # Phase 2: sector-anchored identity on the C4 platter
 # ---------------------------------------------------------------------------
@@ -0,0 +1,79 @@
+import base64
+
+import cv2
+import numpy as np
+import pytest
+
+from vision.outputs import base64 as b64out
+from vision.outputs import jpeg
+
+
+class _FailingTurbo:
+    def encode(self, *args, **kwargs):
+        raise OSError("tjCompress2 failed")
+
+
+def _frame(channels: int) -> np.ndarray:
+    # Smooth gradients so the JPEG round trip stays within a few levels.
+    ys, xs = np.mgrid[0:96, 0:128]
+    if channels == 1:
+        return ((xs + ys) % 256).astype(np.uint8)
+    return np.dstack(
+        [(xs * 2) % 256, (ys * 2) % 256, (xs + ys) % 256]
+    ).astype(np.uint8)
+
+
+@pytest.fixture(params=["turbo", "cv2", "turbo_error"])
+def encoder_path(request, monkeypatch):
+    if request.param == "turbo":
+        if jpeg._turbo_encoder() is None:
+            pytest.skip("libturbojpeg not available")
+    elif request.param == "cv2":
+        monkeypatch.setattr(jpeg, "_turbo_encoder", lambda: None)
+    else:
+        monkeypatch.setattr(jpeg, "_turbo_encoder", lambda: _FailingTurbo())
+    return request.param
+
+
+@pytest.mark.parametrize("channels", [3, 1])
+def test_encode_jpeg_round_trips(encoder_path, channels):
+    frame = _frame(channels)
+
+    data = jpeg.encode_jpeg(frame, quality=90)
+
+    assert data is not None
+    decoded = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+    assert decoded is not None
+    assert decoded.shape == frame.shape
+    diff = np.abs(decoded.astype(np.int16) - frame.astype(np.int16))
+    assert float(diff.mean()) < 4.0
+
+
+@pytest.mark.parametrize("simd", [True, False])
+def test_base64_output_matches_stdlib(monkeypatch, simd):
+    if simd:
+        if b64out.b64encode_as_string is None:
+            pytest.skip("pybase64 not installed")
+    else:
+        monkeypatch.setattr(b64out, "b64encode_as_string", None)
+    frame = _frame(3)
+
+    encoded = b64out.Base64Output().encode(frame)
+
+    assert encoded == base64.b64encode(jpeg.encode_jpeg(frame)).decode()
+
+
+@pytest.mark.parametrize("simd", [True, False])
+def test_encode_base64_matches_stdlib(monkeypatch, simd):
+    if simd:
+        if b64out.b64encode_as_string is None:
+            pytest.skip("pybase64 not installed")
+    else:
+        monkeypatch.setattr(b64out, "b64encode_as_string", None)
+    rng = np.random.default_rng(3)
+    payloads = [b"", b"\xff", b"ab", b"abc"] + [
+        rng.integers(0, 256, size=n, dtype=np.uint8).tobytes() for n in (1000, 4097, 65536)
+    ]
+
+    for data in payloads:
+        assert b64out.encode_base64(data) == base64.b64encode(data).decode()
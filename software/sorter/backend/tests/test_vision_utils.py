@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import numpy as np
+
+from vision.utils import maskCenterOfMass
+
+
+def test_mask_center_of_mass_matches_pixel_mean() -> None:
+    mask = np.zeros((40, 60), dtype=bool)
+    mask[5:12, 10:30] = True
+    mask[20, 50] = True
+
+    center = maskCenterOfMass(mask)
+
+    ys, xs = np.nonzero(mask)
+    assert center is not None
+    assert abs(center[0] - float(xs.mean())) < 1e-6
+    assert abs(center[1] - float(ys.mean())) < 1e-6
+
+
+def test_mask_center_of_mass_accepts_uint8_and_empty_masks() -> None:
+    mask = np.zeros((10, 10), dtype=np.uint8)
+    assert maskCenterOfMass(mask) is None
+
+    mask[2:4, 6:8] = 255
+    assert maskCenterOfMass(mask) == (6.5, 2.5)
@@ -1,9 +1,10 @@
 """In-memory LRU store for drop-zone burst frames keyed by global_id.
 
 Ring 2 of the drop-zone burst capture feature. Each burst entry is a list of
-frame dicts (role, captured_ts, jpeg_b64) produced by VisionManager.captureBurst
-from the pre/post capture-thread ring buffers. Capped to avoid unbounded
-growth during long runs.
+frame dicts (role, captured_ts, jpeg) produced by VisionManager.captureBurst
+from the pre/post capture-thread ring buffers. Frames are held as raw JPEG
+bytes; VisionManager.getBurstFrames base64-encodes them for the API.
+Capped to avoid unbounded growth during long runs.
 """
 
 from __future__ import annotations
@@ -16,7 +17,7 @@ from typing import TypedDict
 class BurstFrame(TypedDict):
     role: str
     captured_ts: float
-    jpeg_b64: str
+    jpeg: bytes
 
 
 class BurstFrameStore:
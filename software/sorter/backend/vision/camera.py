@@ -742,6 +742,9 @@ class CaptureThread:
         # 90-frame ring buffer (~3 s at 30 FPS) for burst-capture replay. The
         # GIL + deque.append atomicity lets us push without holding a lock.
         self._ring_buffer: deque[CameraFrame] = deque(maxlen=90)
+        # Notified once per captured frame so callers that need a frame newer
+        # than some instant can block instead of sleep-polling latest_frame.
+        self._new_frame = threading.Condition()
         self._picture_settings = clampCameraPictureSettings(config.picture_settings)
         self._device_settings = parseCameraDeviceSettingsForCapture(config.device_settings)
         self._color_profile = clampCameraColorProfile(config.color_profile)
@@ -796,6 +799,30 @@ class CaptureThread:
                 break
         return best
 
+    def wait_for_frame_after(
+        self,
+        timestamp: float,
+        timeout_s: float,
+    ) -> Optional[CameraFrame]:
+        """Block until ``latest_frame`` is newer than ``timestamp``.
+
+        ``timestamp`` is on the same ``time.time()`` clock as
+        ``CameraFrame.timestamp``. Returns the fresh frame, or ``None`` if
+        none arrived within ``timeout_s``. The capture loop publishes
+        ``latest_frame`` before notifying, so checking it under the condition
+        lock cannot miss a wakeup.
+        """
+        deadline = time.monotonic() + max(0.0, timeout_s)
+        with self._new_frame:
+            while True:
+                frame = self.latest_frame
+                if frame is not None and frame.timestamp > timestamp:
+                    return frame
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._new_frame.wait(remaining)
+
     def setPictureSettings(self, settings: CameraPictureSettings) -> None:
         clamped = clampCameraPictureSettings(settings)
         with self._picture_settings_lock:
@@ -1062,7 +1089,7 @@ class CaptureThread:
                 continue
 
             if cap is None:
-                now = time.time()
+                now = time.monotonic()
                 if now < next_open_attempt_at:
                     time.sleep(min(0.1, max(0.01, next_open_attempt_at - now)))
                     continue
@@ -1070,7 +1097,7 @@ class CaptureThread:
                 if not is_url and not _is_macos_camera_index_available(source):
                     self.latest_frame = None
                     open_failures += 1
-                    next_open_attempt_at = time.time() + _capture_failure_backoff_s(open_failures)
+                    next_open_attempt_at = time.monotonic() + _capture_failure_backoff_s(open_failures)
                     time.sleep(min(0.25, _capture_failure_backoff_s(open_failures)))
                     continue
 
@@ -1088,7 +1115,7 @@ class CaptureThread:
                         self._cap = None
                         self.latest_frame = None
                         open_failures += 1
-                        next_open_attempt_at = time.time() + _capture_failure_backoff_s(open_failures)
+                        next_open_attempt_at = time.monotonic() + _capture_failure_backoff_s(open_failures)
                         time.sleep(min(0.25, _capture_failure_backoff_s(open_failures)))
                         continue
 
@@ -1098,7 +1125,7 @@ class CaptureThread:
                     read_failures = 0
                     next_open_attempt_at = 0.0
                     expected_frame_settle_until = (
-                        time.time() + CAPTURE_MODE_SETTLE_S
+                        time.monotonic() + CAPTURE_MODE_SETTLE_S
                         if not is_url and width > 0 and height > 0
                         else 0.0
                     )
@@ -1152,11 +1179,18 @@ class CaptureThread:
             except Exception:
                 ret, frame = False, None
             if ret:
+                # Stamp the frame when the read returns, not after picture
+                # settings / colour correction have run on it. Frame
+                # timestamps stay on the wall clock (consumers compare them to
+                # time.time()); the open backoff and mode-settle bookkeeping
+                # above are pure intervals and use the monotonic clock so an
+                # NTP step can't stall or skip them.
+                captured_at = time.time()
                 read_failures = 0
                 if not is_url and width > 0 and height > 0:
                     frame_h, frame_w = frame.shape[:2]
                     if (int(frame_w), int(frame_h)) != (int(width), int(height)):
-                        now = time.time()
+                        now = time.monotonic()
                         has_recent_expected = (
                             last_expected_frame_at > 0.0
                             and (now - last_expected_frame_at)
@@ -1165,7 +1199,7 @@ class CaptureThread:
                         if now < expected_frame_settle_until or has_recent_expected:
                             continue
                     else:
-                        last_expected_frame_at = time.time()
+                        last_expected_frame_at = time.monotonic()
                 if post_stream_settings is not None and post_stream_source is not None:
                     with self._cap_lock:
                         if cap is not None:
@@ -1190,12 +1224,14 @@ class CaptureThread:
                     raw=corrected_frame,
                     annotated=None,
                     results=[],
-                    timestamp=time.time(),
+                    timestamp=captured_at,
                     uncorrected_raw=geom_frame,
                 )
                 self.latest_frame = camera_frame
                 # deque.append is atomic under the GIL — no lock needed.
                 self._ring_buffer.append(camera_frame)
+                with self._new_frame:
+                    self._new_frame.notify_all()
             else:
                 read_failures += 1
                 # For URL sources, briefly wait then retry (stream may reconnect)
@@ -1206,7 +1242,7 @@ class CaptureThread:
                     self._cap = None
                     self.latest_frame = None
                     if not is_url:
-                        next_open_attempt_at = time.time() + _capture_failure_backoff_s(read_failures)
+                        next_open_attempt_at = time.monotonic() + _capture_failure_backoff_s(read_failures)
 
         if cap is not None:
             cap.release()
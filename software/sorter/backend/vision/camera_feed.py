@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import threading
 from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol
+import cv2
 import numpy as np
 
 from .camera_device import CameraDevice, DeviceHealth
@@ -43,7 +44,12 @@ class CameraFeed:
         self.role = role
         self._device = device
         self._overlays: list[FrameOverlay] = []
-        self._cached_annotated: tuple[tuple[float, bool], CameraFrame] | None = None
+        # Last annotated frame per (excluded categories, color_correct) view,
+        # stored with the timestamp it was rendered for. Keyed per view so a
+        # regions-hidden preview and the full overlay don't evict each other.
+        self._cached_annotated: dict[
+            tuple[Optional[frozenset[str]], bool], tuple[float, CameraFrame]
+        ] = {}
         self._pinned_ts_provider = pinned_ts_provider
         self._lock = threading.Lock()
 
@@ -54,7 +60,7 @@ class CameraFeed:
         """Install (or remove) the detection-frame-timestamp provider."""
         with self._lock:
             self._pinned_ts_provider = provider
-            self._cached_annotated = None
+            self._cached_annotated.clear()
 
     @property
     def device(self) -> CameraDevice:
@@ -67,12 +73,12 @@ class CameraFeed:
     def add_overlay(self, overlay: FrameOverlay) -> None:
         with self._lock:
             self._overlays.append(overlay)
-            self._cached_annotated = None
+            self._cached_annotated.clear()
 
     def clear_overlays(self) -> None:
         with self._lock:
             self._overlays.clear()
-            self._cached_annotated = None
+            self._cached_annotated.clear()
 
     def describe_overlays(
         self,
@@ -158,18 +164,17 @@ class CameraFeed:
                     uncorrected_raw=frame.uncorrected_raw,
                 )
 
-            # Cache only the default (unfiltered) path — keeps the hot loop fast
-            # without per-filter cache bookkeeping.
-            cache_eligible = not exclude_categories
-            cache_key = (frame.timestamp, bool(color_correct))
-            if (
-                cache_eligible
-                and self._cached_annotated is not None
-                and self._cached_annotated[0] == cache_key
-            ):
-                return self._cached_annotated[1]
-
-            result_img = raw.copy()
+            # Every preview viewer pulls the same frame, and a viewer with
+            # regions hidden used to re-run the whole overlay pipeline for it
+            # on each pull; cache per view, not just the unfiltered one.
+            view_key = (exclude_categories or None, bool(color_correct))
+            cached = self._cached_annotated.get(view_key)
+            if cached is not None and cached[0] == frame.timestamp:
+                return cached[1]
+
+            # Overlays draw in BGR; a mono8 raw is expanded here, on the
+            # annotated path only, instead of being captured as 3 channels.
+            result_img = cv2.cvtColor(raw, cv2.COLOR_GRAY2BGR) if raw.ndim == 2 else raw.copy()
             for overlay in active_overlays:
                 result_img = overlay.annotate(result_img)
 
@@ -181,6 +186,5 @@ class CameraFeed:
                 segmentation_map=frame.segmentation_map,
                 uncorrected_raw=frame.uncorrected_raw,
             )
-            if cache_eligible:
-                self._cached_annotated = (cache_key, result)
+            self._cached_annotated[view_key] = (frame.timestamp, result)
             return result
@@ -75,12 +75,16 @@ class ClassificationAnalysisThread:
             prof.mark(f"{prefix}.loop.interval_ms")
 
             with prof.timer(f"{prefix}.loop.total_ms"):
-                with prof.timer(f"{prefix}.get_gray_ms"):
-                    gray = self._get_gray()
-
-                if gray is not None:
-                    with prof.timer(f"{prefix}.push_frame_ms"):
-                        self._heatmap.pushFrame(gray)
+                # The loop runs faster than the heatmap ring's capture
+                # throttle; only build the full-res diff frame (gray or LAB)
+                # on ticks whose frame the ring will actually keep.
+                if self._heatmap.wantsFrame():
+                    with prof.timer(f"{prefix}.get_gray_ms"):
+                        gray = self._get_gray()
+
+                    if gray is not None:
+                        with prof.timer(f"{prefix}.push_frame_ms"):
+                            self._heatmap.pushFrame(gray)
 
                 bboxes: List[Tuple[int, int, int, int]] = []
                 if self._heatmap.has_baseline:
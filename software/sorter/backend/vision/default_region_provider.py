@@ -50,7 +50,8 @@ class DefaultRegionProvider:
         return regions
 
     def annotateFrame(self, frame: np.ndarray) -> np.ndarray:
-        annotated = frame.copy()
+        """Draw the default region boxes onto ``frame`` in place."""
+        annotated = frame
         half = DEFAULT_REGION_SIZE // 2
         for name, (cx, cy, color) in DEFAULT_REGION_POSITIONS.items():
             cv2.rectangle(
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -21,6 +22,76 @@ DROPZONE_COLOR = (0, 200, 0)
 PRECISE_COLOR = (0, 100, 255)
 PRECISE_ZONE_COLOR = (168, 85, 248)
 
+# Angle offsets (degrees) of the arc samples for every section wedge,
+# relative to the channel's section-zero angle: 8 samples per section.
+_SECTION_WEDGE_OFFSETS = (
+    np.arange(CHANNEL_SECTION_COUNT, dtype=np.float64)[:, None] * CHANNEL_SECTION_DEG
+    + np.linspace(0.0, CHANNEL_SECTION_DEG, 8)[None, :]
+)
+
+
+def _sectionWedgePolygons(
+    cx: int, cy: int, radius: int, section_zero_angle: float,
+) -> np.ndarray:
+    """(CHANNEL_SECTION_COUNT, 9, 2) int32 wedges: the center + 8 arc points.
+
+    Computed for all sections in one vectorized pass instead of a scalar
+    np.cos/np.sin round-trip for every arc sample of every filled section.
+    """
+    cos_t, sin_t = _sectionWedgeUnits(float(section_zero_angle))
+    wedges = np.empty((CHANNEL_SECTION_COUNT, 9, 2), dtype=np.int32)
+    wedges[:, 0, 0] = cx
+    wedges[:, 0, 1] = cy
+    wedges[:, 1:, 0] = cx + radius * cos_t
+    wedges[:, 1:, 1] = cy + radius * sin_t
+    return wedges
+
+
+@lru_cache(maxsize=8)
+def _sectionWedgeUnits(section_zero_angle: float) -> tuple[np.ndarray, np.ndarray]:
+    # The section-zero angle only changes when a channel is recalibrated, so
+    # the unit-circle table is computed once per angle, not once per frame.
+    angles = np.radians(section_zero_angle + _SECTION_WEDGE_OFFSETS)
+    cos_t = np.cos(angles)
+    sin_t = np.sin(angles)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
+def _fillSectionWedges(
+    canvas: np.ndarray,
+    wedges: np.ndarray,
+    dz_sections,
+    ex_sections,
+    offset: tuple[int, int] = (0, 0),
+) -> None:
+    """Fill the dropzone/exit section wedges, one fillPoly per color run.
+
+    Exit sections win over dropzone ones. Consecutive sections of the same
+    color go to a single multi-polygon fillPoly, and the runs are drawn in
+    section order, so shared wedge edges end up the same color as with one
+    fillPoly per section (up to CHANNEL_SECTION_COUNT calls per channel).
+    """
+    run: list[np.ndarray] = []
+    run_fill: tuple[int, int, int] | None = None
+    for q in range(CHANNEL_SECTION_COUNT):
+        if q in ex_sections:
+            fill = PRECISE_COLOR
+        elif q in dz_sections:
+            fill = DROPZONE_COLOR
+        else:
+            fill = None
+        # A non-empty run always has a colour; the check narrows it.
+        if fill != run_fill and run and run_fill is not None:
+            cv2.fillPoly(canvas, run, run_fill, offset=offset)
+            run = []
+        run_fill = fill
+        if fill is not None:
+            run.append(wedges[q])
+    if run and run_fill is not None:
+        cv2.fillPoly(canvas, run, run_fill, offset=offset)
+
 
 def parseSavedChannelArcZones(*args, **kwargs):
     from subsystems.feeder.analysis import parseSavedChannelArcZones as _impl
@@ -100,6 +171,18 @@ class HanddrawnRegionProvider:
         # doesn't change between frames, so render once and blend onto the
         # frame's bbox slice. Bumped via _revision on reloadPolygons.
         self._channel_sprite_cache: dict = {}
+        # annotateFrame rebuilt a full-frame channel mask (np.zeros + two
+        # fillPoly) for each channel on every frame; the mask and outlines
+        # only change with the frame size or a polygon reload.
+        self._channel_mask_cache: dict = {}
+        # Arc-zone band polygons for the per-frame zone fill, keyed by
+        # (channel, zone, center, radii, fallback angles). They only depend
+        # on the saved arc params, so the cos/sin pass runs once per layout.
+        self._arc_zone_polygon_cache: dict = {}
+        # (saved carousel point list, int32 vertices, truncated centroid) for
+        # the unified-mode carousel outline; a hit requires the very same
+        # list object, so a reload (which swaps _polygons) rebuilds it.
+        self._carousel_outline: tuple | None = None
         self._revision: int = 0
         self._loadPolygons()
 
@@ -108,6 +191,9 @@ class HanddrawnRegionProvider:
         self._cached_regions = {}
         self._cached_frame_shape = (0, 0)
         self._channel_sprite_cache = {}
+        self._channel_mask_cache = {}
+        self._arc_zone_polygon_cache = {}
+        self._carousel_outline = None
         self._revision += 1
 
     def _loadPolygons(self) -> None:
@@ -133,6 +219,9 @@ class HanddrawnRegionProvider:
         self._cached_regions = {}
         self._cached_frame_shape = (0, 0)
         self._channel_sprite_cache = {}
+        self._channel_mask_cache = {}
+        self._arc_zone_polygon_cache = {}
+        self._carousel_outline = None
         self._revision += 1
 
     def _channelMask(
@@ -161,10 +250,26 @@ class HanddrawnRegionProvider:
         pts = np.array(pts_list, dtype=np.int32)
         mask = np.zeros((h, w), dtype=np.uint8)
         cv2.fillPoly(mask, [pts], 255)
-        center = (float(np.mean(pts[:, 0])), float(np.mean(pts[:, 1])))
+        sum_x, sum_y = pts.sum(axis=0).tolist()
+        center = (sum_x / len(pts), sum_y / len(pts))
         radius = float(np.max(np.linalg.norm(pts - np.array(center), axis=1)))
         return mask, pts, None, center, radius
 
+    def _cachedChannelMask(
+        self,
+        h: int,
+        w: int,
+        poly_key: str,
+        pts_list: list[list[int]],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray | None, tuple[float, float], float]:
+        """``_channelMask`` memoized per (poly_key, h, w, revision); read-only."""
+        cache_key = (poly_key, h, w, self._revision)
+        cached = self._channel_mask_cache.get(cache_key)
+        if cached is None:
+            cached = self._channelMask(h, w, poly_key, pts_list)
+            self._channel_mask_cache[cache_key] = cached
+        return cached
+
     def start(self) -> None:
         pass
 
@@ -266,6 +371,31 @@ class HanddrawnRegionProvider:
         outer_radius: float,
         fallback_start_angle: float,
         fallback_end_angle: float,
+    ) -> np.ndarray | None:
+        cache_key = (
+            channel_key, zone_key, center, inner_radius, outer_radius,
+            fallback_start_angle, fallback_end_angle,
+        )
+        if cache_key in self._arc_zone_polygon_cache:
+            return self._arc_zone_polygon_cache[cache_key]
+        points = self._buildArcZonePolygon(
+            channel_key, zone_key, center, inner_radius, outer_radius,
+            fallback_start_angle, fallback_end_angle,
+        )
+        if points is not None:
+            points.setflags(write=False)
+        self._arc_zone_polygon_cache[cache_key] = points
+        return points
+
+    def _buildArcZonePolygon(
+        self,
+        channel_key: str,
+        zone_key: str,
+        center: tuple[float, float],
+        inner_radius: float,
+        outer_radius: float,
+        fallback_start_angle: float,
+        fallback_end_angle: float,
     ) -> np.ndarray | None:
         raw_arc = self._arc_params.get(channel_key) if isinstance(self._arc_params, dict) else None
         if not isinstance(raw_arc, dict):
@@ -287,20 +417,22 @@ class HanddrawnRegionProvider:
         inner_segments = max(8, int(round((inner_span / 360.0) * 64.0)))
         cx, cy = center
 
-        points: list[tuple[int, int]] = []
-        for i in range(outer_segments + 1):
-            angle = np.deg2rad(start_outer + (outer_span * i) / outer_segments)
-            points.append((
-                int(round(cx + outer_radius * np.cos(angle))),
-                int(round(cy + outer_radius * np.sin(angle))),
-            ))
-        for i in range(inner_segments, -1, -1):
-            angle = np.deg2rad(start_inner + (inner_span * i) / inner_segments)
-            points.append((
-                int(round(cx + inner_radius * np.cos(angle))),
-                int(round(cy + inner_radius * np.sin(angle))),
-            ))
-        return np.array(points, dtype=np.int32)
+        # Outer arc forward, then inner arc backward, as one angle/radius
+        # vector so the whole band is a single vectorized cos/sin pass.
+        outer_steps = np.arange(outer_segments + 1, dtype=np.float64)
+        inner_steps = np.arange(inner_segments, -1, -1, dtype=np.float64)
+        angles = np.deg2rad(np.concatenate((
+            start_outer + (outer_span * outer_steps) / outer_segments,
+            start_inner + (inner_span * inner_steps) / inner_segments,
+        )))
+        radii = np.concatenate((
+            np.full(outer_segments + 1, outer_radius, dtype=np.float64),
+            np.full(inner_segments + 1, inner_radius, dtype=np.float64),
+        ))
+        points = np.empty((len(angles), 2), dtype=np.int32)
+        points[:, 0] = np.round(cx + radii * np.cos(angles))
+        points[:, 1] = np.round(cy + radii * np.sin(angles))
+        return points
 
     def _fillArcZoneOverlay(
         self,
@@ -308,6 +440,7 @@ class HanddrawnRegionProvider:
         channel_key: str,
         center: tuple[float, float],
         radius_scale: float,
+        offset: tuple[int, int] = (0, 0),
     ) -> bool:
         arc = parseSavedChannelArcZones(channel_key, self._channel_angles, self._arc_params)
         if arc is None or arc.outer_radius <= arc.inner_radius or arc.inner_radius <= 0:
@@ -349,15 +482,20 @@ class HanddrawnRegionProvider:
         if drop_poly is None and exit_poly is None and precise_poly is None:
             return False
         if drop_poly is not None:
-            cv2.fillPoly(overlay, [drop_poly], DROPZONE_COLOR)
+            cv2.fillPoly(overlay, [drop_poly], DROPZONE_COLOR, offset=offset)
         if exit_poly is not None:
-            cv2.fillPoly(overlay, [exit_poly], PRECISE_COLOR)
+            cv2.fillPoly(overlay, [exit_poly], PRECISE_COLOR, offset=offset)
         if precise_poly is not None:
-            cv2.fillPoly(overlay, [precise_poly], PRECISE_ZONE_COLOR)
+            cv2.fillPoly(overlay, [precise_poly], PRECISE_ZONE_COLOR, offset=offset)
         return True
 
     def annotateFrame(self, frame: np.ndarray) -> np.ndarray:
-        annotated = frame.copy()
+        """Draw the channel and carousel zones onto ``frame`` in place.
+
+        The overlay pipeline hands every pass its own working copy, so this
+        no longer pays for another full-frame copy before drawing.
+        """
+        annotated = frame
 
         for poly_key, region_name, label in [
             ("second_channel", RegionName.CHANNEL_2, "Ch2"),
@@ -373,7 +511,7 @@ class HanddrawnRegionProvider:
                 float(self._channel_angles.get(angle_key, 0.0)),
                 parseSavedChannelArcZones(angle_key, self._channel_angles, self._arc_params),
             )
-            ch_mask, pts, inner_pts, center, disp_r = self._channelMask(
+            ch_mask, pts, inner_pts, center, disp_r = self._cachedChannelMask(
                 annotated.shape[0],
                 annotated.shape[1],
                 poly_key,
@@ -388,29 +526,33 @@ class HanddrawnRegionProvider:
             disp_r = int(disp_r)
             r1_angle = self._channel_angles.get(angle_key, 0.0)
 
-            # low-opacity fill for dropzone and precise sections
-            overlay = annotated.copy()
-            if not self._fillArcZoneOverlay(overlay, angle_key, (float(center[0]), float(center[1])), 1.0):
-                for q in range(CHANNEL_SECTION_COUNT):
-                    if q in ex_sections:
-                        fill = PRECISE_COLOR
-                    elif q in dz_sections:
-                        fill = DROPZONE_COLOR
-                    else:
-                        continue
-                    arc_pts = [(cx, cy)]
-                    for a in np.linspace(
-                        r1_angle + q * CHANNEL_SECTION_DEG,
-                        r1_angle + (q + 1) * CHANNEL_SECTION_DEG,
-                        8,
-                    ):
-                        arc_pts.append((
-                            int(cx + disp_r * np.cos(np.radians(a))),
-                            int(cy + disp_r * np.sin(np.radians(a))),
-                        ))
-                    cv2.fillPoly(overlay, [np.array(arc_pts, dtype=np.int32)], fill)
-            overlay[ch_mask == 0] = annotated[ch_mask == 0]
-            annotated = cv2.addWeighted(overlay, 0.18, annotated, 0.82, 0)
+            # low-opacity fill for dropzone and precise sections. The fill
+            # never leaves the channel mask, so copy + blend only the
+            # channel's bounding box in place instead of a full-frame
+            # .copy() and a full-frame cv2.addWeighted result per channel.
+            bx, by, bw, bh = cv2.boundingRect(pts)
+            x1, y1 = max(0, bx), max(0, by)
+            x2 = min(annotated.shape[1], bx + bw)
+            y2 = min(annotated.shape[0], by + bh)
+            if x2 > x1 and y2 > y1:
+                roi = annotated[y1:y2, x1:x2]
+                overlay = roi.copy()
+                offset = (-x1, -y1)
+                if not self._fillArcZoneOverlay(
+                    overlay, angle_key, (float(center[0]), float(center[1])), 1.0, offset=offset
+                ):
+                    _fillSectionWedges(
+                        overlay,
+                        _sectionWedgePolygons(cx, cy, disp_r, r1_angle),
+                        dz_sections,
+                        ex_sections,
+                        offset=offset,
+                    )
+                # Blend into a scratch ROI and copy back only the pixels
+                # inside the channel mask, instead of restoring the outside
+                # pixels with two boolean-index copies before the blend.
+                blended = cv2.addWeighted(overlay, 0.18, roi, 0.82, 0)
+                cv2.copyTo(blended, ch_mask[y1:y2, x1:x2], roi)
 
             cv2.putText(annotated, label, (cx - 20, cy - disp_r - 10),
                         cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
@@ -418,11 +560,9 @@ class HanddrawnRegionProvider:
         # draw carousel polygon (only in unified feeder mode)
         carousel_pts = self._polygons.get("carousel")
         if carousel_pts and len(carousel_pts) >= 3:
-            pts = np.array(carousel_pts, dtype=np.int32)
+            pts, (cx, cy) = self._carouselOutline(carousel_pts)
             color = CHANNEL_COLORS[RegionName.CAROUSEL_PLATFORM]
             cv2.polylines(annotated, [pts], isClosed=True, color=color, thickness=2)
-            cx = int(np.mean(pts[:, 0]))
-            cy = int(np.mean(pts[:, 1]))
             cv2.putText(
                 annotated, "Carousel", (cx - 30, cy + 10),
                 cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2,
@@ -430,6 +570,27 @@ class HanddrawnRegionProvider:
 
         return annotated
 
+    def _carouselOutline(
+        self, carousel_pts: list[list[int]]
+    ) -> tuple[np.ndarray, tuple[int, int]]:
+        """Saved carousel polygon as int32 vertices plus its label anchor.
+
+        annotateFrame used to convert the saved point list to an array and
+        reduce it on every frame; both only change on a polygon reload.
+        """
+        cached = self._carousel_outline
+        if cached is not None and cached[0] is carousel_pts:
+            return cached[1], cached[2]
+        pts = np.array(carousel_pts, dtype=np.int32)
+        pts.setflags(write=False)
+        # One reduction over the vertex array for both coordinates instead
+        # of two strided np.mean passes; int sums are exact, so the
+        # truncated centroid is unchanged.
+        sum_x, sum_y = pts.sum(axis=0).tolist()
+        centroid = (int(sum_x / len(pts)), int(sum_y / len(pts)))
+        self._carousel_outline = (carousel_pts, pts, centroid)
+        return pts, centroid
+
     def _savedResolutionForPolygonKey(self, poly_key: str) -> tuple[int, int]:
         """Return the editor resolution for a specific channel polygon."""
         channel_key = (
@@ -485,7 +646,8 @@ class HanddrawnRegionProvider:
         pts = pts.astype(np.int32)
         mask = np.zeros((h, w), dtype=np.uint8)
         cv2.fillPoly(mask, [pts], 255)
-        center = (float(np.mean(pts[:, 0])), float(np.mean(pts[:, 1])))
+        sum_x, sum_y = pts.sum(axis=0).tolist()
+        center = (sum_x / len(pts), sum_y / len(pts))
         radius = float(np.max(np.linalg.norm(pts - np.array(center), axis=1)))
         return mask, pts, None, center, radius
 
@@ -605,13 +767,16 @@ class HanddrawnRegionProvider:
 
         # Bbox covers the polygon, the channel mask, the label position, and
         # any arc-zone fills that may extend slightly beyond. Pad a little.
-        ys, xs = np.where(ch_mask > 0)
-        if len(xs) == 0:
+        # boundingRect finds the mask extents in one pass over the uint8
+        # mask, instead of np.where materializing an int64 coordinate pair
+        # for every pixel of a full-frame channel mask.
+        mx, my, mw, mh = cv2.boundingRect(ch_mask)
+        if mw == 0:
             return None
-        x1 = int(min(xs.min(), pts[:, 0].min()))
-        y1 = int(min(ys.min(), pts[:, 1].min(), cy - disp_r - 30))
-        x2 = int(max(xs.max(), pts[:, 0].max()))
-        y2 = int(max(ys.max(), pts[:, 1].max()))
+        x1 = int(min(mx, pts[:, 0].min()))
+        y1 = int(min(my, pts[:, 1].min(), cy - disp_r - 30))
+        x2 = int(max(mx + mw - 1, pts[:, 0].max()))
+        y2 = int(max(my + mh - 1, pts[:, 1].max()))
         if inner_pts is not None and len(inner_pts) >= 3:
             x1 = min(x1, int(inner_pts[:, 0].min()))
             y1 = min(y1, int(inner_pts[:, 1].min()))
@@ -634,24 +799,12 @@ class HanddrawnRegionProvider:
         if not self._fillArcZoneOverlay(
             full_fill, angle_key, (float(center[0]), float(center[1])), r_scale
         ):
-            for q in range(CHANNEL_SECTION_COUNT):
-                if q in ex_sections:
-                    fill = PRECISE_COLOR
-                elif q in dz_sections:
-                    fill = DROPZONE_COLOR
-                else:
-                    continue
-                arc_pts = [(cx, cy)]
-                for a in np.linspace(
-                    r1_angle + q * CHANNEL_SECTION_DEG,
-                    r1_angle + (q + 1) * CHANNEL_SECTION_DEG,
-                    8,
-                ):
-                    arc_pts.append((
-                        int(cx + disp_r * np.cos(np.radians(a))),
-                        int(cy + disp_r * np.sin(np.radians(a))),
-                    ))
-                cv2.fillPoly(full_fill, [np.array(arc_pts, dtype=np.int32)], fill)
+            _fillSectionWedges(
+                full_fill,
+                _sectionWedgePolygons(cx, cy, disp_r, r1_angle),
+                dz_sections,
+                ex_sections,
+            )
         fill_layer[:] = full_fill[y1:y2, x1:x2]
         fill_mask = (ch_mask_local > 0).astype(np.uint8) * 255
         # Erase fill outside ch_mask so the blend's no-op pixels stay zero
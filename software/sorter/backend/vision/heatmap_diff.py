@@ -1,6 +1,9 @@
+import math
+import os
 import time
 from collections import deque
-from typing import Optional, List, Tuple, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, List, Tuple, Union, TYPE_CHECKING
 
 import cv2
 import numpy as np
@@ -22,15 +25,45 @@ HOT_ERODE_ITERS = 1
 HOT_REGROW_ITERS = 1
 MAX_CONTOUR_ASPECT_RATIO = 3.0
 COLOR_THRESH_AB = 0
-
-
-def _makePlatformMask(corners: List[Tuple[float, float]], shape: Tuple[int, ...]) -> np.ndarray:
+# Opt-in: approximate the elliptical erode/regrow with an octagon built from
+# 3x3 cross + 3x3 square passes. Each pass touches 5/9 neighbours, so the
+# cost grows with the radius instead of the ellipse area (a 13x13 ellipse
+# iterated 4x is ~530 comparisons per pixel vs ~150). The octagon is within
+# a pixel of the disk on the axes and diagonals but is not bit-identical, so
+# the exact elliptical SE stays the default.
+HEATMAP_OCTAGON_MORPH = os.environ.get("SORTER_HEATMAP_OCTAGON_MORPH", "0") == "1"
+_CROSS_3 = cv2.getStructuringElement(cv2.MORPH_CROSS, (3, 3))
+_RECT_3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+
+
+def _makePlatformMask(corners: Union[List[Tuple[float, float]], np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
     mask = np.zeros(shape[:2], dtype=np.uint8)
-    pts = np.array([[int(x), int(y)] for x, y in corners], dtype=np.int32)
+    pts = np.asarray(corners, dtype=np.float64).astype(np.int32)
     cv2.fillPoly(mask, [pts], 255)
     return mask
 
 
+@lru_cache(maxsize=16)
+def _ellipseKernel(radius: int) -> np.ndarray:
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (radius * 2 + 1, radius * 2 + 1))
+    kernel.setflags(write=False)
+    return kernel
+
+
+def _octagonMorph(img: np.ndarray, op, radius: int) -> np.ndarray:
+    # Minkowski sum of `axis` crosses (L1 ball) and `diag` squares (Chebyshev
+    # ball) is an octagon reaching `radius` on the axes; diag = r*(sqrt2 - 1)
+    # puts its diagonal faces on the disk too.
+    diag = int(round(radius * (math.sqrt(2.0) - 1.0)))
+    axis = radius - diag
+    out = img
+    if axis > 0:
+        out = op(out, _CROSS_3, iterations=axis)
+    if diag > 0:
+        out = op(out, _RECT_3, iterations=diag)
+    return out
+
+
 def _averageGrays(frames: List[np.ndarray]) -> np.ndarray:
     acc = frames[0].astype(np.float32)
     for f in frames[1:]:
@@ -80,6 +113,11 @@ class HeatmapDiff:
         self._scale = scale
         self._full_size: Optional[Tuple[int, int]] = None
         self._cached_result: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # (corners, shape, mask) of the last rasterized platform mask. The
+        # carousel polygon list is replaced (not mutated) when zones reload,
+        # so identity + shape is enough to reuse the full-frame mask across
+        # baseline captures.
+        self._platform_mask_cache: Optional[Tuple[object, Tuple[int, ...], np.ndarray]] = None
 
     @property
     def has_baseline(self) -> bool:
@@ -99,6 +137,14 @@ class HeatmapDiff:
         new_w, new_h = int(w * self._scale), int(h * self._scale)
         return cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
 
+    def wantsFrame(self) -> bool:
+        """True when the next ``pushFrame`` would be kept in the ring.
+
+        Lets producers skip the BGR->gray conversion for frames that the
+        CAPTURE_INTERVAL_MS throttle would drop anyway.
+        """
+        return (time.time() - self._last_ring_time) * 1000 >= CAPTURE_INTERVAL_MS
+
     def pushFrame(self, frame: np.ndarray) -> None:
         now = time.time()
         if (now - self._last_ring_time) * 1000 >= CAPTURE_INTERVAL_MS:
@@ -118,13 +164,13 @@ class HeatmapDiff:
         if avg is None:
             return False
         if self._scale < 1.0:
-            scaled_corners = [(x * self._scale, y * self._scale) for x, y in corners]
+            scaled_corners = np.asarray(corners, dtype=np.float64) * self._scale
             scaled_shape = (int(shape[0] * self._scale), int(shape[1] * self._scale))
             self._full_size = (shape[1], shape[0])
         else:
             scaled_corners = corners
             scaled_shape = shape
-        mask = _makePlatformMask(scaled_corners, scaled_shape)
+        mask = self._platformMask(corners, scaled_corners, scaled_shape)
         self._baseline_gray = cv2.bitwise_and(avg, avg, mask=mask)
         self._baseline_min = None
         self._baseline_max = None
@@ -134,6 +180,20 @@ class HeatmapDiff:
         self._cached_result = None
         return True
 
+    def _platformMask(
+        self,
+        corners: List[Tuple[float, float]],
+        scaled_corners: Union[List[Tuple[float, float]], np.ndarray],
+        scaled_shape: Tuple[int, ...],
+    ) -> np.ndarray:
+        cached = self._platform_mask_cache
+        shape_key = tuple(scaled_shape[:2])
+        if cached is not None and cached[0] is corners and cached[1] == shape_key:
+            return cached[2]
+        mask = _makePlatformMask(scaled_corners, scaled_shape)
+        self._platform_mask_cache = (corners, shape_key, mask)
+        return mask
+
     def setBaselineEnvelope(self, frames: List[np.ndarray], mask: np.ndarray) -> bool:
         if not frames:
             return False
@@ -243,29 +303,36 @@ class HeatmapDiff:
             raw_hot_ab = diff_ab > self._color_thresh_ab
         raw_hot = ((raw_hot_l | raw_hot_ab) & mask_bool).astype(np.uint8) * 255
         ek = max(1, scaled_thickness // 2)
-        erode_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (ek * 2 + 1, ek * 2 + 1))
         erode_iters = max(1, int(self._hot_erode_iters))
-        eroded = cv2.erode(raw_hot, erode_kernel, iterations=erode_iters)
         regrow_iters = max(0, int(self._hot_regrow_iters))
         rk = max(1, ek // 2)
-        regrow_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (rk * 2 + 1, rk * 2 + 1))
-        if regrow_iters > 0:
-            regrown = cv2.dilate(eroded, regrow_kernel, iterations=regrow_iters)
+        if HEATMAP_OCTAGON_MORPH:
+            eroded = _octagonMorph(raw_hot, cv2.erode, ek * erode_iters)
+            regrown = _octagonMorph(eroded, cv2.dilate, rk * regrow_iters)
         else:
-            regrown = eroded
+            eroded = cv2.erode(raw_hot, _ellipseKernel(ek), iterations=erode_iters)
+            if regrow_iters > 0:
+                regrown = cv2.dilate(eroded, _ellipseKernel(rk), iterations=regrow_iters)
+            else:
+                regrown = eroded
         clean_hot = cv2.bitwise_and(regrown, raw_hot)
         contours, _ = cv2.findContours(clean_hot, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         hot = np.zeros_like(raw_hot)
+        max_aspect = self._max_contour_aspect
+        kept = []
         for contour in contours:
             if cv2.contourArea(contour) < scaled_min_area:
                 continue
-            (_, _), (mar_w, mar_h), _ = cv2.minAreaRect(contour)
+            mar_w, mar_h = cv2.minAreaRect(contour)[1]
             mar_short = min(mar_w, mar_h)
-            mar_long = max(mar_w, mar_h)
-            mar_aspect = mar_long / mar_short if mar_short > 0 else 999.0
-            if mar_aspect > self._max_contour_aspect:
+            mar_aspect = max(mar_w, mar_h) / mar_short if mar_short > 0 else 999.0
+            if mar_aspect > max_aspect:
                 continue
-            cv2.drawContours(hot, [contour], -1, 255, -1)
+            kept.append(contour)
+        # RETR_EXTERNAL contours are disjoint, so one filled draw over all the
+        # survivors paints the same pixels as a draw call per contour.
+        if kept:
+            cv2.drawContours(hot, kept, -1, 255, -1)
 
         score_map = diff_l if diff_ab is None else np.maximum(diff_l, diff_ab)
         result = (score_map, hot > 0, mask_bool)
@@ -338,13 +405,17 @@ class HeatmapDiff:
 
         heatmap = cv2.applyColorMap(display, cv2.COLORMAP_JET)
 
-        out = annotated.copy()
-        out[mask_up] = (annotated[mask_up] * 0.5).astype(np.uint8)
+        # Draws in place — the overlay pipeline hands us its own working
+        # copy. The hot pixels sit inside the mask, so their heat blend is
+        # taken from the undimmed frame before the dimming pass.
+        out = annotated
         show_heat = hot_up & (display > 0)
-        out[show_heat] = (
+        heat_blend = (
             annotated[show_heat].astype(np.float32) * 0.2
             + heatmap[show_heat].astype(np.float32) * 0.8
         ).clip(0, 255).astype(np.uint8)
+        out[mask_up] = (annotated[mask_up] * 0.5).astype(np.uint8)
+        out[show_heat] = heat_blend
 
         triggered = score >= self._trigger_score
         color = (0, 0, 255) if triggered else (0, 255, 0)
@@ -166,13 +166,15 @@ def _decode_hailo_yolo(
             array = array.reshape(-1, array.shape[-1])
         if array.ndim != 2 or array.shape[1] < 5:
             raise RuntimeError(f"Unexpected Hailo YOLO output shape: {array.shape}")
-        for row in array:
+        # Drop sub-threshold rows in one vectorized pass and convert the
+        # survivors to Python lists in bulk, instead of touching every NMS
+        # slot (mostly empty) and re-listing each row per decode attempt.
+        candidates = array[~(array[:, 4] < conf_threshold)]
+        for row in candidates.tolist():
             score = float(row[4])
-            if score < conf_threshold:
-                continue
-            box = _decode_hailo_yolo_box(row.tolist(), preprocess=preprocess, assume_yxyx=True)
+            box = _decode_hailo_yolo_box(row, preprocess=preprocess, assume_yxyx=True)
             if box is None:
-                box = _decode_hailo_yolo_box(row.tolist(), preprocess=preprocess, assume_yxyx=False)
+                box = _decode_hailo_yolo_box(row, preprocess=preprocess, assume_yxyx=False)
             if box is None:
                 continue
             boxes.append(box)
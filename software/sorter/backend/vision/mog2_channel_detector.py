@@ -127,8 +127,25 @@ class Mog2ChannelDetector:
         self._combined_mask: np.ndarray | None = None
         self._last_fg: np.ndarray | None = None
         self._last_detections: List[ChannelDetection] = []
+        self._overlay_polylines: tuple[tuple, list] | None = None
+        self._overlay_mask: tuple[np.ndarray, tuple[int, int], np.ndarray] | None = None
         self._is_channel_rotating = is_channel_rotating
         self._cfg = cfg
+        # The config is fixed for the detector's lifetime (the subtractors
+        # already bake in history / var_threshold / n_mixtures), so resolve
+        # the per-frame knobs and the morphology kernel once here instead of
+        # re-reading and re-casting every config attribute on each detect().
+        self._color_mode = str(cfg.color_mode).lower()
+        blur_k = int(cfg.blur_kernel) | 1
+        morph_k = int(cfg.morph_kernel) | 1
+        self._blur_ksize = (blur_k, blur_k)
+        self._morph_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (morph_k, morph_k))
+        self._learning_rate = float(cfg.learning_rate)
+        self._min_contour_area = float(cfg.min_contour_area)
+        self._max_contour_area = int(cfg.max_contour_area)
+        self._fg_threshold = int(cfg.fg_threshold)
+        self._dilate_iterations = int(cfg.dilate_iterations)
+        self._heat_gain = float(cfg.heat_gain)
 
         for key, polygon in channel_polygons.items():
             if len(polygon) < 3:
@@ -162,11 +179,13 @@ class Mog2ChannelDetector:
             changed = ch.ensure_shape(shape) or changed
         if changed:
             self._combined_mask = None
+            self._overlay_polylines = None
+            self._overlay_mask = None
             self._last_fg = None
             self._last_detections = []
 
     def _mog2InputFrame(self, frame: np.ndarray) -> np.ndarray:
-        mode = str(self._cfg.color_mode).lower()
+        mode = self._color_mode
         if frame.ndim == 2:
             if mode == "gray":
                 return frame
@@ -190,15 +209,13 @@ class Mog2ChannelDetector:
             mog2_frame = cv2.resize(mog2_frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
             bbox_scale = in_w / float(new_w)
         self._ensure_shape(mog2_frame.shape[:2])
-        blur_k = int(self._cfg.blur_kernel) | 1
-        morph_k = int(self._cfg.morph_kernel) | 1
-        learning_rate = float(self._cfg.learning_rate)
-        min_contour_area = float(self._cfg.min_contour_area)
-        max_contour_area = int(self._cfg.max_contour_area)
-        fg_threshold = int(self._cfg.fg_threshold)
-        dilate_iterations = int(self._cfg.dilate_iterations)
-        blurred = cv2.GaussianBlur(mog2_frame, (blur_k, blur_k), 0)
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (morph_k, morph_k))
+        learning_rate = self._learning_rate
+        min_contour_area = self._min_contour_area
+        max_contour_area = self._max_contour_area
+        fg_threshold = self._fg_threshold
+        dilate_iterations = self._dilate_iterations
+        blurred = cv2.GaussianBlur(mog2_frame, self._blur_ksize, 0)
+        kernel = self._morph_kernel
 
         detections: List[ChannelDetection] = []
         fg_combined = np.zeros(mog2_frame.shape[:2], dtype=np.uint8)
@@ -217,7 +234,9 @@ class Mog2ChannelDetector:
             fg_clean = cv2.morphologyEx(fg_clean, cv2.MORPH_CLOSE, kernel)
             if dilate_iterations > 0:
                 fg_clean = cv2.dilate(fg_clean, kernel, iterations=dilate_iterations)
-            fg_combined = cv2.bitwise_or(fg_combined, fg_clean)
+            # OR into the one accumulator in place rather than allocating a
+            # fresh full-frame result per channel.
+            cv2.bitwise_or(fg_combined, fg_clean, dst=fg_combined)
 
             contours, _ = cv2.findContours(fg_clean, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             for contour in contours:
@@ -248,45 +267,55 @@ class Mog2ChannelDetector:
         # smaller shape; the annotate frame comes from the full camera feed.
         # Upsampling cached state for the draw avoids resetting the MOG2
         # model on every overlay call.
-        out = frame.copy()
+        #
+        # Draws in place: the overlay pipeline already owns ``frame`` as a
+        # fresh copy of the raw capture, so a second full-frame copy here
+        # only moved another W*H*3 bytes per annotated frame.
+        out = frame
         h, w = frame.shape[:2]
 
         if self._channels:
             first = next(iter(self._channels.values()))
             expected_shape = first.mask.shape[:2]
             if self._combined_mask is None or self._combined_mask.shape[:2] != expected_shape:
-                self._combined_mask = np.zeros(expected_shape, dtype=np.uint8)
-                for ch in self._channels.values():
-                    self._combined_mask = cv2.bitwise_or(self._combined_mask, ch.mask)
+                # One OR reduction over all channel masks instead of a
+                # bitwise_or (and a fresh full-frame array) per channel.
+                self._combined_mask = np.bitwise_or.reduce(
+                    [ch.mask for ch in self._channels.values()]
+                ).astype(np.uint8, copy=False)
 
-        combined_mask = self._combined_mask
+        mask_bool = self._overlayMask(h, w)
         last_fg = self._last_fg
-        if combined_mask is not None and combined_mask.shape[:2] != (h, w):
-            combined_mask = cv2.resize(combined_mask, (w, h), interpolation=cv2.INTER_NEAREST)
         if last_fg is not None and last_fg.shape[:2] != (h, w):
             last_fg = cv2.resize(last_fg, (w, h), interpolation=cv2.INTER_NEAREST)
 
-        if combined_mask is not None:
-            mask_bool = combined_mask > 0
-            out[mask_bool] = (frame[mask_bool] * 0.5).astype(np.uint8)
-
-        if last_fg is not None and combined_mask is not None:
+        # (pixels to paint, their blended colours, hot pixel count)
+        heat: tuple[np.ndarray, np.ndarray, int] | None = None
+        if last_fg is not None and mask_bool is not None:
             fg_bool = last_fg > 0
-            mask_bool = combined_mask > 0
             hot = fg_bool & mask_bool
 
             display = np.zeros(last_fg.shape[:2], dtype=np.uint8)
             display[hot] = np.clip(
-                last_fg[hot].astype(np.float32) * float(self._cfg.heat_gain), 0, 255
+                last_fg[hot].astype(np.float32) * self._heat_gain, 0, 255
             ).astype(np.uint8)
             heatmap = cv2.applyColorMap(display, cv2.COLORMAP_JET)
             show = hot & (display > 0)
-            out[show] = (
+            # Blend against the undimmed pixels: ``show`` lies inside the
+            # mask, so gather them before the dimming pass rewrites them.
+            heat_blend = (
                 frame[show].astype(np.float32) * 0.2
                 + heatmap[show].astype(np.float32) * 0.8
             ).clip(0, 255).astype(np.uint8)
+            heat = (show, heat_blend, int(np.count_nonzero(hot)))
+
+        if mask_bool is not None:
+            out[mask_bool] = (frame[mask_bool] * 0.5).astype(np.uint8)
+
+        if heat is not None:
+            show, heat_blend, hot_count = heat
+            out[show] = heat_blend
 
-            hot_count = int(np.count_nonzero(hot))
             color = (0, 0, 255) if hot_count > 0 else (0, 255, 0)
             label = f"feeder fg_px: {hot_count}"
             cv2.putText(out, label, (30, 50),
@@ -296,26 +325,68 @@ class Mog2ChannelDetector:
             x1, y1, x2, y2 = det.bbox
             cv2.rectangle(out, (x1, y1), (x2, y2), (0, 255, 0), 2)
 
+        for ch_color, polys in self._overlayPolylines(h, w):
+            cv2.polylines(out, polys, True, ch_color, 2)
+
+        return out
+
+    def _overlayMask(self, h: int, w: int) -> np.ndarray | None:
+        """Combined channel mask as a boolean array at the overlay shape.
+
+        The channel masks only change on a shape change or reload, but the
+        overlay used to upsample and threshold them on every annotated
+        frame. Keyed on the combined-mask object, which ``_ensure_shape``
+        drops whenever the channels are rebuilt.
+        """
+        source = self._combined_mask
+        if source is None:
+            return None
+        cached = self._overlay_mask
+        if cached is not None and cached[0] is source and cached[1] == (h, w):
+            return cached[2]
+        combined_mask = source
+        if combined_mask.shape[:2] != (h, w):
+            combined_mask = cv2.resize(combined_mask, (w, h), interpolation=cv2.INTER_NEAREST)
+        mask_bool = combined_mask > 0
+        self._overlay_mask = (source, (h, w), mask_bool)
+        return mask_bool
+
+    def _overlayPolylines(self, h: int, w: int) -> list[tuple[tuple[int, int, int], list[np.ndarray]]]:
+        """Per-channel (color, [outer, inner?]) polylines scaled to (h, w).
+
+        The channel polygons live at the (possibly downscaled) MOG2 shape;
+        rescaling them to the full overlay frame only changes when either
+        shape does, so cache the result instead of re-casting every frame.
+        """
+        mask_shape = None
         if self._channels:
             first = next(iter(self._channels.values()))
-            mh, mw = first.mask.shape[:2]
+            mask_shape = first.mask.shape[:2]
+        cache_key = (h, w, mask_shape)
+        cached = self._overlay_polylines
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        if mask_shape is not None:
+            mh, mw = mask_shape
             poly_sx = w / float(mw) if mw else 1.0
             poly_sy = h / float(mh) if mh else 1.0
         else:
             poly_sx = poly_sy = 1.0
+        scale = np.array([poly_sx, poly_sy])
+        rescale = poly_sx != 1.0 or poly_sy != 1.0
+        polylines: list[tuple[tuple[int, int, int], list[np.ndarray]]] = []
         for ch in self._channels.values():
             ch_color = CHANNEL_COLORS.get(ch.name, (200, 200, 200))
-            poly = ch.polygon_channel.polygon
-            if poly_sx != 1.0 or poly_sy != 1.0:
-                poly = np.round(poly.astype(np.float32) * np.array([poly_sx, poly_sy])).astype(np.int32)
-            cv2.polylines(out, [poly], True, ch_color, 2)
-            if ch.polygon_channel.inner_polygon is not None and len(ch.polygon_channel.inner_polygon) >= 3:
-                inner = ch.polygon_channel.inner_polygon
-                if poly_sx != 1.0 or poly_sy != 1.0:
-                    inner = np.round(inner.astype(np.float32) * np.array([poly_sx, poly_sy])).astype(np.int32)
-                cv2.polylines(out, [inner], True, ch_color, 2)
-
-        return out
+            polys = [ch.polygon_channel.polygon]
+            inner = ch.polygon_channel.inner_polygon
+            if inner is not None and len(inner) >= 3:
+                polys.append(inner)
+            if rescale:
+                polys = [np.round(poly.astype(np.float32) * scale).astype(np.int32) for poly in polys]
+            polylines.append((ch_color, polys))
+        self._overlay_polylines = (cache_key, polylines)
+        return polylines
 
     def primaryChannel(self) -> PolygonChannel | None:
         first = next(iter(self._channels.values()), None)
@@ -1,14 +1,37 @@
-"""Base64 output — JPEG encoding for WebSocket broadcast."""
+"""Base64 output — JPEG encoding for WebSocket broadcast.
+
+Uses the optional ``pybase64`` package when installed — its SIMD encoder is
+several times faster than the scalar stdlib codec on full-frame JPEGs — and
+falls back to ``binascii`` otherwise.
+"""
 
 from __future__ import annotations
 
-import base64
+import binascii
 
-import cv2
 import numpy as np
 
+try:
+    from pybase64 import b64encode_as_string
+except ImportError:  # optional dependency
+    b64encode_as_string = None
+
+from .jpeg import encode_jpeg
+
+
+def encode_base64(data: bytes) -> str:
+    """Standard base64 of an encoded image buffer, as an ASCII ``str``.
+
+    Shared by every JPEG-to-JSON path (live feeds, burst frames, crops) so
+    they all pick up the SIMD encoder when it is installed.
+    """
+    if b64encode_as_string is not None:
+        return b64encode_as_string(data)
+    # b2a_base64 works straight off the JPEG buffer, and base64 output is
+    # pure ASCII, so the cheap ascii codec is enough — no UTF-8 scan.
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
 
 class Base64Output:
     def encode(self, frame: np.ndarray, quality: int = 80) -> str:
-        _, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
-        return base64.b64encode(buffer).decode("utf-8")
+        return encode_base64(encode_jpeg(frame, quality) or b"")
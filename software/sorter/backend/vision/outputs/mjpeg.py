@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import cv2
 import numpy as np
 
+from .jpeg import encode_jpeg
+
 
 class MjpegOutput:
     def encode(self, frame: np.ndarray, quality: int = 80) -> bytes:
-        _, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
-        return buf.tobytes()
+        return encode_jpeg(frame, quality) or b""
 
     def encode_chunk(self, frame: np.ndarray, quality: int = 80) -> bytes:
         data = self.encode(frame, quality)
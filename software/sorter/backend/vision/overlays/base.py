@@ -10,7 +10,9 @@ import numpy as np
 class FrameOverlay(Protocol):
     """Composable, ordered annotation pass.
 
-    Overlays must not mutate the input array; they receive a copy.
+    The input array is the feed's private working copy of the raw frame
+    (``CameraFeed.get_frame`` copies it once before the first overlay), so
+    overlays draw on it in place rather than copying it again.
     The ``category`` attribute tags the overlay so consumers can filter
     e.g. ``"regions"`` out of the annotated output.
     """
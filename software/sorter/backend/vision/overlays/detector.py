@@ -76,15 +76,33 @@ class DetectorOverlay:
     ) -> None:
         self._detector = detector
         self._get_detections = get_detections
+        # (detections, sections per detection). The detection source hands
+        # out a fresh list per call but the same ChannelDetection objects
+        # until the next detect pass, and annotate() plus metadata() both
+        # run for every published frame — so the section sets are computed
+        # once per detection set, keyed on object identity.
+        self._sections_cache: tuple[list, list[set[int]]] | None = None
+
+    def _sectionsFor(self, detections: list) -> list[set[int]]:
+        cached = self._sections_cache
+        if (
+            cached is not None
+            and len(cached[0]) == len(detections)
+            and all(a is b for a, b in zip(cached[0], detections))
+        ):
+            return cached[1]
+        from subsystems.feeder.analysis import getBboxSections
+
+        sections = [getBboxSections(det.bbox, det.channel) for det in detections]
+        self._sections_cache = (detections, sections)
+        return sections
 
     def annotate(self, frame: np.ndarray) -> np.ndarray:
         frame = self._detector.annotateFrame(frame)
-        from subsystems.feeder.analysis import getBboxSections
-
-        for det in self._get_detections():
+        detections = self._get_detections()
+        for det, secs in zip(detections, self._sectionsFor(detections)):
             x1, y1, x2, y2 = det.bbox
             _draw_center_marker(frame, _bbox_center(det.bbox))
-            secs = getBboxSections(det.bbox, det.channel)
             exit_zone = bool(secs & det.channel.exit_sections)
             drop = bool(secs & det.channel.dropzone_sections)
             label = f"ch{det.channel_id} {sorted(secs)} e={exit_zone} d={drop}"
@@ -92,11 +110,9 @@ class DetectorOverlay:
         return frame
 
     def metadata(self) -> list[dict[str, object]]:
-        from subsystems.feeder.analysis import getBboxSections
-
         items: list[dict[str, object]] = []
-        for det in self._get_detections():
-            sections = getBboxSections(det.bbox, det.channel)
+        detections = self._get_detections()
+        for det, sections in zip(detections, self._sectionsFor(detections)):
             items.append({
                 "type": "detector_bbox",
                 "category": self.category,
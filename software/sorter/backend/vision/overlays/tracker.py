@@ -7,6 +7,7 @@ from the VisionManager — inject via
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable
 
 import cv2
@@ -31,6 +32,15 @@ CENTER_MARKER_ARM_PX = 9
 VELOCITY_MIN_MAGNITUDE_PX_S = 40.0
 VELOCITY_VECTOR_SCALE_S = 0.25
 
+# Drawing entry points bound once: annotate() runs for every track on every
+# rendered preview frame, and each ``cv2.<name>`` is a module dict lookup.
+_circle = cv2.circle
+_polylines = cv2.polylines
+_rectangle = cv2.rectangle
+_putText = cv2.putText
+_arrowedLine = cv2.arrowedLine
+_LINE_AA = cv2.LINE_AA
+
 # 4-digit zero-padded display code wraps after this many IDs — a short,
 # readable label that stays the same length forever. 10 000 is plenty for a
 # single session; once it wraps, collisions with earlier long-dead tracks are
@@ -50,6 +60,14 @@ def format_track_label(global_id: int) -> str:
     return f"{mixed % DISPLAY_ID_MODULO:04d}"
 
 
+@lru_cache(maxsize=DISPLAY_ID_MODULO + 1)
+def _label_text_size(label: str) -> tuple[tuple[int, int], int]:
+    # Labels come from a fixed 10 000-entry space and never change size for
+    # a given string, so measure each one once.
+    (w, h), base = cv2.getTextSize(label, LABEL_FONT, LABEL_SCALE, LABEL_THICKNESS)
+    return (int(w), int(h)), int(base)
+
+
 def _label_color_for(track) -> tuple[int, int, int]:
     # Pieces that inherited their ID from an upstream camera stay magenta for
     # their whole lifetime — makes handoff events easy to spot while they ride
@@ -61,6 +79,17 @@ def _label_color_for(track) -> tuple[int, int, int]:
     return COLOR_ACTIVE
 
 
+def _crosshairArms(cx: int, cy: int) -> np.ndarray:
+    arm = CENTER_MARKER_ARM_PX
+    return np.array(
+        [
+            [[cx - arm, cy], [cx + arm, cy]],
+            [[cx, cy - arm], [cx, cy + arm]],
+        ],
+        dtype=np.int32,
+    )
+
+
 def _draw_center_marker(
     frame: np.ndarray,
     center: tuple[float, float],
@@ -68,40 +97,13 @@ def _draw_center_marker(
 ) -> tuple[int, int]:
     cx = int(round(center[0]))
     cy = int(round(center[1]))
-    cv2.circle(frame, (cx, cy), CENTER_MARKER_RADIUS + 2, COLOR_LABEL_BG, 2, cv2.LINE_AA)
-    cv2.circle(frame, (cx, cy), CENTER_MARKER_RADIUS, color, -1, cv2.LINE_AA)
-    cv2.line(
-        frame,
-        (cx - CENTER_MARKER_ARM_PX, cy),
-        (cx + CENTER_MARKER_ARM_PX, cy),
-        COLOR_LABEL_BG,
-        3,
-        cv2.LINE_AA,
-    )
-    cv2.line(
-        frame,
-        (cx, cy - CENTER_MARKER_ARM_PX),
-        (cx, cy + CENTER_MARKER_ARM_PX),
-        COLOR_LABEL_BG,
-        3,
-        cv2.LINE_AA,
-    )
-    cv2.line(
-        frame,
-        (cx - CENTER_MARKER_ARM_PX, cy),
-        (cx + CENTER_MARKER_ARM_PX, cy),
-        color,
-        1,
-        cv2.LINE_AA,
-    )
-    cv2.line(
-        frame,
-        (cx, cy - CENTER_MARKER_ARM_PX),
-        (cx, cy + CENTER_MARKER_ARM_PX),
-        color,
-        1,
-        cv2.LINE_AA,
-    )
+    _circle(frame, (cx, cy), CENTER_MARKER_RADIUS + 2, COLOR_LABEL_BG, 2, _LINE_AA)
+    _circle(frame, (cx, cy), CENTER_MARKER_RADIUS, color, -1, _LINE_AA)
+    # Both crosshair arms go through one polylines call per stroke (dark
+    # halo, then colored core) instead of one cv2.line per arm.
+    arms = _crosshairArms(cx, cy)
+    _polylines(frame, arms, False, COLOR_LABEL_BG, 3, _LINE_AA)
+    _polylines(frame, arms, False, color, 1, _LINE_AA)
     return cx, cy
 
 
@@ -122,13 +124,13 @@ class TrackOverlay:
             x1, y1, x2, y2 = [int(round(v)) for v in bbox]
             color = _label_color_for(track)
 
-            cv2.rectangle(frame, (x1, y1), (x2, y2), color, BOX_THICKNESS, cv2.LINE_AA)
+            _rectangle(frame, (x1, y1), (x2, y2), color, BOX_THICKNESS, _LINE_AA)
             center = getattr(track, "center", None)
             if center is not None:
                 _draw_center_marker(frame, center, color)
 
             label = f"#{format_track_label(track.global_id)}"
-            (tw, th), baseline = cv2.getTextSize(label, LABEL_FONT, LABEL_SCALE, LABEL_THICKNESS)
+            (tw, th), baseline = _label_text_size(label)
             pad = LABEL_PAD_PX
             pill_w = tw + pad * 2
             pill_h = th + pad * 2
@@ -138,8 +140,8 @@ class TrackOverlay:
             pill_y2 = pill_y1 + pill_h
 
             # Dark background pill → readable over any background.
-            cv2.rectangle(frame, (pill_x1, pill_y1), (pill_x2, pill_y2), COLOR_LABEL_BG, -1)
-            cv2.putText(
+            _rectangle(frame, (pill_x1, pill_y1), (pill_x2, pill_y2), COLOR_LABEL_BG, -1)
+            _putText(
                 frame,
                 label,
                 (pill_x1 + pad, pill_y2 - pad - 1),
@@ -147,7 +149,7 @@ class TrackOverlay:
                 LABEL_SCALE,
                 color,
                 LABEL_THICKNESS,
-                cv2.LINE_AA,
+                _LINE_AA,
             )
 
             vx, vy = track.velocity_px_per_s
@@ -156,13 +158,13 @@ class TrackOverlay:
                 cx, cy = track.center
                 end_x = int(round(cx + vx * VELOCITY_VECTOR_SCALE_S))
                 end_y = int(round(cy + vy * VELOCITY_VECTOR_SCALE_S))
-                cv2.arrowedLine(
+                _arrowedLine(
                     frame,
                     (int(round(cx)), int(round(cy))),
                     (end_x, end_y),
                     color,
                     1,
-                    cv2.LINE_AA,
+                    _LINE_AA,
                     tipLength=0.3,
                 )
 
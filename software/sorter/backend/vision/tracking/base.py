@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackedPiece:
     """One live track snapshot emitted per ``Tracker.update(...)`` tick."""
 
@@ -423,17 +423,11 @@ class ByteTrackFeederTracker(Tracker):
         corner_radii = [math.hypot(cx - geom.center_x, cy - geom.center_y) for cx, cy in corners]
 
         # Unwrap angles so we can pick min/max without wrap-around glitches.
+        # math.remainder folds each offset into [-π, π] in one exact step.
         anchor = center_angle_rad
-        unwrapped = []
-        for a in corner_angles:
-            d = a - anchor
-            while d > math.pi:
-                d -= 2 * math.pi
-            while d < -math.pi:
-                d += 2 * math.pi
-            unwrapped.append(anchor + d)
-        a_min = min(unwrapped)
-        a_max = max(unwrapped)
+        offsets = [math.remainder(a - anchor, 2 * math.pi) for a in corner_angles]
+        a_min = anchor + min(offsets)
+        a_max = anchor + max(offsets)
         # Angular margin: at least 4° each side, or 25% of the extent.
         angular_margin = max(math.radians(4.0), (a_max - a_min) * 0.25)
         a0 = a_min - angular_margin
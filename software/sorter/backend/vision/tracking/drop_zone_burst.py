@@ -11,16 +11,19 @@ The burst is attached to the piece's ``TrackHistoryEntry`` via
 
 from __future__ import annotations
 
-import base64
 import threading
 import time
 from collections import deque
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 import cv2
 import numpy as np
 
+from vision.outputs.base64 import encode_base64
+from vision.outputs.jpeg import encode_jpeg
+
 from .history import DropZoneBurstFrame, PieceHistoryBuffer, BURST_JPEG_QUALITY, BURST_MAX_EDGE_PX
 
 BURST_PRE_FRAMES = 60
@@ -45,10 +48,10 @@ def _encode_frame(frame: np.ndarray) -> str:
             (int(round(w * scale)), int(round(h * scale))),
             interpolation=cv2.INTER_AREA,
         )
-    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, BURST_JPEG_QUALITY])
-    if not ok:
+    data = encode_jpeg(frame, BURST_JPEG_QUALITY)
+    if not data:
         return ""
-    return base64.b64encode(buf.tobytes()).decode("ascii")
+    return encode_base64(data)
 
 
 def _encode_crop(frame: np.ndarray, bbox: tuple[int, int, int, int], margin_px: int = 20) -> str:
@@ -64,6 +67,15 @@ def _encode_crop(frame: np.ndarray, bbox: tuple[int, int, int, int], margin_px:
     return _encode_frame(crop)
 
 
+def _encode_pair(
+    frame: np.ndarray, bbox: tuple[int, int, int, int] | None
+) -> tuple[str, str]:
+    """``(full-frame b64, crop b64)``; the crop falls back to the full frame."""
+    jpeg_b64 = _encode_frame(frame)
+    crop_b64 = _encode_crop(frame, bbox) if bbox is not None else jpeg_b64
+    return jpeg_b64, crop_b64
+
+
 class RollingFrameBuffer:
     """Thread-safe rolling buffer of the last N raw frames from a capture thread."""
 
@@ -91,11 +103,18 @@ class DropZoneBurstCollector:
        calls ``history.attach_burst(global_id, frames)``.
     """
 
-    def __init__(self, history: PieceHistoryBuffer) -> None:
+    def __init__(
+        self,
+        history: PieceHistoryBuffer,
+        encode_pool: Callable[[], Executor] | None = None,
+    ) -> None:
         self._history = history
         self.rolling_buffer = RollingFrameBuffer(maxlen=BURST_PRE_BUFFER_MAXLEN)
         self._active: dict[int, threading.Thread] = {}
         self._lock = threading.Lock()
+        # Borrowed from the owner (VisionManager's burst encode pool), which
+        # also shuts it down; without one the encodes run inline.
+        self._encode_pool = encode_pool
 
     def trigger(
         self,
@@ -133,11 +152,20 @@ class DropZoneBurstCollector:
             trigger_ts = time.time()
             interval_s = 1.0 / BURST_FPS
 
-            # Pre-burst: frames already in the rolling buffer (chronological)
-            for idx, bf in enumerate(pre_frames):
-                bbox, score = _safe_detect(detect_fn, bf.raw)
-                jpeg_b64 = _encode_frame(bf.raw)
-                crop_b64 = _encode_crop(bf.raw, bbox) if bbox is not None else jpeg_b64
+            # Pre-burst: frames already in the rolling buffer (chronological).
+            # Detection stays on this thread (one model, called in order);
+            # the ~2 resize+JPEG encodes per frame release the GIL, so the
+            # whole pre-buffer's encodes are fanned out in one batch.
+            detections = [_safe_detect(detect_fn, bf.raw) for bf in pre_frames]
+            encode_map = self._encode_pool().map if self._encode_pool is not None else map
+            encoded = encode_map(
+                _encode_pair,
+                [bf.raw for bf in pre_frames],
+                [bbox for bbox, _ in detections],
+            )
+            for idx, (bf, (bbox, score), (jpeg_b64, crop_b64)) in enumerate(
+                zip(pre_frames, detections, encoded)
+            ):
                 burst.append(
                     DropZoneBurstFrame(
                         frame_index=idx,
@@ -168,8 +196,7 @@ class DropZoneBurstCollector:
                     continue
                 last_frame_ts = ts
                 bbox, score = _safe_detect(detect_fn, raw)
-                jpeg_b64 = _encode_frame(raw)
-                crop_b64 = _encode_crop(raw, bbox) if bbox is not None else jpeg_b64
+                jpeg_b64, crop_b64 = _encode_pair(raw, bbox)
                 burst.append(
                     DropZoneBurstFrame(
                         frame_index=frame_idx,
@@ -30,10 +30,36 @@ DEFAULT_GHOST_REJECT_RADIUS_PX: float = 25.0
 DEFAULT_GHOST_STATIONARY_THRESHOLD_PX: float = 8.0
 
 
-def _point_in_polygon(point: tuple[float, float], polygon: Iterable[tuple[float, float]]) -> bool:
-    """Ray-casting point-in-polygon test. Tolerant of open polygons."""
+ZoneBounds = tuple[float, float, float, float]
+
+
+def _polygon_bounds(polygon: list[tuple[float, float]]) -> ZoneBounds | None:
+    """Inclusive ``(min_x, min_y, max_x, max_y)`` of a zone polygon."""
+    if len(polygon) < 3:
+        return None
+    xs = [x for x, _ in polygon]
+    ys = [y for _, y in polygon]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _point_in_polygon(
+    point: tuple[float, float],
+    polygon: Iterable[tuple[float, float]],
+    bounds: ZoneBounds | None = None,
+) -> bool:
+    """Ray-casting point-in-polygon test. Tolerant of open polygons.
+
+    ``bounds`` (from ``_polygon_bounds``) lets points strictly outside the
+    polygon's extents return before the per-edge walk. No ray from such a
+    point can cross the polygon an odd number of times, so the result is
+    unchanged.
+    """
     px, py = point
-    poly = list(polygon)
+    if bounds is not None:
+        min_x, min_y, max_x, max_y = bounds
+        if px < min_x or px > max_x or py < min_y or py > max_y:
+            return False
+    poly = polygon if isinstance(polygon, list) else list(polygon)
     if len(poly) < 3:
         return False
     inside = False
@@ -81,6 +107,11 @@ class PieceHandoffManager:
         self._pending: dict[str, deque[PendingHandoff]] = {role: deque() for role in self._handoff_chain}
         self._entry_zones: dict[str, list[tuple[float, float]]] = {}
         self._exit_zones: dict[str, list[tuple[float, float]]] = {}
+        # Zone extents, recomputed only in ``set_zones``. Most track births
+        # and deaths happen well away from the handoff zones, so the extents
+        # reject them before the ray-cast walks every edge.
+        self._entry_zone_bounds: dict[str, ZoneBounds | None] = {}
+        self._exit_zone_bounds: dict[str, ZoneBounds | None] = {}
         self._exit_observer = exit_observer
         self._ghost_reject_radius_px = max(0.0, float(ghost_reject_radius_px))
         self._ghost_stationary_threshold_px = max(0.0, float(ghost_stationary_threshold_px))
@@ -110,8 +141,10 @@ class PieceHandoffManager:
         with self._lock:
             if entry_polygon is not None:
                 self._entry_zones[role] = [(float(x), float(y)) for x, y in entry_polygon]
+                self._entry_zone_bounds[role] = _polygon_bounds(self._entry_zones[role])
             if exit_polygon is not None:
                 self._exit_zones[role] = [(float(x), float(y)) for x, y in exit_polygon]
+                self._exit_zone_bounds[role] = _polygon_bounds(self._exit_zones[role])
 
     # ---- Live hooks ----------------------------------------------------
 
@@ -146,7 +179,9 @@ class PieceHandoffManager:
                 except Exception:
                     live_ids = set()
             entry = self._entry_zones.get(role)
-            if upstream and entry and _point_in_polygon(center, entry):
+            if upstream and entry and _point_in_polygon(
+                center, entry, self._entry_zone_bounds.get(role)
+            ):
                 bucket = self._pending.get(upstream)
                 # Pop any FIFO-head pending that the upstream tracker still
                 # holds alive — it was queued by a premature coast-death but
@@ -253,7 +288,9 @@ class PieceHandoffManager:
             if role not in self._handoff_chain:
                 return
             exit_zone = self._exit_zones.get(role)
-            if exit_zone is None or not _point_in_polygon(last_center, exit_zone):
+            if exit_zone is None or not _point_in_polygon(
+                last_center, exit_zone, self._exit_zone_bounds.get(role)
+            ):
                 return
             anchor = float(death_ts) if death_ts is not None else float(last_seen_ts)
             pending = PendingHandoff(
@@ -112,6 +112,32 @@ def _circular_sector_diff(a: int, b: int, sector_count: int) -> int:
     return min(raw, sector_count - raw)
 
 
+def _bbox_angle_span(
+    bbox: tuple[int, int, int, int],
+    cx: float,
+    cy: float,
+    anchor: float,
+) -> tuple[float, float]:
+    """Min/max world-angle of ``bbox``'s four corners seen from ``(cx, cy)``,
+    unwrapped around ``anchor`` so the span never straddles the ±π seam.
+
+    ``math.remainder`` folds each corner offset into ``[-π, π]`` in one
+    exact step — the same values the old per-corner ``while`` loops
+    produced, without the list building and branch-per-wrap.
+    """
+    x1, y1, x2, y2 = bbox
+    dx1 = x1 - cx
+    dx2 = x2 - cx
+    dy1 = y1 - cy
+    dy2 = y2 - cy
+    tau = 2 * math.pi
+    d0 = math.remainder(math.atan2(dy1, dx1) - anchor, tau)
+    d1 = math.remainder(math.atan2(dy1, dx2) - anchor, tau)
+    d2 = math.remainder(math.atan2(dy2, dx2) - anchor, tau)
+    d3 = math.remainder(math.atan2(dy2, dx1) - anchor, tau)
+    return anchor + min(d0, d1, d2, d3), anchor + max(d0, d1, d2, d3)
+
+
 def _wedge_bbox(
     cx: float,
     cy: float,
@@ -445,22 +471,10 @@ class PolarFeederTracker(Tracker):
         if geom.sector_count <= 0:
             return False
         sector_size = 2 * math.pi / geom.sector_count
-        x1, y1, x2, y2 = bbox
-        corners = ((x1, y1), (x2, y1), (x2, y2), (x1, y2))
-        corner_angles = [
-            math.atan2(cy - geom.center_y, cx - geom.center_x)
-            for cx, cy in corners
-        ]
-        anchor = corner_angles[0]
-        unwrapped = [anchor]
-        for a in corner_angles[1:]:
-            d = a - anchor
-            while d > math.pi:
-                d -= 2 * math.pi
-            while d < -math.pi:
-                d += 2 * math.pi
-            unwrapped.append(anchor + d)
-        span = max(unwrapped) - min(unwrapped)
+        x1, y1 = bbox[0], bbox[1]
+        anchor = math.atan2(y1 - geom.center_y, x1 - geom.center_x)
+        a_min, a_max = _bbox_angle_span(bbox, geom.center_x, geom.center_y, anchor)
+        span = a_max - a_min
         return span > sector_size
 
     def force_kill_track(self, global_id: int) -> bool:
@@ -612,15 +626,19 @@ class PolarFeederTracker(Tracker):
                             continue
                         cost[ri, ci] = ang_cost + 0.5 * rad_cost
             else:
-                # Cartesian fallback
-                for ri, tid in enumerate(track_ids):
-                    track = self._tracks[tid]
-                    tx, ty = track.center_px
-                    for ci, (dx, dy) in enumerate(det_centers):
-                        d = math.hypot(dx - tx, dy - ty)
-                        if d >= self._pixel_fallback_distance:
-                            continue
-                        cost[ri, ci] = d / self._pixel_fallback_distance
+                # Cartesian fallback — all track/detection distances in one
+                # broadcast instead of a Python double loop over the pairs.
+                det_xy = np.asarray(det_centers, dtype=np.float64)
+                track_xy = np.asarray(
+                    [self._tracks[tid].center_px for tid in track_ids],
+                    dtype=np.float64,
+                )
+                dist = np.hypot(
+                    det_xy[None, :, 0] - track_xy[:, None, 0],
+                    det_xy[None, :, 1] - track_xy[:, None, 1],
+                )
+                near = dist < self._pixel_fallback_distance
+                cost[near] = dist[near] / self._pixel_fallback_distance
 
             row_ind, col_ind = linear_sum_assignment(cost)
             for r, c in zip(row_ind, col_ind):
@@ -920,23 +938,9 @@ class PolarFeederTracker(Tracker):
             return None
 
         center_angle_rad = math.atan2(dy, dx)
-        x1, y1, x2, y2 = track.bbox
-        corners = ((x1, y1), (x2, y1), (x2, y2), (x1, y2))
-        corner_angles = [
-            math.atan2(cy - geom.center_y, cx - geom.center_x) for cx, cy in corners
-        ]
-
-        anchor = center_angle_rad
-        unwrapped: list[float] = []
-        for angle in corner_angles:
-            diff = angle - anchor
-            while diff > math.pi:
-                diff -= 2 * math.pi
-            while diff < -math.pi:
-                diff += 2 * math.pi
-            unwrapped.append(anchor + diff)
-        a_min = min(unwrapped)
-        a_max = max(unwrapped)
+        a_min, a_max = _bbox_angle_span(
+            track.bbox, geom.center_x, geom.center_y, center_angle_rad
+        )
         raw_half_width_rad = max(0.0, (a_max - a_min) / 2.0)
         half_width_rad = raw_half_width_rad + max(
             math.radians(2.0),
@@ -969,21 +973,9 @@ class PolarFeederTracker(Tracker):
         # extent, on the other hand, always spans the full channel ring
         # from inner to outer rim so the user sees the piece in context
         # rather than a narrow strip that might crop the piece.
-        x1, y1, x2, y2 = track.bbox
-        corners = ((x1, y1), (x2, y1), (x2, y2), (x1, y2))
-        corner_angles = [math.atan2(cy - geom.center_y, cx - geom.center_x) for cx, cy in corners]
-
-        anchor = center_angle_rad
-        unwrapped = []
-        for a in corner_angles:
-            d = a - anchor
-            while d > math.pi:
-                d -= 2 * math.pi
-            while d < -math.pi:
-                d += 2 * math.pi
-            unwrapped.append(anchor + d)
-        a_min = min(unwrapped)
-        a_max = max(unwrapped)
+        a_min, a_max = _bbox_angle_span(
+            track.bbox, geom.center_x, geom.center_y, center_angle_rad
+        )
         # Generous angular margin (~8° min or 40 % of extent) so the wedge
         # doesn't clip the piece on edges when YOLO's bbox is a bit tight.
         angular_margin = max(math.radians(8.0), (a_max - a_min) * 0.4)
@@ -1038,6 +1030,7 @@ class PolarFeederTracker(Tracker):
         # Tight crop around the piece itself — for Recognize / classification
         # thumbnails. Piece bbox + small margin, like the classification
         # chamber does.
+        x1, y1, x2, y2 = track.bbox
         piece_margin = 8
         fh, fw = frame_bgr.shape[:2]
         pbx1 = max(0, int(x1) - piece_margin)
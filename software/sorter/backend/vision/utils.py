@@ -1,15 +1,26 @@
+import math
 import cv2
 import numpy as np
 from typing import Optional, Tuple
 
 
+def _binaryMaskU8(mask: np.ndarray) -> np.ndarray:
+    # cv2 needs uint8; bool masks can be reinterpreted without a copy.
+    if mask.dtype == np.uint8:
+        return mask
+    if mask.dtype == np.bool_:
+        return mask.view(np.uint8)
+    return (mask != 0).view(np.uint8)
+
+
 def maskCenterOfMass(mask: np.ndarray) -> Optional[Tuple[float, float]]:
-    coords = np.argwhere(mask)
-    if len(coords) == 0:
+    # Single pass over the mask via image moments instead of materializing
+    # an (N, 2) coordinate array with np.argwhere and averaging each column.
+    moments = cv2.moments(_binaryMaskU8(mask), binaryImage=True)
+    area = moments["m00"]
+    if area == 0:
         return None
-    center_y = float(np.mean(coords[:, 0]))
-    center_x = float(np.mean(coords[:, 1]))
-    return (center_x, center_y)
+    return (float(moments["m10"] / area), float(moments["m01"] / area))
 
 
 def masksOverlap(mask1: np.ndarray, mask2: np.ndarray) -> bool:
@@ -26,19 +37,21 @@ def masksWithinDistance(
 
 
 def maskMinDistance(object_mask: np.ndarray, target_mask: np.ndarray) -> int:
-    object_coords = np.argwhere(object_mask)
-    target_coords = np.argwhere(target_mask)
+    # bounding box distance (much faster than pixel-by-pixel). boundingRect
+    # gets each box in one pass without materializing np.argwhere's (N, 2)
+    # coordinate array.
+    obj_x, obj_y, obj_w, obj_h = cv2.boundingRect(_binaryMaskU8(object_mask))
+    tgt_x, tgt_y, tgt_w, tgt_h = cv2.boundingRect(_binaryMaskU8(target_mask))
 
-    if len(object_coords) == 0 or len(target_coords) == 0:
+    if obj_w == 0 or tgt_w == 0:
         return 999999
 
-    # bounding box distance (much faster than pixel-by-pixel)
-    obj_min_y, obj_min_x = object_coords.min(axis=0)
-    obj_max_y, obj_max_x = object_coords.max(axis=0)
-    tgt_min_y, tgt_min_x = target_coords.min(axis=0)
-    tgt_max_y, tgt_max_x = target_coords.max(axis=0)
+    obj_max_x = obj_x + obj_w - 1
+    obj_max_y = obj_y + obj_h - 1
+    tgt_max_x = tgt_x + tgt_w - 1
+    tgt_max_y = tgt_y + tgt_h - 1
 
-    dx = max(0, obj_min_x - tgt_max_x, tgt_min_x - obj_max_x)
-    dy = max(0, obj_min_y - tgt_max_y, tgt_min_y - obj_max_y)
+    dx = max(0, obj_x - tgt_max_x, tgt_x - obj_max_x)
+    dy = max(0, obj_y - tgt_max_y, tgt_y - obj_max_y)
 
-    return int(np.sqrt(dx * dx + dy * dy))
+    return int(math.sqrt(dx * dx + dy * dy))
@@ -1,6 +1,5 @@
 from typing import Optional, List, Dict, Tuple, Union, cast, Any
 from pathlib import Path
-import base64
 import enum
 import time
 import threading
@@ -30,6 +29,8 @@ from blob_manager import (
 )
 from .camera import CaptureThread
 from .burst_store import BurstFrameStore
+from .outputs.base64 import encode_base64
+from .outputs.jpeg import encode_jpeg
 from .types import CameraFrame, VisionResult, DetectedMask
 from .regions import RegionName, Region
 from .default_region_provider import DefaultRegionProvider
@@ -70,6 +71,9 @@ AUXILIARY_DETECTION_LOOP_INTERVAL_S = 0.002
 OPENROUTER_MAX_CONCURRENCY = 10
 OPENROUTER_FAILURE_BACKOFF_S = 2.0
 OPENROUTER_BACKGROUND_RETRY_PADDING_S = 0.35
+# recordFrames pool: the carousel heatmap push plus the per-camera
+# annotate-and-copy tasks (the calling thread takes one camera itself).
+RECORD_FRAMES_WORKERS = 4
 
 
 @dataclass(frozen=True)
@@ -184,6 +188,9 @@ class VisionManager:
         self._channel_angles: Dict[str, float] = {}
         self._channel_masks: Dict[str, np.ndarray] = {}
         self._carousel_polygon: List[Tuple[float, float]] | None = None
+        # int32 contour derived from _carousel_polygon, keyed on the identity
+        # of the list it was built from. See _carouselPolygonContour().
+        self._carousel_polygon_contour: Tuple[object, np.ndarray] | None = None
 
         self._feeder_analysis: FeederAnalysisThread | None = None
 
@@ -193,6 +200,12 @@ class VisionManager:
 
         self._classification_masks: Dict[str, np.ndarray] = {}
         self._classification_mask_bboxes: Dict[str, Tuple[int, int, int, int]] = {}
+        # Rasterized zone masks for _maskToRegion keyed on (key, w, h, bbox);
+        # each entry holds the source polygon so a reload invalidates it.
+        self._zone_mask_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        # _scalePolygon results keyed on (id(polygon), w, h); each entry holds
+        # the source polygon and resolution so a reload invalidates it.
+        self._scaled_polygon_cache: Dict[tuple, Tuple[np.ndarray, Tuple[int, int], np.ndarray]] = {}
         self._classification_polygon_resolution: Tuple[int, int] = (1920, 1080)
         self._loadClassificationPolygons()
         self._carousel_diff_config: CarouselDiffConfig = DEFAULT_CAROUSEL_DIFF_CONFIG
@@ -249,7 +262,9 @@ class VisionManager:
             stale_pending_observer=getattr(gc.runtime_stats, "observeHandoffStalePendingDropped", None),
             on_record_segment=self._handlePieceSegmentRecorded,
         )
-        self._drop_zone_burst_collector = DropZoneBurstCollector(self._piece_history)
+        self._drop_zone_burst_collector = DropZoneBurstCollector(
+            self._piece_history, encode_pool=self._burstEncodePool
+        )
         # Fresh burst store for the C3→C4 drop-zone "fashion-shoot" feature.
         # Pre-event frames from the c_channel_3 + carousel capture-thread ring
         # buffers are drained at trigger time; post-event frames are merged in
@@ -257,6 +272,11 @@ class VisionManager:
         self._burst_store = BurstFrameStore(max_pieces=50)
         self._burst_timers: Dict[int, threading.Timer] = {}
         self._burst_lock = threading.Lock()
+        self._burst_encode_pool: ThreadPoolExecutor | None = None
+        # Workers for recordFrames: the carousel heatmap push plus one
+        # annotate-and-copy task per camera. Created lazily, only when
+        # recording is enabled.
+        self._record_pool: ThreadPoolExecutor | None = None
         self._feeder_track_cache: Dict[str, Tuple[float, list]] = {}
         # Gate: tracker updates only happen while the sorter is actually
         # running. Toggled from SorterController.resume/pause/stop so we
@@ -268,6 +288,14 @@ class VisionManager:
         # Memoized PolygonChannel per (role, w, h) for the no-MOG2-detector
         # path in _channelInfoForRole. Cleared in reloadPolygons().
         self._channel_info_cache: Dict[tuple, PolygonChannel] = {}
+        # Scaled saved polygons per (key, w, h) for _loadSavedPolygon.
+        # Cleared in reloadPolygons().
+        self._saved_polygon_cache: Dict[tuple, np.ndarray | None] = {}
+        # Last BGR->gray (or BGR->LAB, under "<camera>.lab") conversion per
+        # camera, keyed on the CameraFrame object it came from. recordFrames
+        # runs faster than the cameras deliver, so most ticks would otherwise
+        # re-convert the same frame.
+        self._gray_frame_cache: Dict[str, Tuple[CameraFrame, np.ndarray]] = {}
         self._auxiliary_capture_requests: list[AuxiliaryTeacherCaptureRequest] = []
         self._auxiliary_capture_lock = threading.Lock()
         self._openrouter_request_lock = threading.Lock()
@@ -657,6 +685,13 @@ class VisionManager:
         if self._aux_detection_pool is not None:
             self._aux_detection_pool.shutdown(wait=False, cancel_futures=True)
             self._aux_detection_pool = None
+        with self._burst_lock:
+            burst_pool, self._burst_encode_pool = self._burst_encode_pool, None
+        if burst_pool is not None:
+            burst_pool.shutdown(wait=False, cancel_futures=True)
+        if self._record_pool is not None:
+            self._record_pool.shutdown(wait=True)
+            self._record_pool = None
         self._stopFeederDetection()
         self._stopClassificationAnalysis()
         self._region_provider.stop()
@@ -1083,6 +1118,7 @@ class VisionManager:
         # Invalidate the memoized PolygonChannel cache; polygons may have
         # changed, so the masks/zones must be rebuilt on next access.
         self._channel_info_cache.clear()
+        self._saved_polygon_cache.clear()
         if isinstance(self._region_provider, HanddrawnRegionProvider):
             self._region_provider.reloadPolygons()
         saved = getChannelPolygons()
@@ -1547,10 +1583,31 @@ class VisionManager:
             return None
         return np.load(str(min_path)), np.load(str(max_path))
 
+    def _loadNpzBaseline(self, baseline_dir: Path, cam_key: str, mode: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """Envelope written alongside the PNGs by the baseline capture route.
+
+        One compressed archive holds min, max and the per-pixel stddev of
+        the calibration frames, so loading skips decoding the two envelope
+        PNGs plus every calibration-frame PNG just to recompute the stddev.
+        """
+        mode_suffix = f"_{mode}" if mode != "gray" else ""
+        path = baseline_dir / f"{cam_key}_baseline{mode_suffix}.npz"
+        if not path.exists():
+            return None
+        try:
+            with np.load(str(path)) as data:
+                baseline_min = data["min"]
+                baseline_max = data["max"]
+                stddev = data["stddev"] if int(data["frame_count"]) >= 2 else None
+        except (OSError, KeyError, ValueError) as exc:
+            self.gc.logger.warning(f"Classification {cam_key} baseline archive unreadable, using PNGs: {exc}")
+            return None
+        self.gc.logger.info(f"Classification {cam_key} loaded from baseline archive")
+        return self._applyBaselineMargins(baseline_min, baseline_max, stddev)
+
     def _loadPngBaseline(self, baseline_dir: Path, cam_key: str, mode: str) -> tuple[np.ndarray, np.ndarray] | None:
         import glob as globmod
 
-        cfg = self._diff_config
         baseline_min_path, baseline_max_path = self._classificationBaselinePaths(baseline_dir, cam_key, mode)
         read_mode = cv2.IMREAD_COLOR if mode == "lab" else cv2.IMREAD_GRAYSCALE
         baseline_min = cv2.imread(str(baseline_min_path), read_mode)
@@ -1565,8 +1622,21 @@ class VisionManager:
             if cal_frame is not None:
                 calibration_frames.append(cal_frame)
 
-        if len(calibration_frames) >= 2 and cfg.adaptive_std_k > 0:
+        stddev = None
+        if len(calibration_frames) >= 2 and self._diff_config.adaptive_std_k > 0:
             stddev = np.std(np.stack(calibration_frames, axis=0).astype(np.float32), axis=0)
+
+        self.gc.logger.info(f"Classification {cam_key} loaded from PNG fallback ({len(calibration_frames)} cal frames)")
+        return self._applyBaselineMargins(baseline_min, baseline_max, stddev)
+
+    def _applyBaselineMargins(
+        self,
+        baseline_min: np.ndarray,
+        baseline_max: np.ndarray,
+        stddev: np.ndarray | None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        cfg = self._diff_config
+        if stddev is not None and cfg.adaptive_std_k > 0:
             adaptive_margin = np.clip(stddev * cfg.adaptive_std_k, 0, 100).astype(np.uint8)
             baseline_min = np.clip(baseline_min.astype(np.int16) - adaptive_margin.astype(np.int16), 0, 255).astype(np.uint8)
             baseline_max = np.clip(baseline_max.astype(np.int16) + adaptive_margin.astype(np.int16), 0, 255).astype(np.uint8)
@@ -1574,8 +1644,6 @@ class VisionManager:
         if cfg.envelope_margin > 0:
             baseline_min = np.clip(baseline_min.astype(np.int16) - cfg.envelope_margin, 0, 255).astype(np.uint8)
             baseline_max = np.clip(baseline_max.astype(np.int16) + cfg.envelope_margin, 0, 255).astype(np.uint8)
-
-        self.gc.logger.info(f"Classification {cam_key} loaded from PNG fallback ({len(calibration_frames)} cal frames)")
         return baseline_min, baseline_max
 
     def loadClassificationBaseline(self) -> bool:
@@ -1598,7 +1666,9 @@ class VisionManager:
                 baseline_min, baseline_max = result
                 self.gc.logger.info(f"Classification {cam_key} loaded from precomputed npy")
             else:
-                result = self._loadPngBaseline(baseline_dir, cam_key, mode)
+                result = self._loadNpzBaseline(baseline_dir, cam_key, mode)
+                if result is None:
+                    result = self._loadPngBaseline(baseline_dir, cam_key, mode)
                 if result is None:
                     self.gc.logger.warn(f"Classification {cam_key} {mode} baseline not found. Capture a baseline from the Settings → Classification page.")
                     continue
@@ -1665,7 +1735,7 @@ class VisionManager:
         frame = self._classification_top_capture.latest_frame
         if frame is None:
             return None
-        return self._classificationDiffFrame(frame.raw)
+        return self._classificationDiffForFrame("classification_top", frame)
 
     def _getLatestClassificationBottomGray(self) -> np.ndarray | None:
         if self._classification_bottom_capture is None:
@@ -1673,7 +1743,7 @@ class VisionManager:
         frame = self._classification_bottom_capture.latest_frame
         if frame is None:
             return None
-        return self._classificationDiffFrame(frame.raw)
+        return self._classificationDiffForFrame("classification_bottom", frame)
 
     def getClassificationBboxes(self, cam: str) -> List[Tuple[int, int, int, int]]:
         return self.getClassificationDetectionCandidates(cam)
@@ -1863,9 +1933,7 @@ class VisionManager:
                     "found": True,
                     "bbox": list(detection.bbox) if detection.bbox is not None else None,
                     "candidate_bboxes": [list(candidate) for candidate in detection.bboxes],
-                    "candidate_previews": [
-                        self._encodeDebugCrop(frame.raw, candidate) for candidate in detection.bboxes
-                    ],
+                    "candidate_previews": self._encodeDebugCrops(frame.raw, detection.bboxes),
                     "bbox_count": len(detection.bboxes),
                     "score": self._detectionScoreValue(detection),
                     "message": f"{algorithm.replace('_', ' ')} found candidate pieces.",
@@ -1891,9 +1959,7 @@ class VisionManager:
                 "bbox_count": len(bboxes),
                 "bbox": list(bbox) if bbox is not None else None,
                 "candidate_bboxes": [list(candidate) for candidate in bboxes],
-                "candidate_previews": [
-                    self._encodeDebugCrop(frame.raw, candidate) for candidate in bboxes
-                ],
+                "candidate_previews": self._encodeDebugCrops(frame.raw, bboxes),
                 "found": bbox is not None,
                 "message": (
                     "Baseline diff found a candidate piece."
@@ -1908,7 +1974,24 @@ class VisionManager:
         frame = self._feeder_capture.latest_frame
         if frame is None:
             return None
-        return cv2.cvtColor(frame.raw, cv2.COLOR_BGR2GRAY)
+        return self._grayForFrame("feeder", frame)
+
+    def _grayForFrame(self, camera: str, frame: CameraFrame) -> np.ndarray:
+        """Grayscale of ``frame.raw``, converted once per captured frame.
+
+        The returned array is shared between callers and must not be
+        modified in place.
+        """
+        raw = frame.raw
+        if raw.ndim == 2:
+            # Mono8 source — already the plane the heatmaps want.
+            return raw
+        cached = self._gray_frame_cache.get(camera)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        gray = cv2.cvtColor(raw, cv2.COLOR_BGR2GRAY)
+        self._gray_frame_cache[camera] = (frame, gray)
+        return gray
 
     def getLatestFeederLab(self) -> np.ndarray | None:
         frame = self._feeder_capture.latest_frame
@@ -1934,6 +2017,25 @@ class VisionManager:
             return cv2.cvtColor(raw, cv2.COLOR_BGR2LAB)
         return cv2.cvtColor(raw, cv2.COLOR_BGR2GRAY)
 
+    def _classificationDiffForFrame(self, camera: str, frame: CameraFrame) -> np.ndarray:
+        """``_classificationDiffFrame`` of ``frame.raw``, once per captured frame.
+
+        The analysis threads poll faster than the classification cameras
+        deliver, so the same frame would otherwise be re-converted on most
+        iterations. Shares ``_gray_frame_cache`` with ``_grayForFrame``; LAB
+        entries get their own key so a color-mode switch never serves the
+        wrong plane.
+        """
+        if self._classificationColorMode() != "lab":
+            return self._grayForFrame(camera, frame)
+        key = f"{camera}.lab"
+        cached = self._gray_frame_cache.get(key)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        lab = self._classificationDiffFrame(frame.raw)
+        self._gray_frame_cache[key] = (frame, lab)
+        return lab
+
     def _classificationBaselinePaths(self, baseline_dir, cam_key: str, mode: str):
         if mode == "lab":
             return (
@@ -2077,12 +2179,30 @@ class VisionManager:
         key = "classification_channel" if self._usesClassificationChannelSetup() else "carousel"
         polygon = self._loadSavedPolygon(key, w, h)
         if polygon is None or len(polygon) < 3:
-            if self._carousel_polygon is None or len(self._carousel_polygon) < 3:
+            polygon = self._carouselPolygonContour()
+            if polygon is None:
                 return frame.copy(), (0, 0)
-            polygon = np.array(self._carousel_polygon, dtype=np.int32)
         cropped = self._cropFrameToPolygonRegion(frame, polygon)
         return cropped if cropped is not None else (frame.copy(), (0, 0))
 
+    def _carouselPolygonContour(self) -> np.ndarray | None:
+        """``_carousel_polygon`` as an int32 contour, or None if unset.
+
+        The float corner list only changes when polygons are (re)loaded, but
+        the crop/payload paths used to re-cast it on every frame. Cache the
+        cast keyed on the identity of the current list so any reassignment
+        of ``_carousel_polygon`` invalidates it automatically.
+        """
+        corners = self._carousel_polygon
+        if corners is None or len(corners) < 3:
+            return None
+        cached = self._carousel_polygon_contour
+        if cached is not None and cached[0] is corners:
+            return cached[1]
+        contour = np.asarray(corners, dtype=np.float64).astype(np.int32)
+        self._carousel_polygon_contour = (corners, contour)
+        return contour
+
     def _offsetDetectionResult(
         self,
         detection: ClassificationDetectionResult | None,
@@ -2102,21 +2222,29 @@ class VisionManager:
             algorithm=detection.algorithm,
         )
 
-    def _isPointInsideChannelMask(
+    def _pointsInsideChannelMask(
         self,
         channel: PolygonChannel | None,
-        point: tuple[float, float],
-    ) -> bool:
+        points: list[tuple[float, float]],
+    ) -> list[bool]:
+        """Center-in-channel-mask flags for a whole batch of points.
+
+        The channel lookup, mask validation and shape unpacking happen once
+        per batch instead of once per detection; each point then costs two
+        roundings, a bounds check and one mask read.
+        """
         if channel is None:
-            return True
+            return [True] * len(points)
         mask = getattr(channel, "mask", None)
         if not isinstance(mask, np.ndarray) or mask.ndim < 2:
-            return True
-        x = int(round(float(point[0])))
-        y = int(round(float(point[1])))
-        if x < 0 or y < 0 or y >= mask.shape[0] or x >= mask.shape[1]:
-            return False
-        return bool(mask[y, x] > 0)
+            return [True] * len(points)
+        mask_h, mask_w = mask.shape[:2]
+        inside: list[bool] = []
+        for point in points:
+            x = int(round(float(point[0])))
+            y = int(round(float(point[1])))
+            inside.append(0 <= x < mask_w and 0 <= y < mask_h and bool(mask[y, x] > 0))
+        return inside
 
     def _bboxCenterPoint(
         self,
@@ -2217,11 +2345,14 @@ class VisionManager:
         channel = self._channelInfoForRole(role)
         if channel is None:
             return detection
+        on_channel = self._pointsInsideChannelMask(
+            channel, [self._bboxCenterPoint(bbox) for bbox in detection.bboxes]
+        )
         kept = tuple(
             bbox
-            for bbox in detection.bboxes
+            for bbox, inside in zip(detection.bboxes, on_channel)
             if (
-                self._isPointInsideChannelMask(channel, self._bboxCenterPoint(bbox))
+                inside
                 and self._isFeederDetectionBboxPlausibleForRole(role, bbox)
                 and not self._isFeederDetectionBboxIgnoredForRole(role, bbox)
             )
@@ -2254,10 +2385,12 @@ class VisionManager:
         channel = self._channelInfoForRole(role)
         if channel is None:
             return list(tracks)
+        on_channel = self._pointsInsideChannelMask(
+            channel, [getattr(track, "center", (0.0, 0.0)) for track in tracks]
+        )
         kept: list = []
-        for track in tracks:
-            center = getattr(track, "center", (0.0, 0.0))
-            if not self._isPointInsideChannelMask(channel, center):
+        for track, inside in zip(tracks, on_channel):
+            if not inside:
                 continue
             bbox = getattr(track, "bbox", None)
             if (
@@ -2482,9 +2615,7 @@ class VisionManager:
             polygon = self._loadSavedPolygon(key, w, h)
             if polygon is not None and len(polygon) >= 3:
                 return np.asarray(polygon, dtype=np.int32)
-            if self._carousel_polygon is not None and len(self._carousel_polygon) >= 3:
-                return np.asarray(self._carousel_polygon, dtype=np.int32)
-            return None
+            return self._carouselPolygonContour()
 
         return None
 
@@ -2494,7 +2625,30 @@ class VisionManager:
         target_w: int,
         target_h: int,
     ) -> np.ndarray | None:
-        """Read + scale a polygon from ``blob_manager.getChannelPolygons()``."""
+        """Read + scale a polygon from ``blob_manager.getChannelPolygons()``.
+
+        Memoized per (key, w, h): every call used to open the local-state
+        database, parse the stored JSON and rebuild the arc crop polygon
+        for each frame. Cleared in reloadPolygons(). Like ``_scalePolygon``
+        the result is shared: it is marked read-only instead of copied on
+        every read, since the carousel membership test and the crop paths
+        fetch it per tick and only ever read it.
+        """
+        cache_key = (key, int(target_w), int(target_h))
+        if cache_key in self._saved_polygon_cache:
+            return self._saved_polygon_cache[cache_key]
+        cached = self._readSavedPolygon(key, target_w, target_h)
+        if cached is not None:
+            cached.setflags(write=False)
+        self._saved_polygon_cache[cache_key] = cached
+        return cached
+
+    def _readSavedPolygon(
+        self,
+        key: str,
+        target_w: int,
+        target_h: int,
+    ) -> np.ndarray | None:
         try:
             from blob_manager import getChannelPolygons
         except Exception:
@@ -3206,8 +3360,12 @@ class VisionManager:
     _BURST_MAX_EDGE_PX = 640
     _BURST_JPEG_QUALITY = 75
 
-    def _encodeBurstFrame(self, frame: np.ndarray) -> str | None:
-        """Downscale-and-JPEG-encode one raw camera frame for the burst store."""
+    def _encodeBurstFrame(self, frame: np.ndarray) -> bytes | None:
+        """Downscale-and-JPEG-encode one raw camera frame for the burst store.
+
+        Returns the JPEG bytes; base64 happens in ``getBurstFrames`` so the
+        bursts nobody opens never pay for it (or its 4/3 size in the store).
+        """
         if frame is None or not hasattr(frame, "shape") or frame.size == 0:
             return None
         h, w = frame.shape[:2]
@@ -3223,16 +3381,22 @@ class VisionManager:
             except Exception:
                 return None
         try:
-            ok, buf = cv2.imencode(
-                ".jpg",
-                frame,
-                [cv2.IMWRITE_JPEG_QUALITY, self._BURST_JPEG_QUALITY],
-            )
+            # Shared encoder: libjpeg-turbo when installed, cv2 otherwise.
+            data = encode_jpeg(frame, self._BURST_JPEG_QUALITY)
         except Exception:
             return None
-        if not ok:
+        if not data:
             return None
-        return base64.b64encode(buf.tobytes()).decode("ascii")
+        return data
+
+    def _burstEncodePool(self) -> ThreadPoolExecutor:
+        with self._burst_lock:
+            if self._burst_encode_pool is None:
+                self._burst_encode_pool = ThreadPoolExecutor(
+                    max_workers=max(1, min(4, (_os.cpu_count() or 2) // 2)),
+                    thread_name_prefix="burst-encode",
+                )
+            return self._burst_encode_pool
 
     def _burstCaptureThreadsByRole(self) -> list[tuple[str, "CaptureThread | None"]]:
         """Ordered list of (role, capture) pairs to drain for burst capture."""
@@ -3256,19 +3420,23 @@ class VisionManager:
             frames = drain(count) or []
         except Exception:
             return []
+        frames = [cf for cf in frames if getattr(cf, "raw", None) is not None]
+        if not frames:
+            return []
+        # Up to ~60 resize+JPEG encodes per burst. cv2.resize/imencode
+        # dominate the cost and release the GIL, so fan them out instead of
+        # encoding the drained ring buffer one frame at a time on the caller
+        # thread.
+        pool = self._burstEncodePool()
         encoded: list[dict] = []
-        for cf in frames:
-            raw = getattr(cf, "raw", None)
-            if raw is None:
-                continue
-            jpeg_b64 = self._encodeBurstFrame(raw)
-            if not jpeg_b64:
+        for cf, jpeg in zip(frames, pool.map(self._encodeBurstFrame, [cf.raw for cf in frames])):
+            if not jpeg:
                 continue
             encoded.append(
                 {
                     "role": role,
                     "captured_ts": float(getattr(cf, "timestamp", 0.0) or 0.0),
-                    "jpeg_b64": jpeg_b64,
+                    "jpeg": jpeg,
                 }
             )
         return encoded
@@ -3343,7 +3511,19 @@ class VisionManager:
                 self._burst_timers.pop(global_id, None)
 
     def getBurstFrames(self, global_id: int) -> list[dict] | None:
-        return self._burst_store.get(global_id)
+        frames = self._burst_store.get(global_id)
+        if frames is None:
+            return None
+        # The store keeps raw JPEG bytes; the JSON payload wants base64, so
+        # encode here, at the serialization boundary, for the frames asked for.
+        return [
+            {
+                "role": frame["role"],
+                "captured_ts": frame["captured_ts"],
+                "jpeg_b64": encode_base64(frame["jpeg"]),
+            }
+            for frame in frames
+        ]
 
     def _configureFeederHandoffZones(self, polys: Dict[str, np.ndarray]) -> None:
         """Derive exit/entry polygons from the loaded channel polygons.
@@ -4186,7 +4366,7 @@ class VisionManager:
             frame = self._carousel_capture.latest_frame
             if frame is None:
                 return False
-            gray = cv2.cvtColor(frame.raw, cv2.COLOR_BGR2GRAY)
+            gray = self._grayForFrame("carousel", frame)
         else:
             gray = self.getLatestFeederGray()
             if gray is None:
@@ -4221,26 +4401,65 @@ class VisionManager:
         prof = self.gc.profiler
         prof.hit("vision.record_frames.calls")
         with prof.timer("vision.record_frames.total_ms"):
-            if self._camera_layout == "split_feeder":
-                # In split_feeder mode, push carousel camera frames for heatmap
-                if self._carousel_capture:
-                    frame = self._carousel_capture.latest_frame
-                    if frame is not None:
-                        gray = cv2.cvtColor(frame.raw, cv2.COLOR_BGR2GRAY)
-                        self._carousel_heatmap.pushFrame(gray)
-            else:
-                gray = self.getLatestFeederGray()
-                if gray is not None:
-                    self._carousel_heatmap.pushFrame(gray)
-
-            if self._video_recorder:
-                with prof.timer("vision.record_frames.video_recorder_write_ms"):
-                    for cam in self._active_cameras:
-                        frame = self.getFrame(cam.value)
-                        if frame:
-                            self._video_recorder.writeFrame(
-                                cam.value, frame.raw, frame.annotated
-                            )
+            # The heatmap ring is throttled to CAPTURE_INTERVAL_MS; skip the
+            # full-frame gray conversion on ticks whose frame it would drop.
+            push_heatmap = self._carousel_heatmap.wantsFrame()
+            if not self._video_recorder:
+                if push_heatmap:
+                    self._pushCarouselHeatmapFrame()
+                return
+
+            # Recording: the gray conversion + heatmap downscale and each
+            # camera's overlay render + copy into the recorder are independent
+            # and spend their time in GIL-releasing cv2/numpy code, so fan
+            # them out over the record pool and keep the last camera on this
+            # thread. The recorder's per-camera streams have their own queues
+            # and buffer pools, so writes for different cameras don't contend.
+            if self._record_pool is None:
+                self._record_pool = ThreadPoolExecutor(
+                    max_workers=RECORD_FRAMES_WORKERS, thread_name_prefix="record-frames"
+                )
+            pool = self._record_pool
+            futures = []
+            if push_heatmap:
+                futures.append(pool.submit(self._pushCarouselHeatmapFrame))
+            recorder = self._video_recorder
+            get_feed = self._camera_service.get_feed
+            with prof.timer("vision.record_frames.video_recorder_write_ms"):
+                # Straight to each role's feed (what getFrame resolves to) —
+                # one dict lookup per camera per tick.
+                feeds = []
+                for cam in self._active_cameras:
+                    feed = get_feed(cam.value)
+                    if feed is not None:
+                        feeds.append((cam.value, feed))
+                if feeds:
+                    last_role, last_feed = feeds.pop()
+                    for role, feed in feeds:
+                        futures.append(pool.submit(self._recordFeedFrame, recorder, role, feed))
+                    self._recordFeedFrame(recorder, last_role, last_feed)
+                for future in futures:
+                    future.result()
+
+    @staticmethod
+    def _recordFeedFrame(recorder, role: str, feed) -> None:
+        # Rendering the overlays is the expensive half of recording; only do
+        # it when the annotated stream will keep it.
+        frame = feed.get_frame(annotated=recorder.acceptsAnnotated(role))
+        if frame:
+            recorder.writeFrame(role, frame.raw, frame.annotated)
+
+    def _pushCarouselHeatmapFrame(self) -> None:
+        if self._camera_layout == "split_feeder":
+            # In split_feeder mode, push carousel camera frames for heatmap
+            if self._carousel_capture:
+                frame = self._carousel_capture.latest_frame
+                if frame is not None:
+                    self._carousel_heatmap.pushFrame(self._grayForFrame("carousel", frame))
+        else:
+            gray = self.getLatestFeederGray()
+            if gray is not None:
+                self._carousel_heatmap.pushFrame(gray)
 
     @property
     def feeder_frame(self) -> Optional[CameraFrame]:
@@ -4402,14 +4621,14 @@ class VisionManager:
         result = self._buildFeederDetectionPayload(role, frame, force=True)
         candidates = result.get("candidate_bboxes")
         if isinstance(candidates, list):
-            result["candidate_previews"] = [
-                self._encodeDebugCrop(
-                    frame.raw,
-                    cast(Tuple[int, int, int, int], tuple(int(value) for value in candidate[:4])),
-                )
-                for candidate in candidates
-                if isinstance(candidate, list) and len(candidate) >= 4
-            ]
+            result["candidate_previews"] = self._encodeDebugCrops(
+                frame.raw,
+                [
+                    cast(Tuple[int, int, int, int], tuple(int(value) for value in candidate[:4]))
+                    for candidate in candidates
+                    if isinstance(candidate, list) and len(candidate) >= 4
+                ],
+            )
         if include_capture:
             # Capture the sample image from the SAME frame the detection ran on,
             # not a fresh latest_frame. Otherwise the bbox coords belong to a
@@ -4428,8 +4647,8 @@ class VisionManager:
         frame_h, frame_w = frame.raw.shape[:2]
         zone_bbox: Tuple[int, int, int, int] | None = None
         zone_point_count = 0
-        if self._carousel_polygon is not None and len(self._carousel_polygon) >= 3:
-            polygon = np.array(self._carousel_polygon, dtype=np.int32)
+        polygon = self._carouselPolygonContour()
+        if polygon is not None:
             x, y, w, h = cv2.boundingRect(polygon)
             zone_bbox = (int(x), int(y), int(x + w), int(y + h))
             zone_point_count = int(len(polygon))
@@ -4551,14 +4770,14 @@ class VisionManager:
         result = self._buildCarouselDetectionPayload(frame, force=True)
         candidates = result.get("candidate_bboxes")
         if isinstance(candidates, list):
-            result["candidate_previews"] = [
-                self._encodeDebugCrop(
-                    frame.raw,
-                    cast(Tuple[int, int, int, int], tuple(int(value) for value in candidate[:4])),
-                )
-                for candidate in candidates
-                if isinstance(candidate, list) and len(candidate) >= 4
-            ]
+            result["candidate_previews"] = self._encodeDebugCrops(
+                frame.raw,
+                [
+                    cast(Tuple[int, int, int, int], tuple(int(value) for value in candidate[:4]))
+                    for candidate in candidates
+                    if isinstance(candidate, list) and len(candidate) >= 4
+                ],
+            )
         if include_capture:
             # Same frame for both detection and sample image (see
             # debugFeederDetection comment).
@@ -4912,35 +5131,33 @@ class VisionManager:
     def captureFreshClassificationFrames(
         self, timeout_s: float = 1.0
     ) -> Tuple[Optional[CameraFrame], Optional[CameraFrame]]:
-        has_top = self._classification_top_capture is not None
-        has_bottom = self._classification_bottom_capture is not None
+        top_capture = self._classification_top_capture
+        bottom_capture = self._classification_bottom_capture
+        # Wait on each capture thread's new-frame condition rather than
+        # sleep-polling: a fresh frame is picked up as soon as it lands
+        # instead of up to 50 ms later. Both waits share one deadline.
         start_time = time.time()
-        while time.time() - start_time < timeout_s:
-            top = self._classification_top_capture.latest_frame if self._classification_top_capture else None
-            bottom = self._classification_bottom_capture.latest_frame if self._classification_bottom_capture else None
-            top_ready = not has_top or (top and top.timestamp > start_time)
-            bottom_ready = not has_bottom or (bottom and bottom.timestamp > start_time)
-            if top_ready and bottom_ready:
-                return (top, bottom)
-            time.sleep(0.05)
+        deadline = time.monotonic() + timeout_s
+        top = bottom = None
+        if top_capture is not None:
+            top = top_capture.wait_for_frame_after(start_time, deadline - time.monotonic())
+        if bottom_capture is not None:
+            bottom = bottom_capture.wait_for_frame_after(start_time, deadline - time.monotonic())
         return (
-            self._classification_top_capture.latest_frame if self._classification_top_capture else None,
-            self._classification_bottom_capture.latest_frame if self._classification_bottom_capture else None,
+            top if top is not None else (top_capture.latest_frame if top_capture else None),
+            bottom if bottom is not None else (bottom_capture.latest_frame if bottom_capture else None),
         )
 
     def captureFreshClassificationChannelFrame(
         self,
         timeout_s: float = 1.0,
     ) -> Optional[CameraFrame]:
-        if self._carousel_capture is None:
+        capture = self._carousel_capture
+        if capture is None:
             return None
-        start_time = time.time()
-        while time.time() - start_time < timeout_s:
-            frame = self._carousel_capture.latest_frame
-            if frame is not None and frame.timestamp > start_time:
-                return frame
-            time.sleep(0.05)
-        return self._carousel_capture.latest_frame
+        # Same new-frame condition wait as captureFreshClassificationFrames.
+        frame = capture.wait_for_frame_after(time.time(), timeout_s)
+        return frame if frame is not None else capture.latest_frame
 
     def _loadClassificationPolygons(self) -> None:
         saved = getClassificationPolygons()
@@ -4950,32 +5167,74 @@ class VisionManager:
         if res and len(res) == 2:
             self._classification_polygon_resolution = (int(res[0]), int(res[1]))
         polygons = saved.get("polygons", {})
+        self._scaled_polygon_cache.clear()
         for key in ("top", "bottom"):
             pts = polygons.get(key)
             if pts and len(pts) >= 3:
                 self._classification_masks[key] = np.array(pts, dtype=np.int32)
 
     def _scalePolygon(self, polygon: np.ndarray, frame_w: int, frame_h: int) -> np.ndarray:
+        """Classification zone polygon scaled to the frame, as int32.
+
+        Called for every classification detection / crop, but the polygon only
+        changes on reload, so the scaled array is memoized. Like the unscaled
+        pass-through, the result is shared and must not be modified in place.
+        """
         src_w, src_h = self._classification_polygon_resolution
         if src_w == frame_w and src_h == frame_h:
             return polygon
+        cache_key = (id(polygon), frame_w, frame_h)
+        cached = self._scaled_polygon_cache.get(cache_key)
+        if cached is not None and cached[0] is polygon and cached[1] == (src_w, src_h):
+            return cached[2]
         scale_x = frame_w / src_w
         scale_y = frame_h / src_h
         scaled = polygon.astype(np.float64)
         scaled[:, 0] *= scale_x
         scaled[:, 1] *= scale_y
-        return scaled.astype(np.int32)
+        scaled = scaled.astype(np.int32)
+        self._scaled_polygon_cache[cache_key] = (polygon, (src_w, src_h), scaled)
+        return scaled
 
-    def _maskToRegion(self, frame: np.ndarray, key: str) -> np.ndarray:
+    def _maskToRegion(
+        self,
+        frame: np.ndarray,
+        key: str,
+        bbox: Tuple[int, int, int, int] | None = None,
+    ) -> np.ndarray:
+        """White-out everything outside the ``key`` classification polygon.
+
+        With ``bbox`` (x1, y1, x2, y2) only that window is cropped and masked,
+        so the mask and copy are zone-sized instead of full-frame.
+        """
         polygon = self._classification_masks.get(key)
         if polygon is None:
-            return frame
+            if bbox is None:
+                return frame
+            x1, y1, x2, y2 = bbox
+            return frame[y1:y2, x1:x2].copy()
         h, w = frame.shape[:2]
-        polygon = self._scalePolygon(polygon, w, h)
-        white = np.full_like(frame, 255)
-        mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-        cv2.fillPoly(mask, [polygon], 255)
-        result = np.where(mask[:, :, np.newaxis] == 255, frame, white)
+        # The zone polygon only changes on reload, so rasterize it once per
+        # (key, resolution, bbox) instead of a fillPoly on every capture.
+        cache_key = (key, w, h, bbox)
+        cached = self._zone_mask_cache.get(cache_key)
+        if bbox is not None:
+            x1, y1, x2, y2 = bbox
+            frame = frame[y1:y2, x1:x2]
+        if cached is not None and cached[0] is polygon:
+            outside = cached[1]
+        else:
+            scaled = self._scalePolygon(polygon, w, h)
+            if bbox is not None:
+                scaled = scaled - np.array([bbox[0], bbox[1]], dtype=scaled.dtype)
+            mask = np.zeros(frame.shape[:2], dtype=np.uint8)
+            cv2.fillPoly(mask, [scaled], 255)
+            outside = mask == 0
+            self._zone_mask_cache[cache_key] = (polygon, outside)
+        # Blank the outside in place on one copy rather than allocating a
+        # full white frame plus an np.where result (two extra H×W×3 buffers).
+        result = frame.copy()
+        result[outside] = 255
         return result
 
     def _cropToBbox(self, frame: np.ndarray, bbox: Tuple[int, int, int, int],
@@ -4988,6 +5247,21 @@ class VisionManager:
         y2 = max(0, min(y2 + margins[3], h))
         return frame[y1:y2, x1:x2]
 
+    def _encodeDebugCrops(
+        self,
+        frame: np.ndarray,
+        bboxes: List[Tuple[int, int, int, int]],
+    ) -> List[Optional[str]]:
+        """``_encodeDebugCrop`` for every bbox, in order.
+
+        cv2.resize / imencode release the GIL, so several previews are spread
+        over the shared burst-encode pool instead of encoding one after another.
+        """
+        if len(bboxes) <= 1:
+            return [self._encodeDebugCrop(frame, bbox) for bbox in bboxes]
+        pool = self._burstEncodePool()
+        return list(pool.map(lambda bbox: self._encodeDebugCrop(frame, bbox), bboxes))
+
     def _encodeDebugCrop(
         self,
         frame: np.ndarray,
@@ -5019,8 +5293,12 @@ class VisionManager:
             resized_h = max(1, int(round(crop_h * scale)))
             crop = cv2.resize(crop, (resized_w, resized_h), interpolation=cv2.INTER_AREA)
 
-        _, buffer = cv2.imencode(".jpg", crop, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        return base64.b64encode(buffer).decode("utf-8")
+        # Same shared encoder as the live feeds — the crop slice is made
+        # contiguous there, and turbojpeg skips cv2's per-call param parsing.
+        data = encode_jpeg(crop, 80)
+        if not data:
+            return None
+        return encode_base64(data)
 
     def _edgeBiasedMargins(self, bbox: Tuple[int, int, int, int],
                            mask_key: str) -> Tuple[int, int, int, int]:
@@ -5083,7 +5361,14 @@ class VisionManager:
             frame = capture.latest_frame if capture is not None else None
         if frame is None:
             return []
+        return self._classificationChannelCandidatesForFrame(frame, force=force)
 
+    def _classificationChannelCandidatesForFrame(
+        self,
+        frame: CameraFrame,
+        *,
+        force: bool,
+    ) -> List[Tuple[int, int, int, int]]:
         payload = self._buildCarouselDetectionPayload(frame, force=force)
         raw_candidates = payload.get("candidate_bboxes")
         if not isinstance(raw_candidates, list):
@@ -5110,6 +5395,29 @@ class VisionManager:
             return None
         return self._resolveZonePolygon("carousel", "carousel", frame.raw.shape)
 
+    def getClassificationChannelSnapshot(
+        self,
+        *,
+        force: bool = False,
+        frame: CameraFrame | None = None,
+    ) -> Tuple[CameraFrame | None, List[Tuple[int, int, int, int]], "np.ndarray | None"]:
+        """Frame, raw candidates and zone polygon from ONE ``latest_frame`` read.
+
+        Callers that want candidates plus the membership polygon used to make
+        two accessor calls, each re-reading ``latest_frame`` (and the polygon
+        path re-reading the saved channel polygons) — so the polygon could be
+        scaled against a different frame than the bboxes. One snapshot keeps
+        all three consistent and halves the shared-state reads.
+        """
+        if frame is None:
+            capture = self._carousel_capture
+            frame = capture.latest_frame if capture is not None else None
+        if frame is None or frame.raw is None:
+            return None, [], None
+        candidates = self._classificationChannelCandidatesForFrame(frame, force=force)
+        polygon = self._resolveZonePolygon("carousel", "carousel", frame.raw.shape)
+        return frame, candidates, polygon
+
     def getClassificationChannelCombinedBbox(
         self,
         *,
@@ -5232,9 +5540,7 @@ class VisionManager:
         zone_bbox = self._classificationZoneBBoxFromFrame(cam, frame)
         if zone_bbox is None:
             return None
-        x, y, x2, y2 = zone_bbox
-        masked = self._maskToRegion(frame.raw, cam)
-        return masked[y:y2, x:x2].copy()
+        return self._maskToRegion(frame.raw, cam, zone_bbox)
 
     def _classificationSampleFromFrames(
         self,
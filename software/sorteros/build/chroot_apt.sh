@@ -31,6 +31,7 @@ apt-get install "${APT_OPTS[@]}" \
     python3-pip \
     python3-tomli \
     libgl1 libglib2.0-0 \
+    libturbojpeg \
     v4l-utils \
     git-lfs \
     cloud-guest-utils \